@@ -18,24 +18,30 @@ echo Deploying to: %VM_NAME% (%ZONE%)
 echo.
 
 REM Copy all dashboard files
-echo [1/6] Copying main dashboard...
+echo [1/8] Copying main dashboard...
 gcloud compute scp elite_v20_dashboard.py %VM_NAME%:%REMOTE_DIR%/elite_v20_dashboard.py --zone=%ZONE% --project=%PROJECT%
 
-echo [2/6] Copying multi-timeframe dashboard...
+echo [2/8] Copying metric label helper...
+gcloud compute scp labels.py %VM_NAME%:%REMOTE_DIR%/labels.py --zone=%ZONE% --project=%PROJECT%
+
+echo [3/8] Copying multi-timeframe dashboard...
 gcloud compute scp multi_timeframe_dashboard.py %VM_NAME%:%REMOTE_DIR%/multi_timeframe_dashboard.py --zone=%ZONE% --project=%PROJECT%
 
-echo [3/6] Copying multi-timeframe class...
+echo [4/8] Copying multi-timeframe class...
 gcloud compute scp multi_timeframe_dashboard_ORIGINAL.py %VM_NAME%:%REMOTE_DIR%/multi_timeframe_dashboard_ORIGINAL.py --zone=%ZONE% --project=%PROJECT%
 
-echo [4/6] Copying DUDU overlay dashboard...
+echo [5/8] Copying DUDU overlay dashboard...
 gcloud compute scp dudu_overlay_dashboard.py %VM_NAME%:%REMOTE_DIR%/dudu_overlay_dashboard.py --zone=%ZONE% --project=%PROJECT%
 
-echo [5/6] Copying DUDU overlay module...
+echo [6/8] Copying DUDU overlay module...
 gcloud compute scp dudu_overlay.py %VM_NAME%:%REMOTE_DIR%/dudu_overlay.py --zone=%ZONE% --project=%PROJECT%
 
-echo [6/6] Copying Claude chat module...
+echo [7/8] Copying Claude chat module...
 gcloud compute scp claude_chat_module_ELITE_v20.py %VM_NAME%:%REMOTE_DIR%/claude_chat_module_ELITE_v20.py --zone=%ZONE% --project=%PROJECT%
 
+echo [8/8] Copying dashboard assets...
+gcloud compute scp --recurse assets %VM_NAME%:%REMOTE_DIR%/ --zone=%ZONE% --project=%PROJECT%
+
 echo.
 echo ========================================
 echo Files copied successfully!
@@ -1,54 +1,62 @@
-﻿import requests, numpy as np
-from scipy import stats
+﻿import numpy as np
 
-# 1. Fetch Price Data
-data = requests.get('https://api.binance.com/api/v3/klines', params={'symbol':'BTCUSDT','interval':'1d','limit':1000}).json()
-closes = [float(d[1]) for d in data]
+from bt_stats import fast_binom_p
+from data_io import get_kline_column, get_fear
 
-# 2. Fetch Fear Data
-fg = requests.get('https://api.alternative.me/fng/?limit=1000&format=json').json()
-fear_values = [int(x['value']) for x in fg['data']][::-1]
+# The Logic: Consecutive Fear Days
+CONSECUTIVE_DAYS = 5
+FEAR_THRESHOLD = 15
 
-# Align lengths
-min_len = min(len(closes), len(fear_values))
-closes = closes[-min_len:]
-fear_values = fear_values[-min_len:]
 
-results = []
-signals_count = 0
+def scan(closes, fear, thr=FEAR_THRESHOLD, n=CONSECUTIVE_DAYS, fwd=30):
+    """Forward returns on the FIRST day fear has been < thr for n days."""
+    closes = np.asarray(closes, dtype=np.float64)
+    fear = np.asarray(fear)
 
-# 3. The Logic: Consecutive Fear Days
-CONSECUTIVE_DAYS = 5
-FEAR_THRESHOLD = 15
+    # sustained[k] is True when fear[k:k+n] are ALL below threshold,
+    # i.e. the n days before i = k + n.
+    below = (fear < thr).astype(np.int32)
+    sustained = np.convolve(below, np.ones(n, np.int32), 'valid') == n
+
+    # Avoid overlapping signals (buy only once per cluster):
+    # only trigger on the FIRST day it hits n days, and keep i < len - fwd.
+    k_end = max(len(closes) - fwd - n, 1)
+    trigger = sustained[1:k_end] & ~sustained[:k_end-1]
+    i = np.flatnonzero(trigger) + 1 + n
+
+    entries = closes[i]
+    exits = closes[i+fwd]
+    return (exits - entries) / entries
+
+
+if __name__ == '__main__':
+    # 1. Fetch Price Data
+    closes = get_kline_column('open', 1000)
+
+    # 2. Fetch Fear Data
+    fear_values = get_fear(1000)
+
+    # Align lengths
+    min_len = min(len(closes), len(fear_values))
+    closes = closes[-min_len:]
+    fear_values = fear_values[-min_len:]
+
+    # 3. Scan
+    results = scan(closes, fear_values)
+    signals_count = len(results)
+
+    total = len(results)
+    wins = int((results > 0).sum())
+
+    print(f'\n--- RESULTS (Fear < {FEAR_THRESHOLD} for {CONSECUTIVE_DAYS}+ days) ---')
+    print(f'Signals Found: {total}')
+    if total > 0:
+        print(f'Win Rate: {round(wins/total*100, 1)}%')
+        print(f'Avg Return: {round(np.mean(results)*100, 1)}%')
 
-for i in range(CONSECUTIVE_DAYS, len(closes)-30):
-    # Check if past N days were ALL below threshold
-    is_sustained_fear = all(f < FEAR_THRESHOLD for f in fear_values[i-CONSECUTIVE_DAYS:i])
-    
-    if is_sustained_fear:
-        # Avoid overlapping signals (buy only once per cluster)
-        # Check if yesterday was ALSO a signal (if so, we are already in)
-        prev_sustained = all(f < FEAR_THRESHOLD for f in fear_values[i-CONSECUTIVE_DAYS-1:i-1])
-        
-        if not prev_sustained: # Only trigger on the FIRST day it hits 5 days
-            entry = closes[i]
-            exit_price = closes[i+30]
-            ret = (exit_price - entry) / entry
-            results.append(ret)
-            signals_count += 1
-
-total = len(results)
-wins = sum(1 for r in results if r > 0)
-
-print(f'\n--- RESULTS (Fear < {FEAR_THRESHOLD} for {CONSECUTIVE_DAYS}+ days) ---')
-print(f'Signals Found: {total}')
-if total > 0:
-    print(f'Win Rate: {round(wins/total*100, 1)}%')
-    print(f'Avg Return: {round(np.mean(results)*100, 1)}%')
-    
-    # Calculate p-value
-    pval = stats.binomtest(wins, total, p=0.55).pvalue # Assuming 55% base win rate for BTC
-    print(f'p-value: {round(pval, 4)}')
-    print(f'Conclusion: {"EDGE FOUND" if pval < 0.05 else "NO EDGE / NOT ENOUGH DATA"}')
-else:
-    print('No signals matched criteria')
+        # Calculate p-value
+        pval = fast_binom_p(wins, total, p=0.55) # Assuming 55% base win rate for BTC
+        print(f'p-value: {round(pval, 4)}')
+        print(f'Conclusion: {"EDGE FOUND" if pval < 0.05 else "NO EDGE / NOT ENOUGH DATA"}')
+    else:
+        print('No signals matched criteria')
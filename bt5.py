@@ -1,34 +1,52 @@
-﻿import requests, numpy as np
-from scipy import stats
-
-data = requests.get('https://api.binance.com/api/v3/klines', params={'symbol':'BTCUSDT','interval':'1d','limit':1000}).json()
-closes = [float(d[4]) for d in data]
-volumes = [float(d[5]) for d in data]
-
-fg = requests.get('https://api.alternative.me/fng/?limit=1000&format=json').json()
-fear_values = [int(x['value']) for x in fg['data']][::-1]
-
-min_len = min(len(closes)-30, len(fear_values))
-results = []
-
-for i in range(20, min_len-30):
-    fear_ok = fear_values[i] < 25
-    ma20 = np.mean(closes[i-20:i])
-    price_below_ma = closes[i] < ma20 * 0.92
-    vol_spike = volumes[i] > np.mean(volumes[i-10:i]) * 1.5
-
-    if fear_ok and price_below_ma and vol_spike:
-        ret = (closes[i+30] - closes[i]) / closes[i]
-        results.append(ret)
-
-total = len(results)
-if total > 0:
-    wins = sum(1 for r in results if r > 0)
-    pval = stats.binomtest(wins, total, p=0.5).pvalue
-    print('Signals:', total)
-    print('Win Rate:', round(wins/total*100,1), '%')
-    print('Avg Return:', round(np.mean(results)*100,1), '%')
-    print('p-value:', round(pval,4))
-    print('Edge:', 'REAL p<0.05' if pval < 0.05 else 'RANDOM')
-else:
-    print('No signals')
+﻿import numpy as np
+import numba
+
+from bt_stats import fast_binom_p
+from data_io import get_closes, get_kline_column, get_fear
+
+
+@numba.jit(nopython=True, cache=True)
+def _numba_signals(closes, volumes, fear, fear_thr, fwd, end):
+    # All three conditions fused in one pass; MA20 / VMA10 of the days
+    # *before* i are kept as O(1) rolling sums.
+    out = np.empty(max(end - 20, 0), np.float64)
+    k = 0
+    ma_sum = closes[0:20].sum()
+    vol_sum = volumes[10:20].sum()
+    for i in range(20, end):
+        if fear[i] < fear_thr and closes[i] < ma_sum / 20 * 0.92 and volumes[i] > vol_sum / 10 * 1.5:
+            out[k] = (closes[i+fwd] - closes[i]) / closes[i]
+            k += 1
+        ma_sum += closes[i] - closes[i-20]
+        vol_sum += volumes[i] - volumes[i-10]
+    return out[:k]
+
+
+def scan(closes, volumes, fear, fear_thr=25, fwd=30):
+    """Forward returns when fear < fear_thr, price is 8% under MA20 and volume spikes."""
+    min_len = min(len(closes)-fwd, len(fear))
+    closes = np.asarray(closes, dtype=np.float64)
+    volumes = np.asarray(volumes, dtype=np.float64)
+    fear = np.asarray(fear[:min_len], dtype=np.int32)
+    return _numba_signals(closes, volumes, fear, fear_thr, fwd, min_len-fwd)
+
+
+if __name__ == '__main__':
+    closes = get_closes(1000)
+    volumes = get_kline_column('volume', 1000)
+
+    fear_values = get_fear(1000)
+
+    results = scan(closes, volumes, fear_values)
+
+    total = len(results)
+    if total > 0:
+        wins = int((results > 0).sum())
+        pval = fast_binom_p(wins, total, p=0.5)
+        print('Signals:', total)
+        print('Win Rate:', round(wins/total*100,1), '%')
+        print('Avg Return:', round(np.mean(results)*100,1), '%')
+        print('p-value:', round(pval,4))
+        print('Edge:', 'REAL p<0.05' if pval < 0.05 else 'RANDOM')
+    else:
+        print('No signals')
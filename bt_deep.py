@@ -1,55 +1,65 @@
-﻿import requests, pandas as pd, numpy as np
-from scipy import stats
+﻿import numpy as np
 from datetime import datetime
+import numba
 
-print('Fetching deep history...')
-start = int(datetime(2017, 8, 1).timestamp() * 1000)
-end = int(datetime.now().timestamp() * 1000)
-klines = []
-while start < end:
-    d = requests.get('https://api.binance.com/api/v3/klines',
-        params={'symbol':'BTCUSDT','interval':'1d','startTime':start,'limit':1000}).json()
-    if not d: break
-    klines.extend(d)
-    start = int(d[-1][6]) + 1
-    print(f'  Got {len(klines)} candles...', end='\r')
-
-df = pd.DataFrame(klines)
-closes = df[4].astype(float).values
-dates = pd.to_datetime(df[0].astype(int), unit='ms').dt.date.values
-print(f'\nCandles: {len(df)} | {dates[0]} to {dates[-1]}')
-
-fg = requests.get('https://api.alternative.me/fng/?limit=0&format=json').json()
-fg_dict = {datetime.fromtimestamp(int(x['timestamp'])).date(): int(x['value']) for x in fg['data']}
-print(f'Fear days: {len(fg_dict)}')
-
-fear_aligned, idx_aligned = [], []
-for i, d in enumerate(dates):
-    if d in fg_dict:
-        fear_aligned.append(fg_dict[d])
-        idx_aligned.append(i)
-
-results, details = [], []
-for i in range(5, len(idx_aligned)-30):
-    w = fear_aligned[i-5:i]
-    pw = fear_aligned[i-6:i-1]
-    if all(f < 15 for f in w) and not all(f < 15 for f in pw):
-        idx = idx_aligned[i]
-        ret = (closes[min(idx+30, len(closes)-1)] - closes[idx]) / closes[idx]
-        results.append(ret)
-        details.append((dates[idx], closes[idx], ret))
-
-total = len(results)
-print(f'\n=== DEEP BACKTEST: Fear<15, 5 days consecutive ===')
-print(f'Signals: {total}')
-if total > 0:
-    wins = sum(1 for r in results if r > 0)
-    pval = stats.binomtest(wins, total, p=0.55, alternative='greater').pvalue
-    print(f'Win Rate: {wins/total:.1%}')
-    print(f'Avg Return: {np.mean(results):+.1%}')
-    print(f'p-value: {pval:.4f}')
-    print(f'Edge: {"REAL" if pval < 0.05 else "RANDOM"}')
-    for d, p, r in details:
-        print(f'  {d} | {p:,.0f} | {r:+.1%} {"✅" if r > 0 else "❌"}')
-else:
-    print('No signals in full history.')
+from bt_stats import fast_binom_p
+from data_io import get_klines_history, get_fear_greed
+
+
+@numba.jit(nopython=True, cache=True)
+def _numba_scan_signals(fear, idx, closes, thr, n, fwd):
+    # run/prev = consecutive fear<thr days ending at i-1 / i-2
+    out_idx = np.empty(len(fear), np.int64)
+    out_ret = np.empty(len(fear), np.float64)
+    k = 0
+    run = 0
+    prev = 0
+    for i in range(1, len(fear) - fwd):
+        prev = run
+        run = run + 1 if fear[i-1] < thr else 0
+        if i > n and run >= n and prev < n:
+            j = idx[i]
+            exit_price = closes[min(j + fwd, len(closes) - 1)]
+            out_idx[k] = j
+            out_ret[k] = (exit_price - closes[j]) / closes[j]
+            k += 1
+    return out_idx[:k], out_ret[:k]
+
+
+if __name__ == '__main__':
+    print('Fetching deep history...')
+    start = int(datetime(2017, 8, 1).timestamp() * 1000)
+    df = get_klines_history('BTCUSDT', '1d', start)
+    closes = df['close'].to_numpy(dtype=np.float64)
+    ts_ms = df['open_time'].to_numpy(dtype=np.int64)
+    days = ts_ms // 86_400_000  # UTC day number
+    dates = days.astype('datetime64[D]')
+    print(f'\nCandles: {len(closes)} | {dates[0]} to {dates[-1]}')
+
+    fg = get_fear_greed(0)
+    fg_dict = dict(zip((fg['timestamp'].to_numpy() // 86_400).tolist(), fg['value'].tolist()))
+    print(f'Fear days: {len(fg_dict)}')
+
+    day_list = days.tolist()
+    idx_aligned = [i for i, d in enumerate(day_list) if d in fg_dict]
+    fear_aligned = [fg_dict[day_list[i]] for i in idx_aligned]
+
+    sig_idx, results = _numba_scan_signals(np.asarray(fear_aligned, dtype=np.int32),
+                                           np.asarray(idx_aligned, dtype=np.int64),
+                                           closes, 15, 5, 30)
+    details = [(dates[j], closes[j], r) for j, r in zip(sig_idx, results)]
+
+    total = len(results)
+    print(f'\n=== DEEP BACKTEST: Fear<15, 5 days consecutive ===')
+    print(f'Signals: {total}')
+    if total > 0:
+        wins = int((results > 0).sum())
+        pval = fast_binom_p(wins, total, p=0.55, alternative='greater')
+        print(f'Win Rate: {wins/total:.1%}')
+        print(f'Avg Return: {np.mean(results):+.1%}')
+        print(f'p-value: {pval:.4f}')
+        print(f'Edge: {"REAL" if pval < 0.05 else "RANDOM"}')
+        for d, p, r in details:
+            print(f'  {d} | {p:,.0f} | {r:+.1%} {"✅" if r > 0 else "❌"}')
+    else:
+        print('No signals in full history.')
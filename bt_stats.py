@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📐 BACKTEST STATISTICS
+Win-rate significance for the bt* scripts and parameter sweeps
+"""
+
+import math
+from functools import lru_cache
+
+# Below this many signals the exact binomial test is used
+EXACT_MAX_N = 50
+
+
+@lru_cache(maxsize=4096)
+def fast_binom_p(wins: int, total: int, p: float = 0.5, alternative: str = 'two-sided') -> float:
+    """
+    p-value of `wins` successes out of `total` against win rate `p`
+
+    Exact scipy binomtest for small samples, Normal approximation
+    (O(1), math.erfc only) once total > EXACT_MAX_N.
+    """
+    if total <= EXACT_MAX_N:
+        from scipy import stats
+        return stats.binomtest(wins, total, p=p, alternative=alternative).pvalue
+
+    z = (wins - total * p) / math.sqrt(total * p * (1 - p))
+    if alternative == 'greater':
+        return 0.5 * math.erfc(z / math.sqrt(2))
+    if alternative == 'less':
+        return 0.5 * math.erfc(-z / math.sqrt(2))
+    return math.erfc(abs(z) / math.sqrt(2))
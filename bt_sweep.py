@@ -0,0 +1,58 @@
+# Parameter sweep over the bt* signals - every combination runs on its own core
+import numpy as np
+from joblib import Parallel, delayed
+
+import bt2, bt5
+from bt_deep import _numba_scan_signals
+from bt_stats import fast_binom_p
+from data_io import get_closes, get_kline_column, get_fear
+
+FEAR_THRESHOLDS = range(10, 31, 5)
+CONSECUTIVE_DAYS = range(3, 11)
+FWD_DAYS = 30
+
+
+def summarize(results, p=0.5):
+    total = len(results)
+    if total == 0:
+        return 0, 0, 0.0, 1.0
+    wins = int((results > 0).sum())
+    return wins, total, float(results.mean()), fast_binom_p(wins, total, p=p)
+
+
+def scan_consecutive(fear, closes, thr, n):
+    # bt3 / bt_deep logic; idx is contiguous since the series are pre-aligned
+    idx = np.arange(len(fear), dtype=np.int64)
+    _, results = _numba_scan_signals(fear, idx, closes, thr, n, FWD_DAYS)
+    return ('consecutive', thr, n) + summarize(results, p=0.55)
+
+
+def scan_fear(fear, closes, thr):
+    return ('fear', thr, 1) + summarize(bt2.scan(closes, fear, thr, FWD_DAYS))
+
+
+def scan_volume(fear, closes, volumes, thr):
+    return ('fear+ma+vol', thr, 1) + summarize(bt5.scan(closes, volumes, fear, thr, FWD_DAYS))
+
+
+if __name__ == '__main__':
+    closes = get_closes(1000)
+    volumes = get_kline_column('volume', 1000)
+    fear = get_fear(1000)
+
+    # Align lengths (most recent days)
+    min_len = min(len(closes), len(fear))
+    closes, volumes, fear = closes[-min_len:], volumes[-min_len:], fear[-min_len:]
+
+    jobs = [delayed(scan_consecutive)(fear, closes, thr, n)
+            for thr in FEAR_THRESHOLDS for n in CONSECUTIVE_DAYS]
+    jobs += [delayed(scan_fear)(fear, closes, thr) for thr in FEAR_THRESHOLDS]
+    jobs += [delayed(scan_volume)(fear, closes, volumes, thr) for thr in FEAR_THRESHOLDS]
+
+    # Inputs are read-only: workers share them via memmap instead of a copy per task
+    rows = Parallel(n_jobs=-1, mmap_mode='r')(jobs)
+
+    print(f'{"Signal":<12} {"Fear<":>5} {"Days":>4} {"Signals":>7} {"Win%":>6} {"Avg%":>7} {"p-value":>8}')
+    for name, thr, n, wins, total, mean_ret, pval in rows:
+        win_rate = wins/total*100 if total else 0.0
+        print(f'{name:<12} {thr:>5} {n:>4} {total:>7} {win_rate:>6.1f} {mean_ret*100:>+7.1f} {pval:>8.4f}')
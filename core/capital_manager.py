@@ -4,9 +4,199 @@ Dynamic allocation between DCA (60%) and Tactical (40%) strategies
 Based on: QC-AI_LITE_Biological_Quant_Architecture.pdf
 """
 
+import json
+import math
+import time
+from dataclasses import dataclass, asdict
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+try:
+    import numba
+    _njit = numba.jit(nopython=True, cache=True)
+    _njit_fastmath = numba.jit(nopython=True, fastmath=True, cache=True)
+except ImportError:
+    def _njit(fn):
+        """numba not installed: the kernel runs as plain Python"""
+        return fn
+    _njit_fastmath = _njit
+
+
+# Enum codes for the columnar transaction log
+TX_STRATEGIES = ['DCA', 'TACTICAL']
+TX_ACTIONS = ['BUY', 'SELL_T1', 'SELL_T2', 'SELL_STOP']
+_STRATEGY_CODE = {name: code for code, name in enumerate(TX_STRATEGIES)}
+_ACTION_CODE = {name: code for code, name in enumerate(TX_ACTIONS)}
+
+
+def _exit_action(exit_type: str) -> str:
+    """TX_ACTIONS name for a Tactical exit type; ValueError if there is none"""
+    action = f'SELL_{exit_type}'
+    if action not in _ACTION_CODE:
+        raise ValueError(f"Unknown exit_type {exit_type!r}; expected one of "
+                         f"{[a[5:] for a in TX_ACTIONS if a.startswith('SELL_')]}")
+    return action
+
+
+# Trade codes accepted by CapitalManager.replay()
+REPLAY_ACTIONS = ['DCA_BUY', 'TACTICAL_BUY', 'SELL_T1', 'SELL_T2', 'SELL_STOP']
+
+# Per-trade audit fields are float32 (~7 significant digits is plenty for a
+# price or a fill size); running state snapshots stay float64 since the
+# accumulators they mirror compound rounding error.
+TX_COLUMNS = {
+    'timestamp': np.int64,      # ns since epoch
+    'strategy': np.int8,        # index into TX_STRATEGIES
+    'action': np.int8,          # index into TX_ACTIONS
+    'btc_amount': np.float32,
+    'price': np.float32,
+    'usd_amount': np.float32,
+    'realized_pnl': np.float32,  # NaN for buys
+    'position_btc': np.float64,
+    'avg_entry': np.float64
+}
+
+# get_portfolio_status() layout: (section, key) per slot of the status buffer
+STATUS_SECTIONS = ['capital', 'dca', 'tactical', 'risk']
+STATUS_FIELDS = [
+    ('capital', 'base'), ('capital', 'current'), ('capital', 'total_value'),
+    ('capital', 'pnl_realized'), ('capital', 'pnl_unrealized'), ('capital', 'pnl_total'),
+    ('capital', 'return_pct'),
+    ('dca', 'allocation_pct'), ('dca', 'capital_allocated'), ('dca', 'capital_used'),
+    ('dca', 'capital_available'), ('dca', 'btc_held'), ('dca', 'avg_entry'),
+    ('dca', 'current_price'), ('dca', 'unrealized_pnl'), ('dca', 'unrealized_pct'),
+    ('tactical', 'allocation_pct'), ('tactical', 'capital_allocated'), ('tactical', 'capital_used'),
+    ('tactical', 'capital_available'), ('tactical', 'btc_held'), ('tactical', 'avg_entry'),
+    ('tactical', 'current_price'), ('tactical', 'unrealized_pnl'), ('tactical', 'unrealized_pct'),
+    ('tactical', 'realized_pnl'),
+    ('risk', 'max_risk_per_trade_usd'), ('risk', 'max_risk_per_trade_pct')
+]
+
+# Cumulative P&L and capital are derived on read (get_pnl_history / get_pnl_series)
+PNL_COLUMNS = {
+    'timestamp': np.int64,
+    'realized_pnl': np.float64
+}
+
+
+@dataclass(slots=True)
+class DCAPosition:
+    """Open DCA position (slotted: attribute reads skip the per-instance dict)"""
+    capital: float = 0.0
+    btc_held: float = 0.0
+    avg_entry: float = 0.0
+    unrealized_pnl: float = 0.0
+
+
+@dataclass(slots=True)
+class TacticalPosition(DCAPosition):
+    """Open Tactical position plus its realized P&L"""
+    realized_pnl: float = 0.0
+
+
+@_njit_fastmath
+def _numba_update_avg(held, avg, amt, price):
+    """Position after a buy: (btc_held, weighted avg_entry)"""
+    total = held + amt
+    if total > 0:
+        return total, (avg * held + price * amt) / total
+    return total, 0.0
+
+
+@_njit_fastmath
+def _numba_update_avg_batch(held, avg, amts, prices):
+    """Final (btc_held, avg_entry) after a sequence of buys"""
+    for i in range(amts.shape[0]):
+        held, avg = _numba_update_avg(held, avg, amts[i], prices[i])
+    return held, avg
+
+
+@_njit
+def _numba_replay(codes, btcs, prices, dca_held, dca_avg, tac_held, tac_avg):
+    """
+    Run a trade sequence (codes per REPLAY_ACTIONS) through both positions.
+    
+    Returns per-trade arrays: btc_amount (sells clamped to the held BTC),
+    realized_pnl (NaN for buys), position_btc and avg_entry after the trade.
+    """
+    n = codes.shape[0]
+    amounts = np.empty(n)
+    realized = np.full(n, np.nan)
+    position_btc = np.empty(n)
+    avg_entry = np.empty(n)
+    
+    for i in range(n):
+        amt = btcs[i]
+        if codes[i] == 0:
+            dca_held, dca_avg = _numba_update_avg(dca_held, dca_avg, amt, prices[i])
+            position_btc[i] = dca_held
+            avg_entry[i] = dca_avg
+        else:
+            if codes[i] == 1:
+                tac_held, tac_avg = _numba_update_avg(tac_held, tac_avg, amt, prices[i])
+            else:
+                if amt > tac_held:
+                    amt = tac_held
+                realized[i] = prices[i] * amt - tac_avg * amt
+                tac_held -= amt
+            position_btc[i] = tac_held
+            avg_entry[i] = tac_avg
+        amounts[i] = amt
+    
+    return amounts, realized, position_btc, avg_entry
+
+
+class _ColumnLog:
+    """
+    Append-only struct-of-arrays log.
+    
+    One typed NumPy array per field, grown geometrically so appends are
+    amortized O(1) and reading a column back is a slice, not a row walk.
+    """
+    
+    def __init__(self, dtypes: Dict[str, type], capacity: int = 64):
+        self.n = 0
+        self.capacity = capacity
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        """View of the filled part of one column"""
+        return self.columns[name][:self.n]
+    
+    def _reserve(self, extra: int) -> None:
+        needed = self.n + extra
+        if needed <= self.capacity:
+            return
+        
+        capacity = max(needed, self.capacity * 2)
+        for name, arr in self.columns.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self.n] = arr[:self.n]
+            self.columns[name] = grown
+        self.capacity = capacity
+    
+    def append(self, **values) -> None:
+        """Write one row; every column must be given"""
+        self._reserve(1)
+        for name, value in values.items():
+            self.columns[name][self.n] = value
+        self.n += 1
+    
+    def extend(self, **arrays) -> None:
+        """Write a block of rows; every column must be given, all the same length"""
+        k = len(next(iter(arrays.values())))
+        self._reserve(k)
+        for name, values in arrays.items():
+            self.columns[name][self.n:self.n + k] = values
+        self.n += k
+    
+    def to_records(self) -> List[Dict]:
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*(self[name].tolist() for name in names))]
 
 
 class CapitalManager:
@@ -30,30 +220,85 @@ class CapitalManager:
         self.base_capital = base_capital
         self.current_capital = base_capital
         self.pnl = 0.0
-        self.pnl_history = []
+        self._inv_base = 1.0 / base_capital if base_capital > 0 else 0.0
+        
+        # Log clock: wall time sampled once, then advanced by the (vDSO) monotonic clock
+        self._base_wall_ns = time.time_ns()
+        self._base_mono_ns = time.monotonic_ns()
+        self._pnl_log = _ColumnLog(PNL_COLUMNS)
         
-        # Allocation ratios (adjustable)
-        self.dca_allocation_pct = 0.60  # 60% to DCA
-        self.tactical_allocation_pct = 0.40  # 40% to Tactical
+        # Allocation ratios (adjustable via set_allocations)
+        self.set_allocations(0.60, 0.40)  # 60% to DCA, 40% to Tactical
         
         # Track positions
-        self.dca_position = {
-            'capital': 0.0,
-            'btc_held': 0.0,
-            'avg_entry': 0.0,
-            'unrealized_pnl': 0.0
-        }
+        self.dca_position = DCAPosition()
+        self.tactical_position = TacticalPosition()
         
-        self.tactical_position = {
-            'capital': 0.0,
-            'btc_held': 0.0,
-            'avg_entry': 0.0,
-            'unrealized_pnl': 0.0,
-            'realized_pnl': 0.0
-        }
+        # Transaction log (columnar, see TX_COLUMNS)
+        self._tx_log = _ColumnLog(TX_COLUMNS)
+        
+        # Reused by get_portfolio_status()
+        self._status_buf = np.empty(len(STATUS_FIELDS), dtype=np.float64)
+        
+        # Memoized get_allocations()/update_unrealized_pnl()/get_portfolio_status();
+        # every mutator sets the dirty flags
+        self._alloc_dirty = True
+        self._unreal_dirty = True
+        self._status_dirty = True
+        self._last_price = None
+        self._status_price = None
+        self._alloc_cache = None
+        self._unreal_cache = None
+        self._status_cache = None
+    
+    def set_allocations(self, dca_pct: float, tactical_pct: float) -> None:
+        """
+        Set the DCA / Tactical split.
         
-        # Transaction log
-        self.transactions = []
+        Args:
+            dca_pct: Fraction of capital for DCA (e.g. 0.60)
+            tactical_pct: Fraction of capital for Tactical (e.g. 0.40)
+        """
+        self._mark_dirty()
+        self.dca_allocation_pct = dca_pct
+        self.tactical_allocation_pct = tactical_pct
+        
+        # Percent forms reported by get_portfolio_status()
+        self._dca_alloc_pct_100 = dca_pct * 100
+        self._tac_alloc_pct_100 = tactical_pct * 100
+    
+    def _mark_dirty(self) -> None:
+        self._alloc_dirty = True
+        self._unreal_dirty = True
+        self._status_dirty = True
+    
+    def _now_ns(self) -> int:
+        """Epoch ns for log entries; converted to datetimes only when a DataFrame is built"""
+        return time.monotonic_ns() - self._base_mono_ns + self._base_wall_ns
+    
+    def _tx_append(self, strategy: str, action: str, btc_amount: float, price: float,
+                   usd_amount: float, realized_pnl: float, position: DCAPosition) -> None:
+        self._tx_log.append(
+            timestamp=self._now_ns(),
+            strategy=_STRATEGY_CODE[strategy],
+            action=_ACTION_CODE[action],
+            btc_amount=btc_amount,
+            price=price,
+            usd_amount=usd_amount,
+            realized_pnl=realized_pnl,
+            position_btc=position.btc_held,
+            avg_entry=position.avg_entry
+        )
+    
+    @property
+    def transactions(self) -> List[Dict]:
+        """Transaction log as list of row dicts (use get_transaction_history() for analysis)"""
+        return self.get_transaction_history().to_dict('records')
+    
+    @property
+    def pnl_history(self) -> List[Dict]:
+        """Realized P&L log as list of row dicts"""
+        return self.get_pnl_history().to_dict('records')
     
     def update_from_pnl(self, realized_pnl: float) -> None:
         """
@@ -62,36 +307,41 @@ class CapitalManager:
         Args:
             realized_pnl: Realized P&L in USD (positive = profit, negative = loss)
         """
+        self._mark_dirty()
         self.pnl += realized_pnl
         self.current_capital = self.base_capital + self.pnl
         
         # Log P&L
-        self.pnl_history.append({
-            'timestamp': datetime.now(),
-            'realized_pnl': realized_pnl,
-            'cumulative_pnl': self.pnl,
-            'capital': self.current_capital
-        })
+        self._pnl_log.append(
+            timestamp=self._now_ns(),
+            realized_pnl=realized_pnl
+        )
     
     def get_allocations(self) -> Dict[str, float]:
         """
         Calculate current capital allocations.
         
         Returns:
-            Dict with DCA, Tactical, and Total capital
+            Dict with DCA, Tactical, and Total capital (cached until state changes;
+            treat as read-only)
         """
+        if not self._alloc_dirty:
+            return self._alloc_cache
+        
         dca_capital = self.current_capital * self.dca_allocation_pct
         tactical_capital = self.current_capital * self.tactical_allocation_pct
         
-        return {
+        self._alloc_cache = {
             'total': self.current_capital,
             'dca': dca_capital,
-            'dca_available': dca_capital - self.dca_position['capital'],
+            'dca_available': dca_capital - self.dca_position.capital,
             'tactical': tactical_capital,
-            'tactical_available': tactical_capital - self.tactical_position['capital'],
+            'tactical_available': tactical_capital - self.tactical_position.capital,
             'pnl': self.pnl,
-            'pnl_pct': (self.pnl / self.base_capital) * 100 if self.base_capital > 0 else 0
+            'pnl_pct': self.pnl * self._inv_base * 100
         }
+        self._alloc_dirty = False
+        return self._alloc_cache
     
     def record_dca_entry(self, btc_amount: float, entry_price: float, usd_spent: float) -> None:
         """
@@ -102,25 +352,15 @@ class CapitalManager:
             entry_price: Entry price per BTC
             usd_spent: USD capital used
         """
-        # Update position
-        total_btc = self.dca_position['btc_held'] + btc_amount
-        total_cost = (self.dca_position['avg_entry'] * self.dca_position['btc_held']) + (entry_price * btc_amount)
+        self._mark_dirty()
         
-        self.dca_position['btc_held'] = total_btc
-        self.dca_position['avg_entry'] = total_cost / total_btc if total_btc > 0 else 0
-        self.dca_position['capital'] += usd_spent
+        # Update position
+        pos = self.dca_position
+        pos.btc_held, pos.avg_entry = _numba_update_avg(pos.btc_held, pos.avg_entry, btc_amount, entry_price)
+        self.dca_position.capital += usd_spent
         
         # Log transaction
-        self.transactions.append({
-            'timestamp': datetime.now(),
-            'strategy': 'DCA',
-            'action': 'BUY',
-            'btc_amount': btc_amount,
-            'price': entry_price,
-            'usd_amount': usd_spent,
-            'position_btc': self.dca_position['btc_held'],
-            'avg_entry': self.dca_position['avg_entry']
-        })
+        self._tx_append('DCA', 'BUY', btc_amount, entry_price, usd_spent, np.nan, self.dca_position)
     
     def record_tactical_entry(self, btc_amount: float, entry_price: float, usd_spent: float) -> None:
         """
@@ -131,25 +371,15 @@ class CapitalManager:
             entry_price: Entry price per BTC
             usd_spent: USD capital used
         """
-        # Update position
-        total_btc = self.tactical_position['btc_held'] + btc_amount
-        total_cost = (self.tactical_position['avg_entry'] * self.tactical_position['btc_held']) + (entry_price * btc_amount)
+        self._mark_dirty()
         
-        self.tactical_position['btc_held'] = total_btc
-        self.tactical_position['avg_entry'] = total_cost / total_btc if total_btc > 0 else 0
-        self.tactical_position['capital'] += usd_spent
+        # Update position
+        pos = self.tactical_position
+        pos.btc_held, pos.avg_entry = _numba_update_avg(pos.btc_held, pos.avg_entry, btc_amount, entry_price)
+        self.tactical_position.capital += usd_spent
         
         # Log transaction
-        self.transactions.append({
-            'timestamp': datetime.now(),
-            'strategy': 'TACTICAL',
-            'action': 'BUY',
-            'btc_amount': btc_amount,
-            'price': entry_price,
-            'usd_amount': usd_spent,
-            'position_btc': self.tactical_position['btc_held'],
-            'avg_entry': self.tactical_position['avg_entry']
-        })
+        self._tx_append('TACTICAL', 'BUY', btc_amount, entry_price, usd_spent, np.nan, self.tactical_position)
     
     def record_tactical_exit(self, btc_amount: float, exit_price: float, exit_type: str = 'T1') -> float:
         """
@@ -158,42 +388,172 @@ class CapitalManager:
         Args:
             btc_amount: BTC sold
             exit_price: Exit price per BTC
-            exit_type: Type of exit (T1, T2, STOP)
+            exit_type: Type of exit (T1, T2, STOP); see TX_ACTIONS
             
         Returns:
             Realized P&L from this exit
         """
-        if btc_amount > self.tactical_position['btc_held']:
-            btc_amount = self.tactical_position['btc_held']
+        action = _exit_action(exit_type)
+        
+        self._mark_dirty()
+        
+        if btc_amount > self.tactical_position.btc_held:
+            btc_amount = self.tactical_position.btc_held
         
         # Calculate P&L
-        cost_basis = self.tactical_position['avg_entry'] * btc_amount
+        cost_basis = self.tactical_position.avg_entry * btc_amount
         proceeds = exit_price * btc_amount
         realized_pnl = proceeds - cost_basis
         
         # Update position
-        self.tactical_position['btc_held'] -= btc_amount
-        self.tactical_position['capital'] -= cost_basis
-        self.tactical_position['realized_pnl'] += realized_pnl
+        self.tactical_position.btc_held -= btc_amount
+        self.tactical_position.capital -= cost_basis
+        self.tactical_position.realized_pnl += realized_pnl
         
         # Update total capital
         self.update_from_pnl(realized_pnl)
         
         # Log transaction
-        self.transactions.append({
-            'timestamp': datetime.now(),
-            'strategy': 'TACTICAL',
-            'action': f'SELL_{exit_type}',
-            'btc_amount': btc_amount,
-            'price': exit_price,
-            'usd_amount': proceeds,
-            'realized_pnl': realized_pnl,
-            'position_btc': self.tactical_position['btc_held'],
-            'avg_entry': self.tactical_position['avg_entry']
-        })
+        self._tx_append('TACTICAL', action, btc_amount, exit_price, proceeds,
+                        realized_pnl, self.tactical_position)
         
         return realized_pnl
     
+    def record_tactical_exits_batch(self, btc_amounts, exit_prices, exit_types) -> np.ndarray:
+        """
+        Record several Tactical exits from one tick (e.g. T1 + T2 + STOP on a basket).
+        
+        Same result as calling record_tactical_exit() per exit, but the P&L is
+        computed in one vectorized pass, the transactions are written as one
+        block and a single consolidated row goes to the P&L log.
+        
+        Args:
+            btc_amounts: BTC sold per exit
+            exit_prices: Exit price per BTC per exit
+            exit_types: Type of each exit (T1, T2, STOP)
+            
+        Returns:
+            Realized P&L per exit
+        """
+        btc_amounts = np.asarray(btc_amounts, dtype=np.float64)
+        exit_prices = np.asarray(exit_prices, dtype=np.float64)
+        actions = np.array([_ACTION_CODE[_exit_action(t)] for t in exit_types], dtype=np.int8)
+        if not (len(btc_amounts) == len(exit_prices) == len(actions)):
+            raise ValueError("btc_amounts, exit_prices and exit_types must have equal length")
+        if len(btc_amounts) == 0:
+            return np.empty(0)
+        
+        self._mark_dirty()
+        
+        # Clamp in order, like sequential exits would: later ones only get what is left
+        held = self.tactical_position.btc_held
+        sold = np.minimum(np.cumsum(btc_amounts), held)
+        btc_amounts = np.diff(sold, prepend=0.0)
+        
+        # Calculate P&L
+        avg_entry = self.tactical_position.avg_entry
+        cost_basis = avg_entry * btc_amounts
+        proceeds = exit_prices * btc_amounts
+        realized_pnls = np.subtract(proceeds, cost_basis)
+        pnl_sum = float(realized_pnls.sum())
+        
+        # Update position
+        self.tactical_position.btc_held -= float(sold[-1])
+        self.tactical_position.capital -= float(cost_basis.sum())
+        self.tactical_position.realized_pnl += pnl_sum
+        
+        # Update total capital (one consolidated P&L row)
+        self.update_from_pnl(pnl_sum)
+        
+        # Log transactions
+        k = len(btc_amounts)
+        self._tx_log.extend(
+            timestamp=np.full(k, self._now_ns(), dtype=np.int64),
+            strategy=_STRATEGY_CODE['TACTICAL'],
+            action=actions,
+            btc_amount=btc_amounts,
+            price=exit_prices,
+            usd_amount=proceeds,
+            realized_pnl=realized_pnls,
+            position_btc=held - sold,
+            avg_entry=avg_entry
+        )
+        
+        return realized_pnls
+    
+    def replay(self, actions, btcs, prices) -> Tuple[np.ndarray, Dict]:
+        """
+        Run a whole trade history through the manager in one pass.
+        
+        Equivalent to calling record_dca_entry / record_tactical_entry /
+        record_tactical_exit per trade (buys spend btc * price), but the
+        position scan runs in a numba kernel and both logs are written as blocks.
+        
+        Args:
+            actions: Trade codes, index into REPLAY_ACTIONS
+                (0=DCA buy, 1=Tactical buy, 2/3/4=Tactical sell T1/T2/STOP)
+            btcs: BTC amount per trade
+            prices: Price per BTC per trade
+            
+        Returns:
+            (cumulative realized P&L after each trade, final state from export_state())
+        """
+        codes = np.asarray(actions, dtype=np.int8)
+        btcs = np.asarray(btcs, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if not (len(codes) == len(btcs) == len(prices)):
+            raise ValueError("actions, btcs and prices must have equal length")
+        
+        pnl_start = self.pnl
+        if len(codes) == 0:
+            return np.empty(0), self._state_scalars()
+        
+        self._mark_dirty()
+        dca, tac = self.dca_position, self.tactical_position
+        amounts, realized, position_btc, avg_entry = _numba_replay(
+            codes, btcs, prices, dca.btc_held, dca.avg_entry, tac.btc_held, tac.avg_entry)
+        usd = amounts * prices
+        is_dca = codes == 0
+        is_sell = codes >= 2
+        
+        # Final positions
+        if is_dca.any():
+            last = np.flatnonzero(is_dca)[-1]
+            dca.btc_held, dca.avg_entry = float(position_btc[last]), float(avg_entry[last])
+            dca.capital += float(usd[is_dca].sum())
+        if not is_dca.all():
+            last = np.flatnonzero(~is_dca)[-1]
+            tac.btc_held, tac.avg_entry = float(position_btc[last]), float(avg_entry[last])
+            tac.capital += float(usd[codes == 1].sum() - (avg_entry[is_sell] * amounts[is_sell]).sum())
+        
+        # Realized P&L: one log row per sell, as sequential exits would write
+        now = self._now_ns()
+        pnls = realized[is_sell]
+        if pnls.size:
+            cumulative = self.pnl + np.cumsum(pnls)
+            tac.realized_pnl += float(pnls.sum())
+            self.pnl = float(cumulative[-1])
+            self.current_capital = self.base_capital + self.pnl
+            self._pnl_log.extend(
+                timestamp=np.full(pnls.size, now, dtype=np.int64),
+                realized_pnl=pnls
+            )
+        
+        self._tx_log.extend(
+            timestamp=np.full(len(codes), now, dtype=np.int64),
+            strategy=np.where(is_dca, _STRATEGY_CODE['DCA'], _STRATEGY_CODE['TACTICAL']),
+            action=np.where(is_sell, codes - 1, _ACTION_CODE['BUY']),
+            btc_amount=amounts,
+            price=prices,
+            usd_amount=usd,
+            realized_pnl=realized,
+            position_btc=position_btc,
+            avg_entry=avg_entry
+        )
+        
+        pnl_series = pnl_start + np.cumsum(np.where(is_sell, realized, 0.0))
+        return pnl_series, self._state_scalars()
+    
     def update_unrealized_pnl(self, current_btc_price: float) -> Dict[str, float]:
         """
         Calculate unrealized P&L for both strategies.
@@ -202,25 +562,33 @@ class CapitalManager:
             current_btc_price: Current BTC market price
             
         Returns:
-            Dict with unrealized P&L for each strategy
+            Dict with unrealized P&L for each strategy (cached per price until
+            state changes; treat as read-only)
         """
+        if (not self._unreal_dirty and self._last_price is not None
+                and math.isclose(current_btc_price, self._last_price, rel_tol=1e-12, abs_tol=0.0)):
+            return self._unreal_cache
+        
         # DCA unrealized P&L
-        dca_market_value = self.dca_position['btc_held'] * current_btc_price
-        dca_unrealized = dca_market_value - self.dca_position['capital']
-        self.dca_position['unrealized_pnl'] = dca_unrealized
+        dca_market_value = self.dca_position.btc_held * current_btc_price
+        dca_unrealized = dca_market_value - self.dca_position.capital
+        self.dca_position.unrealized_pnl = dca_unrealized
         
         # Tactical unrealized P&L
-        tactical_market_value = self.tactical_position['btc_held'] * current_btc_price
-        tactical_unrealized = tactical_market_value - self.tactical_position['capital']
-        self.tactical_position['unrealized_pnl'] = tactical_unrealized
+        tactical_market_value = self.tactical_position.btc_held * current_btc_price
+        tactical_unrealized = tactical_market_value - self.tactical_position.capital
+        self.tactical_position.unrealized_pnl = tactical_unrealized
         
-        return {
+        self._unreal_cache = {
             'dca_unrealized': dca_unrealized,
             'tactical_unrealized': tactical_unrealized,
             'total_unrealized': dca_unrealized + tactical_unrealized,
-            'dca_unrealized_pct': (dca_unrealized / self.dca_position['capital'] * 100) if self.dca_position['capital'] > 0 else 0,
-            'tactical_unrealized_pct': (tactical_unrealized / self.tactical_position['capital'] * 100) if self.tactical_position['capital'] > 0 else 0
+            'dca_unrealized_pct': (dca_unrealized / self.dca_position.capital * 100) if self.dca_position.capital > 0 else 0,
+            'tactical_unrealized_pct': (tactical_unrealized / self.tactical_position.capital * 100) if self.tactical_position.capital > 0 else 0
         }
+        self._last_price = current_btc_price
+        self._unreal_dirty = False
+        return self._unreal_cache
     
     def get_portfolio_status(self, current_btc_price: float) -> Dict:
         """
@@ -230,52 +598,51 @@ class CapitalManager:
             current_btc_price: Current BTC market price
             
         Returns:
-            Complete portfolio snapshot
+            Complete portfolio snapshot (cached per price until state changes;
+            treat as read-only). Callers polling a live feed can pass a rounded
+            price so nearby ticks share one snapshot.
         """
+        if (not self._status_dirty and self._status_price is not None
+                and math.isclose(current_btc_price, self._status_price, rel_tol=1e-12, abs_tol=0.0)):
+            return self._status_cache
+        
         allocations = self.get_allocations()
         unrealized = self.update_unrealized_pnl(current_btc_price)
+        dca, tac = self.dca_position, self.tactical_position
         
-        total_value = allocations['total'] + unrealized['total_unrealized']
-        total_pnl = self.pnl + unrealized['total_unrealized']
+        total_unrealized = unrealized['total_unrealized']
+        total_value = allocations['total'] + total_unrealized
+        total_pnl = self.pnl + total_unrealized
         
-        return {
-            'capital': {
-                'base': self.base_capital,
-                'current': self.current_capital,
-                'total_value': total_value,
-                'pnl_realized': self.pnl,
-                'pnl_unrealized': unrealized['total_unrealized'],
-                'pnl_total': total_pnl,
-                'return_pct': (total_pnl / self.base_capital) * 100
-            },
-            'dca': {
-                'allocation_pct': self.dca_allocation_pct * 100,
-                'capital_allocated': allocations['dca'],
-                'capital_used': self.dca_position['capital'],
-                'capital_available': allocations['dca_available'],
-                'btc_held': self.dca_position['btc_held'],
-                'avg_entry': self.dca_position['avg_entry'],
-                'current_price': current_btc_price,
-                'unrealized_pnl': unrealized['dca_unrealized'],
-                'unrealized_pct': unrealized['dca_unrealized_pct']
-            },
-            'tactical': {
-                'allocation_pct': self.tactical_allocation_pct * 100,
-                'capital_allocated': allocations['tactical'],
-                'capital_used': self.tactical_position['capital'],
-                'capital_available': allocations['tactical_available'],
-                'btc_held': self.tactical_position['btc_held'],
-                'avg_entry': self.tactical_position['avg_entry'],
-                'current_price': current_btc_price,
-                'unrealized_pnl': unrealized['tactical_unrealized'],
-                'unrealized_pct': unrealized['tactical_unrealized_pct'],
-                'realized_pnl': self.tactical_position['realized_pnl']
-            },
-            'risk': {
-                'max_risk_per_trade_usd': total_value * 0.05,  # Max 5% risk
-                'max_risk_per_trade_pct': 5.0
-            }
-        }
+        # Fill every field in one pass (order = STATUS_FIELDS), then unpack
+        # the buffer back into the nested dict with a single tolist()
+        buf = self._status_buf
+        buf[:] = (
+            self.base_capital, self.current_capital, total_value,
+            self.pnl, total_unrealized, total_pnl,
+            total_pnl * self._inv_base * 100,
+            
+            self._dca_alloc_pct_100, allocations['dca'], dca.capital,
+            allocations['dca_available'], dca.btc_held, dca.avg_entry,
+            current_btc_price, unrealized['dca_unrealized'], unrealized['dca_unrealized_pct'],
+            
+            self._tac_alloc_pct_100, allocations['tactical'], tac.capital,
+            allocations['tactical_available'], tac.btc_held, tac.avg_entry,
+            current_btc_price, unrealized['tactical_unrealized'], unrealized['tactical_unrealized_pct'],
+            tac.realized_pnl,
+            
+            total_value * 0.05,  # Max 5% risk
+            5.0
+        )
+        
+        status = {section: {} for section in STATUS_SECTIONS}
+        for (section, key), value in zip(STATUS_FIELDS, buf.tolist()):
+            status[section][key] = value
+        
+        self._status_cache = status
+        self._status_price = current_btc_price
+        self._status_dirty = False
+        return status
     
     def get_transaction_history(self) -> pd.DataFrame:
         """
@@ -284,45 +651,202 @@ class CapitalManager:
         Returns:
             DataFrame of all transactions
         """
-        if not self.transactions:
+        log = self._tx_log
+        if not len(log):
             return pd.DataFrame()
         
-        return pd.DataFrame(self.transactions)
+        # Columns are handed over as array slices; only the enum codes are mapped
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(log['timestamp'], unit='ns'),
+            'strategy': pd.Categorical.from_codes(log['strategy'], categories=TX_STRATEGIES),
+            'action': pd.Categorical.from_codes(log['action'], categories=TX_ACTIONS),
+            'btc_amount': log['btc_amount'],
+            'price': log['price'],
+            'usd_amount': log['usd_amount'],
+            'realized_pnl': log['realized_pnl'],
+            'position_btc': log['position_btc'],
+            'avg_entry': log['avg_entry']
+        }, copy=False)
     
-    def export_state(self) -> Dict:
+    def get_transaction_history_arrow(self):
         """
-        Export complete manager state for persistence.
+        Get transaction history as a pyarrow RecordBatch.
+        
+        The numeric columns wrap the log buffers without copying and the enum
+        codes become dictionary arrays, so Polars/DuckDB or feather/parquet
+        writers can consume the log directly.
         
         Returns:
-            Complete state dictionary
+            pyarrow.RecordBatch with the TX_COLUMNS fields
         """
+        import pyarrow as pa
+        
+        log = self._tx_log
+        arrays = [
+            pa.array(log['timestamp'], type=pa.timestamp('ns')),
+            pa.DictionaryArray.from_arrays(pa.array(log['strategy']), pa.array(TX_STRATEGIES)),
+            pa.DictionaryArray.from_arrays(pa.array(log['action']), pa.array(TX_ACTIONS)),
+        ]
+        arrays += [pa.array(log[name]) for name in list(TX_COLUMNS)[3:]]
+        return pa.RecordBatch.from_arrays(arrays, names=list(TX_COLUMNS))
+    
+    def get_pnl_history(self) -> pd.DataFrame:
+        """
+        Get realized P&L history as DataFrame.
+        
+        Returns:
+            DataFrame with timestamp, realized_pnl, cumulative_pnl, capital
+        """
+        log = self._pnl_log
+        if not len(log):
+            return pd.DataFrame()
+        
+        cumulative = np.cumsum(log['realized_pnl'])
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(log['timestamp'], unit='ns'),
+            'realized_pnl': log['realized_pnl'],
+            'cumulative_pnl': cumulative,
+            'capital': self.base_capital + cumulative
+        }, copy=False)
+    
+    def get_pnl_series(self) -> pd.Series:
+        """
+        Get cumulative realized P&L as a time-indexed Series.
+        
+        Returns:
+            Series of cumulative P&L indexed by timestamp
+        """
+        log = self._pnl_log
+        return pd.Series(np.cumsum(log['realized_pnl']),
+                         index=pd.to_datetime(log['timestamp'], unit='ns'),
+                         name='cumulative_pnl')
+    
+    def _state_scalars(self) -> Dict:
         return {
             'base_capital': self.base_capital,
             'current_capital': self.current_capital,
             'pnl': self.pnl,
-            'pnl_history': self.pnl_history,
-            'dca_position': self.dca_position,
-            'tactical_position': self.tactical_position,
-            'transactions': self.transactions,
+            'dca_position': asdict(self.dca_position),
+            'tactical_position': asdict(self.tactical_position),
             'allocations': {
                 'dca_pct': self.dca_allocation_pct,
                 'tactical_pct': self.tactical_allocation_pct
             }
         }
     
-    def import_state(self, state: Dict) -> None:
+    def export_state(self, path: str = None) -> Dict:
+        """
+        Export complete manager state for persistence.
+        
+        Args:
+            path: Optional file prefix. When given, the logs are written as Arrow
+                feather files (<path>.tx.arrow, <path>.pnl.arrow) with the scalars
+                in a JSON sidecar (<path>.json), instead of as row dicts.
+        
+        Returns:
+            Complete state dictionary (scalars only when path is given)
+        """
+        state = self._state_scalars()
+        if path is None:
+            state['pnl_history'] = self._pnl_log.to_records()
+            state['transactions'] = self._tx_log.to_records()
+            return state
+        
+        import pyarrow as pa
+        from pyarrow import feather
+        
+        log = self._pnl_log
+        pnl_table = pa.table(
+            [pa.array(log['timestamp'], type=pa.timestamp('ns'))] +
+            [pa.array(log[name]) for name in list(PNL_COLUMNS)[1:]],
+            names=list(PNL_COLUMNS)
+        )
+        tx_table = pa.Table.from_batches([self.get_transaction_history_arrow()])
+        feather.write_feather(tx_table, f'{path}.tx.arrow')
+        feather.write_feather(pnl_table, f'{path}.pnl.arrow')
+        with open(f'{path}.json', 'w') as f:
+            json.dump(state, f)
+        return state
+    
+    @staticmethod
+    def _read_log(path: str, dtypes: Dict[str, type]) -> _ColumnLog:
+        """Load a feather file written by export_state() back into a column log"""
+        import pyarrow as pa
+        from pyarrow import feather
+        
+        table = feather.read_table(path)
+        columns = {}
+        for name, dtype in dtypes.items():
+            col = table.column(name).combine_chunks()
+            if pa.types.is_dictionary(col.type):
+                col = col.indices
+            elif pa.types.is_timestamp(col.type):
+                col = col.cast(pa.int64())
+            columns[name] = col.to_numpy(zero_copy_only=False).astype(dtype, copy=False)
+        
+        log = _ColumnLog(dtypes, capacity=max(len(table), 64))
+        if len(table):
+            log.extend(**columns)
+        return log
+    
+    @staticmethod
+    def _rows_to_columns(rows: List[Dict], dtypes: Dict[str, type]) -> Dict[str, list]:
+        """
+        Row dicts from export_state() -> one list per log column.
+        
+        Also reads the pre-columnar export: datetime timestamps, 'DCA'/'BUY'
+        strings instead of enum codes, and no realized_pnl key on buys.
+        """
+        columns = {name: [row.get(name, np.nan) for row in rows] for name in dtypes}
+        
+        ts = columns['timestamp']
+        if not all(isinstance(t, (int, np.integer)) for t in ts):
+            columns['timestamp'] = pd.to_datetime(ts).to_numpy(dtype='datetime64[ns]').view(np.int64)
+        
+        for name, codes, names in (('strategy', _STRATEGY_CODE, TX_STRATEGIES),
+                                   ('action', _ACTION_CODE, TX_ACTIONS)):
+            if name not in columns:
+                continue
+            try:
+                columns[name] = [codes[v] if isinstance(v, str) else v for v in columns[name]]
+            except KeyError as e:
+                raise ValueError(f"Unknown transaction {name} {e.args[0]!r} in state; "
+                                 f"expected one of {names}") from None
+        return columns
+    
+    def import_state(self, state) -> None:
         """
         Import manager state from saved data.
         
         Args:
-            state: State dictionary from export_state()
+            state: State dictionary from export_state(), or the path prefix
+                passed to export_state(path)
         """
+        self._mark_dirty()
+        path = None
+        if not isinstance(state, dict):
+            path = state
+            with open(f'{path}.json') as f:
+                state = json.load(f)
+        
         self.base_capital = state['base_capital']
+        self._inv_base = 1.0 / self.base_capital if self.base_capital > 0 else 0.0
         self.current_capital = state['current_capital']
         self.pnl = state['pnl']
-        self.pnl_history = state['pnl_history']
-        self.dca_position = state['dca_position']
-        self.tactical_position = state['tactical_position']
-        self.transactions = state['transactions']
-        self.dca_allocation_pct = state['allocations']['dca_pct']
-        self.tactical_allocation_pct = state['allocations']['tactical_pct']
+        self.dca_position = DCAPosition(**state['dca_position'])
+        self.tactical_position = TacticalPosition(**state['tactical_position'])
+        self.set_allocations(state['allocations']['dca_pct'], state['allocations']['tactical_pct'])
+        
+        if path is not None:
+            self._pnl_log = self._read_log(f'{path}.pnl.arrow', PNL_COLUMNS)
+            self._tx_log = self._read_log(f'{path}.tx.arrow', TX_COLUMNS)
+            return
+        
+        # Rebuild the columnar logs from the exported rows
+        self._pnl_log = _ColumnLog(PNL_COLUMNS)
+        if state['pnl_history']:
+            self._pnl_log.extend(**self._rows_to_columns(state['pnl_history'], PNL_COLUMNS))
+        
+        self._tx_log = _ColumnLog(TX_COLUMNS)
+        if state['transactions']:
+            self._tx_log.extend(**self._rows_to_columns(state['transactions'], TX_COLUMNS))
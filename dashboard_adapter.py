@@ -567,7 +567,7 @@ class EliteDashboardAdapter:
         # 8. Scientific Deep-Dive (Phase 6)
         if self.hmm:
             # Use last 100 price changes as observations (binned 0-9)
-            prices = df['close'].values
+            prices = df['close'].to_numpy(dtype=np.float64)
             pct_changes = np.diff(prices) / prices[:-1]
             bins = np.linspace(-0.05, 0.05, 10)
             observations = np.digitize(pct_changes[-100:], bins) - 1
@@ -14,20 +14,21 @@ import pandas as pd
 import numpy as np
 
 
-def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
+def render_divergence_chart(st, df, elite_results: dict):
 
     """
     Render Price vs OnChain Divergence Chart
     
     Args:
         st: Streamlit module
-        df: DataFrame with 'close' column
+        df: DataFrame with 'close' column, or a dict of column arrays
+            with 'close' and 'ts' (bar timestamps)
         elite_results: Output from elite_adapter.analyze_elite()
     """
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
     
-    if 'close' not in df.columns:
+    if 'close' not in (df.columns if isinstance(df, pd.DataFrame) else df):
         st.error("Divergence Chart: df missing 'close'")
         return
     
@@ -51,28 +52,36 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
         mode_badge    = '⚠️ PROXY'
         mode_color    = 'orange'
 
-    # Prepare data (500 bars for broad context)
-    df_tail = df.tail(500).copy()
+    # Prepare data (500 bars for broad context) -- only close and the timestamps
+    # are read, so take array views instead of copying every column of the frame
+    close = np.asarray(df['close'], dtype=np.float64)[-500:]
+    x = np.asarray(df.index if isinstance(df, pd.DataFrame) else df['ts'])[-500:]
+    # One mask for both arrays so every remaining price keeps its own timestamp
+    valid = ~np.isnan(close)
+    close, x = close[valid], x[valid]
+    if close.size == 0:
+        st.error("Divergence Chart: no valid 'close' prices")
+        return
 
     # Normalize price to 0-100 for comparison
-    price_min = df_tail['close'].min()
-    price_max = df_tail['close'].max()
+    price_min = close.min()
+    price_max = close.max()
     price_range = price_max - price_min or 1.0
-    price_normalized = (df_tail['close'] - price_min) / price_range * 100
+    price_normalized = (close - price_min) / price_range * 100
 
     # ── OnChain proxy series ─────────────────────────────────────────────────
     # We always build a historical proxy from price patterns, then anchor
     # the LAST bar to the real/known onchain_score.
     # When LIVE: the anchor is a real CryptoQuant score → series is meaningful.
     # When PROXY: the anchor is synthetic → series is an estimate only.
-    returns    = df_tail['close'].pct_change()
+    returns    = pd.Series(close).pct_change()
     volatility = returns.rolling(20).std()
     onchain_proxy = 50 + (volatility.rank(pct=True) * 20) + (returns * -100)
     onchain_proxy = onchain_proxy.clip(0, 100).fillna(50)
     # Anchor the final bar to the real (or synthetic) score
     onchain_proxy.iloc[-1] = onchain_score
-    onchain_proxy = onchain_proxy.ewm(span=5).mean()   # smooth
-    onchain_proxy.iloc[-1] = onchain_score             # re-pin after EWM
+    onchain_proxy = onchain_proxy.ewm(span=5).mean().to_numpy(copy=True)   # smooth
+    onchain_proxy[-1] = onchain_score                                      # re-pin after EWM
 
     # ── Status badge above chart ────────────────────────────────────────────
     netflow = onchain_data.get('recent_netflow', None)
@@ -100,12 +109,12 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
     # Row 1 – Price (normalized)
     fig.add_trace(
         go.Scatter(
-            x=df_tail.index,
+            x=x,
             y=price_normalized,
             name='Price (normalized)',
             line=dict(color=color_price, width=2),
             hovertemplate='Price: %{customdata:,.0f}<br>Normalized: %{y:.1f}<extra></extra>',
-            customdata=df_tail['close']
+            customdata=close
         ),
         row=1, col=1
     )
@@ -113,7 +122,7 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
     # Row 1 – OnChain (LIVE = cyan, PROXY = neon-green)
     fig.add_trace(
         go.Scatter(
-            x=df_tail.index,
+            x=x,
             y=onchain_proxy,
             name=f'OnChain Diffusion ({"LIVE" if is_live else "PROXY"})',
             line=dict(color=color_onchain, width=2.5),
@@ -124,8 +133,8 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
 
     # Annotate latest OnChain value
     fig.add_annotation(
-        x=df_tail.index[-1],
-        y=onchain_proxy.iloc[-1],
+        x=x[-1],
+        y=onchain_proxy[-1],
         text=f'{onchain_score:.0f}',
         showarrow=False,
         font=dict(color=color_onchain, size=13, family='monospace'),
@@ -137,14 +146,13 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
     divergence = onchain_proxy - price_normalized
     # LIVE: green/red neon  PROXY: teal/salmon
     if is_live:
-        bar_colors = ['#00ff88' if x > 0 else '#ff4466' for x in divergence]
+        bar_colors = np.where(divergence > 0, '#00ff88', '#ff4466')
     else:
-        colors = ['#26a69a' if x > 0 else '#ef5350' for x in divergence]
-        bar_colors = colors
+        bar_colors = np.where(divergence > 0, '#26a69a', '#ef5350')
 
     fig.add_trace(
         go.Bar(
-            x=df_tail.index,
+            x=x,
             y=divergence,
             name='Divergence',
             marker=dict(color=bar_colors),
@@ -157,12 +165,12 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
     fig.add_hline(y=0, line_dash="dash", line_color="gray", row=2, col=1)
     
     # Highlight current divergence zone
-    current_div = divergence.iloc[-1]
+    current_div = divergence[-1]
     if current_div > 10:
         # Strong bullish divergence
         fig.add_annotation(
-            x=df_tail.index[-1],
-            y=price_normalized.iloc[-1],
+            x=x[-1],
+            y=price_normalized[-1],
             text="🟢 BULLISH DIV",
             showarrow=True,
             arrowhead=2,
@@ -172,8 +180,8 @@ def render_divergence_chart(st, df: pd.DataFrame, elite_results: dict):
     elif current_div < -10:
         # Strong bearish divergence
         fig.add_annotation(
-            x=df_tail.index[-1],
-            y=price_normalized.iloc[-1],
+            x=x[-1],
+            y=price_normalized[-1],
             text="🔴 BEARISH DIV",
             showarrow=True,
             arrowhead=2,
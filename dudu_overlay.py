@@ -171,10 +171,18 @@ def _safe_float(x, default=np.nan):
     except Exception:
         return default
 
-def _ensure_returns(close: pd.Series) -> pd.Series:
-    close = close.astype(float)
-    r = close.pct_change()
-    return r.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+def _close_array(close) -> np.ndarray:
+    """Series or ndarray of closes -> float64 ndarray with the NaNs dropped."""
+    close = np.asarray(close, dtype=np.float64)
+    return close[~np.isnan(close)]
+
+def _ensure_returns(close: np.ndarray) -> np.ndarray:
+    """Simple returns, same length as close (first bar 0); inf/NaN -> 0."""
+    r = np.zeros(len(close))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r[1:] = close[1:] / close[:-1] - 1.0
+    r[~np.isfinite(r)] = 0.0
+    return r
 
 def _ewma_sigma(returns: np.ndarray, lam: float = 0.94) -> float:
     """
@@ -200,7 +208,7 @@ _VOLATILE_REGIMES = {
     "WHITE_NOISE", "WHIPSAW",
 }
 
-def build_vol_cone(close: pd.Series, horizon: int = 48, lookback: int = 240,
+def build_vol_cone(close: pd.Series | np.ndarray, horizon: int = 48, lookback: int = 240,
                    sigmas=(1, 2), mode: str = "sqrt_time",
                    current_violence: float = 1.0,
                    current_regime: str | None = None):
@@ -218,19 +226,19 @@ def build_vol_cone(close: pd.Series, horizon: int = 48, lookback: int = 240,
     Input current_violence: Legacy chaos multiplier (1.0 = normal).
     Input current_regime:   String from regime_detector, used for tier-3 multiplier.
     """
-    close = close.dropna().astype(float)
+    close = _close_array(close)
     n = len(close)
 
     # ── Layer 2: Dynamic Lookback for sigma (90–180 bars recent, not full history) ──
     sigma_lookback = max(90, min(180, n - 1))
-    r_sigma = _ensure_returns(close).tail(sigma_lookback)
+    r_sigma = _ensure_returns(close)[-sigma_lookback:]
 
     # ── Layer 1: EWMA Sigma (exponentially weighted, λ=0.94) ────────────────────
-    sigma_ewma = _ewma_sigma(r_sigma.values, lam=0.94)
+    sigma_ewma = _ewma_sigma(r_sigma, lam=0.94)
 
     # Fallback: if EWMA gives 0 (degenerate input), use plain std over same window
     if sigma_ewma < 1e-8:
-        sigma_ewma = float(np.nanstd(r_sigma.values, ddof=1)) if len(r_sigma) > 5 else 0.0
+        sigma_ewma = float(np.nanstd(r_sigma, ddof=1)) if len(r_sigma) > 5 else 0.0
 
     # ── Layer 3: Regime-Conditional Multiplier ───────────────────────────────────
     regime_multiplier = 1.0
@@ -251,7 +259,7 @@ def build_vol_cone(close: pd.Series, horizon: int = 48, lookback: int = 240,
     sigma = sigma_ewma  # raw EWMA (for reporting)
     adjusted_sigma = sigma_ewma * regime_multiplier * violence_adjustment
 
-    last = float(close.iloc[-1])
+    last = float(close[-1])
     t = np.arange(0, horizon + 1)
     scale = np.sqrt(t) if mode == "sqrt_time" else t
 
@@ -280,7 +288,7 @@ def _labels_to_str(labels) -> str:
         return "|".join(sorted([str(x) for x in labels]))
     return str(labels)
 
-def build_regime_paths(close: pd.Series,
+def build_regime_paths(close: pd.Series | np.ndarray,
                        regime_series: pd.Series | None = None,
                        current_regime=None,
                        horizon: int = 48,
@@ -294,9 +302,11 @@ def build_regime_paths(close: pd.Series,
     Returns: paths array shape (n_paths, horizon+1), plus summary percentiles.
     """
     rng = np.random.default_rng(seed)
-    close = close.dropna().astype(float).tail(lookback)
-    last = float(close.iloc[-1])
-    r = _ensure_returns(close).values  # length N
+    # A Series keeps its index for aligning regime_series; an ndarray aligns by position
+    index = close.dropna().index[-lookback:] if isinstance(close, pd.Series) else None
+    close = _close_array(close)[-lookback:]
+    last = float(close[-1])
+    r = _ensure_returns(close)  # length N
 
     N = len(r)
     if N < horizon + 50:
@@ -308,7 +318,8 @@ def build_regime_paths(close: pd.Series,
 
     # Filter by regime if available
     if regime_series is not None and current_regime is not None:
-        rs = regime_series.reindex(close.index).fillna("")
+        rs = (regime_series.reindex(index) if index is not None
+              else regime_series.iloc[-len(close):]).fillna("")
         cur = _labels_to_str(current_regime)
         # keep windows where regime at start matches
         mask = (rs.iloc[pick_starts].astype(str).values == cur)
@@ -347,18 +358,19 @@ def build_regime_paths(close: pd.Series,
         "num_windows_used": int(len(pick_starts))
     }
 
-def render_projection_tab(st, df: pd.DataFrame, qc_payload: dict | None = None,
+def render_projection_tab(st, df: pd.DataFrame | dict, qc_payload: dict | None = None,
                           horizon: int = 48, current_regime: str | None = None,
                           current_violence: float = 1.0,
                           key: str = "dudu_base_chart"):
     """
     Streamlit renderer. Minimal dependencies: numpy, pandas.
+
+    df: OHLCV DataFrame, or a dict of column arrays (only 'close' is read).
     """
-    if df is None or len(df) < 50:
+    close = _close_array(df['close']) if df is not None else np.empty(0)
+    if len(close) < 50:
         st.warning("Not enough data for projection")
         return
-
-    close = df['close']
     
     cur_regime = current_regime
     if cur_regime is None and qc_payload and isinstance(qc_payload, dict):
@@ -386,10 +398,10 @@ def render_projection_tab(st, df: pd.DataFrame, qc_payload: dict | None = None,
     fig = go.Figure()
 
     # historical tail (visual context)
-    hist_tail = close.tail(240)
+    hist_tail = close[-240:]
     fig.add_trace(go.Scatter(
         x=np.arange(-len(hist_tail)+1, 1),
-        y=hist_tail.values,
+        y=hist_tail,
         mode="lines",
         name="History (Price)",
         line=dict(color="rgba(255,255,255,0.4)", width=1.5)
@@ -6,16 +6,33 @@ Vol Cone + Regime Paths Projection
 ELITE v20 - Dashboard #3 (Port 8512)
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import numpy as np
 import sys
 import os
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add paths - dashboard is in dashboards/, need to go up one level
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, BASE_DIR)
 
+# Served from Streamlit's static cache: no network fetch per rerun
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'dudu_logo.png')
+
+# Seconds a fetched OHLCV window stays fresh (full history and incremental tail)
+OHLCV_TTL = 60
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+    _HAS_AUTOREFRESH = True
+except ImportError:
+    _HAS_AUTOREFRESH = False
+
 # Import dudu overlay from modules directory
 try:
     from modules.dudu_overlay import render_projection_tab
@@ -35,9 +52,166 @@ st.set_page_config(
     layout="wide"
 )
 
+
+
+@st.cache_resource
+def get_exchange():
+    """One ccxt client shared by every rerun; its keep-alive session reuses the TLS connection"""
+    import ccxt
+    import requests
+    return ccxt.binance({'enableRateLimit': True, 'session': requests.Session()})
+
+
+@st.cache_resource
+def _ohlcv_stream_slot() -> dict:
+    """The one live websocket feed for this server: its key, stop event and candle deque"""
+    import threading
+    return {'lock': threading.Lock(), 'key': None, 'stop': None, 'candles': None}
+
+
+def get_ohlcv_stream(symbol: str, timeframe: str, maxlen: int):
+    """
+    Live candles pushed by a ccxt.pro websocket on a daemon thread.
+    
+    Only one feed runs at a time: asking for a different symbol/timeframe
+    stops the previous thread before starting the new one. Dropped
+    connections are reopened with backoff; if the thread dies anyway the
+    slot is cleared so the next call starts a fresh feed.
+    
+    Returns the deque the thread writes into (newest candle last), or None
+    when ccxt.pro is not installed.
+    """
+    try:
+        import ccxt.pro as ccxtpro
+    except ImportError:
+        return None
+    import asyncio
+    import threading
+    from collections import deque
+    
+    slot = _ohlcv_stream_slot()
+    key = (symbol, timeframe, maxlen)
+    with slot['lock']:
+        if slot['key'] == key:
+            return slot['candles']
+        if slot['stop'] is not None:
+            slot['stop'].set()
+        
+        candles = deque(maxlen=maxlen)
+        stop = threading.Event()
+        
+        async def watch():
+            delay = 1
+            while not stop.is_set():
+                exchange = ccxtpro.binance({'enableRateLimit': True})
+                try:
+                    while not stop.is_set():
+                        for candle in await exchange.watch_ohlcv(symbol, timeframe):
+                            if candles and candles[-1][0] == candle[0]:
+                                candles[-1] = candle  # forming candle updated
+                            elif not candles or candle[0] > candles[-1][0]:
+                                candles.append(candle)
+                        delay = 1
+                except Exception as e:
+                    print(f"[WARN] DUDU stream {symbol} {timeframe}: {e}; reconnecting in {delay}s")
+                finally:
+                    await exchange.close()
+                if not stop.is_set():
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 60)
+        
+        def run():
+            try:
+                asyncio.run(watch())
+            finally:
+                with slot['lock']:
+                    if slot['stop'] is stop:
+                        slot.update(key=None, stop=None, candles=None)
+        
+        threading.Thread(target=run, daemon=True).start()
+        slot.update(key=key, stop=stop, candles=candles)
+        return candles
+
+
+def stop_ohlcv_stream():
+    """Stop the live websocket feed, if one is running"""
+    slot = _ohlcv_stream_slot()
+    with slot['lock']:
+        if slot['stop'] is not None:
+            slot['stop'].set()
+        slot.update(key=None, stop=None, candles=None)
+
+
+def _ohlcv_frame(ohlcv: list) -> pd.DataFrame:
+    """Build column by column so each OHLCV field is its own contiguous float64 array"""
+    import numpy as np
+    import pandas as pd
+    
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    index = pd.to_datetime(arr[:, 0].astype('int64'), unit='ms', cache=True)
+    index.name = 'timestamp'
+    return pd.DataFrame({
+        'open': arr[:, 1].copy(),
+        'high': arr[:, 2].copy(),
+        'low': arr[:, 3].copy(),
+        'close': arr[:, 4].copy(),
+        'volume': arr[:, 5].copy()
+    }, index=index)
+
+
+@st.cache_data(ttl=OHLCV_TTL, show_spinner=False)
+def fetch_ohlcv_df(symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+    """OHLCV frame indexed by timestamp, memoized across reruns"""
+    return _ohlcv_frame(get_exchange().fetch_ohlcv(symbol, timeframe, limit=limit))
+
+
+def load_ohlcv(symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+    """
+    Rolling `limit`-bar window kept in session state.
+    
+    The first load pulls the full history; once the window is OHLCV_TTL old,
+    the next call requests only the bars since the last (still forming) one
+    and splices them onto the end. The tail is sized from the time elapsed
+    since that bar, and a gap as long as the window reloads it in full. A
+    failed tail fetch keeps the cached window and is retried after another
+    OHLCV_TTL.
+    """
+    import pandas as pd
+    
+    key = f"ohlcv_{symbol}_{timeframe}_{limit}"
+    df = st.session_state.get(key)
+    now = time.monotonic()
+    if df is None:
+        df = fetch_ohlcv_df(symbol, timeframe, limit)
+    elif now - st.session_state.get(f"{key}_fetched_at", 0.0) < OHLCV_TTL:
+        return df
+    else:
+        exchange = get_exchange()
+        since = int(df.index[-1].value // 1_000_000)
+        bars = (int(time.time() * 1000) - since) // (exchange.parse_timeframe(timeframe) * 1000) + 2
+        try:
+            if bars >= limit:
+                # Idle for a whole window: nothing cached is worth splicing onto
+                df = fetch_ohlcv_df(symbol, timeframe, limit)
+            else:
+                ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=bars)
+                if ohlcv:
+                    new = _ohlcv_frame(ohlcv)
+                    df = pd.concat([df[df.index < new.index[0]], new]).iloc[-limit:]
+        except Exception:
+            pass  # keep the cached window
+    
+    st.session_state[key] = df
+    st.session_state[f"{key}_fetched_at"] = now
+    return df
+
+
 # Sidebar
 with st.sidebar:
-    st.image("https://via.placeholder.com/200x100/1e1e1e/00ff00?text=DUDU+Overlay", width=200)
+    if os.path.exists(LOGO_PATH):
+        st.image(LOGO_PATH, width=200)
+    else:
+        st.markdown("## DUDU")
     st.markdown("### ⚙️ Controls")
     
     symbol = st.selectbox("Symbol", ["BTCUSDT"], index=0)
@@ -60,57 +234,75 @@ with st.sidebar:
 st.title("📊 DUDU Overlay - Projection Dashboard")
 st.caption("Vol Cone + Regime Paths | ELITE v20")
 
-# Get market data
-try:
-    import ccxt
-    exchange = ccxt.binance()
-    
-    # Fetch data
-    limit = 1200 if timeframe == '1h' else 500
-    ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    df.set_index('timestamp', inplace=True)
-    
-    current_price = float(df['close'].iloc[-1])
-    
-    # Metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Current Price", f"${current_price:,.0f}")
-    with col2:
-        change_24h = ((df['close'].iloc[-1] - df['close'].iloc[-24]) / df['close'].iloc[-24] * 100) if len(df) >= 24 else 0
-        st.metric("24h Change", f"{change_24h:.2f}%")
-    with col3:
-        vol = df['close'].pct_change().std() * 100
-        st.metric("Volatility", f"{vol:.2f}%")
+def live_panel():
+    """Price metrics + projection; the only part of the page that auto-refresh reruns"""
+    # Data stack is imported on first use, after the page chrome has painted
+    import numpy as np
+    import pandas as pd
     
-    st.markdown("---")
-    
-    st.success("🟢 LIVE DATA - Connected to Binance")
-    
-    # Render projection
-    render_projection_tab(st, df, qc_payload=None, horizon=horizon, key="dudu_standalone_live")
-    
-    data_success = True
+    # Get market data
+    try:
+        # Fetch data (incremental after the first load; see load_ohlcv)
+        limit = 1200 if timeframe == '1h' else 500
+        df = load_ohlcv(symbol, timeframe, limit)
+        
+        # Live mode: overlay the websocket candles on the cached REST history
+        if auto_refresh:
+            stream = get_ohlcv_stream(symbol, timeframe, limit)
+            if stream:
+                live = _ohlcv_frame(stream.copy())  # snapshot; the feed thread keeps appending
+                # A stalled feed must not hide newer REST bars
+                if live.index[-1] >= df.index[-1]:
+                    df = pd.concat([df[df.index < live.index[0]], live]).iloc[-limit:]
+        else:
+            stop_ohlcv_stream()
+        
+        close_np = df['close'].to_numpy(copy=False)  # view; scalar reads skip .iloc dispatch
+        current_price = float(close_np[-1])
+        
+        # Metrics (one NumPy pass over the closes, no intermediate Series)
+        change_24h = (close_np[-1] / close_np[-24] - 1) * 100 if close_np.size >= 24 else 0.0
+        vol = np.std(np.diff(close_np) / close_np[:-1], ddof=1) * 100
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Current Price", f"${current_price:,.0f}")
+        with col2:
+            st.metric("24h Change", f"{change_24h:.2f}%")
+        with col3:
+            st.metric("Volatility", f"{vol:.2f}%")
+        
+        st.markdown("---")
+        
+        st.success("🟢 LIVE DATA - Connected to Binance")
+        
+        # Render projection
+        render_projection_tab(st, df, qc_payload=None, horizon=horizon, key="dudu_standalone_live")
+        
+    except Exception as e:
+        st.error(f"Data fetch error: {e}")
+        st.warning("⚠️ Using fallback demo data")
+        
+        # Generate demo data
+        dates = pd.date_range(end=pd.Timestamp.now(), periods=500, freq='1H')
+        price = 70000
+        returns = np.random.randn(500) * 0.02
+        prices = price * np.cumprod(1 + returns)
+        
+        df = pd.DataFrame({
+            'close': prices
+        }, index=dates)
+        
+        render_projection_tab(st, df, qc_payload=None, horizon=48, key="dudu_standalone_demo")
 
-except Exception as e:
-    st.error(f"Data fetch error: {e}")
-    st.warning("⚠️ Using fallback demo data")
-    
-    # Generate demo data
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=500, freq='1H')
-    price = 70000
-    returns = np.random.randn(500) * 0.02
-    prices = price * np.cumprod(1 + returns)
-    
-    df = pd.DataFrame({
-        'close': prices
-    }, index=dates)
-    
-    render_projection_tab(st, df, qc_payload=None, horizon=48, key="dudu_standalone_demo")
-    
-    data_success = False
+
+# Auto-refresh reruns just the live panel on a timer; sidebar and page chrome stay mounted
+if hasattr(st, 'fragment'):
+    live_panel = st.fragment(run_every=refresh_seconds if auto_refresh else None)(live_panel)
+elif auto_refresh and _HAS_AUTOREFRESH:
+    st_autorefresh(interval=refresh_seconds * 1000, key="ohlcv")
+
+live_panel()
 
 # Info section
 with st.expander("ℹ️ About DUDU Overlay"):
@@ -133,9 +325,3 @@ with st.expander("ℹ️ About DUDU Overlay"):
     - Understand potential price ranges
     - Risk management
     """)
-
-# Auto-refresh
-if auto_refresh and data_success:
-    import time
-    time.sleep(refresh_seconds)
-    st.rerun()
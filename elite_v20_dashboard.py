@@ -12,7 +12,9 @@ Run: streamlit run elite_v20_dashboard.py
 import streamlit as st
 import requests
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from labels import classify
 try:
     from streamlit_autorefresh import st_autorefresh
     _HAS_AUTOREFRESH = True
@@ -87,10 +89,29 @@ def val(v, fmt="{}", fallback="—", suffix=""):
         return str(v)
 
 
+# ════════════════════════════════════════════════════════
+# COLOR LADDERS — table-driven (labels.classify: LABELS[searchsorted(BINS, v, 'right')])
+# ════════════════════════════════════════════════════════
+_TAG_COLORS = {
+    **dict.fromkeys(("LIVE", "INFLOW", "ACCUMULATING", "CONNECTED"), "green"),
+    **dict.fromkeys(("BALANCED", "NEUTRAL", "HOLD", "DISABLED"), "yellow"),
+    **dict.fromkeys(("DISCONNECTED", "OFFLINE", "DISTRIBUTING", "OUTFLOW", "DATA_OFFLINE"), "red"),
+}
+_NLP_STATUS_COLORS = {"LIVE": "#4ade80", "DEGRADED": "#fbbf24"}  # anything else: red
+
+_CHAOS_BINS = np.array([np.nextafter(0.3, np.inf), np.nextafter(0.6, np.inf)])  # > 0.3, > 0.6
+_CHAOS_ICONS = ("🟢", "🟡", "🔴")
+_SENT_BINS = np.array([-0.1, np.nextafter(0.1, np.inf)])
+_SENT_COLORS = ("#f87171", "#fbbf24", "#4ade80")
+_CONFUSION_BINS = np.array([0.3, 0.6])
+_CONFUSION_COLORS = ("#4ade80", "#fbbf24", "#f87171")
+_CONFUSION_LABELS = ("LOW", "MEDIUM", "HIGH")
+_HEADLINE_BINS = np.array([-0.05, np.nextafter(0.05, np.inf)])
+_HEADLINE_ICONS = ("🔴", "⚪", "🟢")
+
+
 def tag(status: str) -> str:
-    color = "green" if status in ("LIVE","INFLOW","ACCUMULATING","CONNECTED") else \
-            "yellow" if status in ("BALANCED","NEUTRAL","HOLD","DISABLED") else \
-            "red"    if status in ("DISCONNECTED","OFFLINE","DISTRIBUTING","OUTFLOW","DATA_OFFLINE") else "gray"
+    color = _TAG_COLORS.get(status, "gray")
     return f'<span class="tag tag-{color}">{status}</span>'
 
 
@@ -153,7 +174,7 @@ with c3:
     st.metric("Manifold Score", f"{manifold:.1f}%")
 with c4:
     chaos = s.get("chaos_penalty", 0)
-    chaos_color = "🔴" if chaos > 0.6 else "🟡" if chaos > 0.3 else "🟢"
+    chaos_color = classify(chaos, _CHAOS_BINS, _CHAOS_ICONS)
     st.metric("Chaos Penalty", f"{chaos_color} {chaos:.3f}")
 with c5:
     # p_win_input is the actual posterior used in Kelly calculation
@@ -216,7 +237,7 @@ if nlp and nlp.get("source_count", 0) > 0:
         total    = nlp.get("source_count", 0)
         estimate = nlp.get("source_estimate", 0)
         nlp_status = nlp.get("status", "OFFLINE")
-        status_color = "#4ade80" if nlp_status == "LIVE" else "#fbbf24" if nlp_status == "DEGRADED" else "#f87171"
+        status_color = _NLP_STATUS_COLORS.get(nlp_status, "#f87171")
         st.markdown(f'<div class="metric-box"><div class="dim">Data Pipeline</div>'
                     f'<div style="font-size:16px;font-weight:700;color:{status_color}">{nlp_status}</div>'
                     f'<div class="dim">T1 (CryptoPanic): {t1_count}<br>'
@@ -225,15 +246,15 @@ if nlp and nlp.get("source_count", 0) > 0:
                     unsafe_allow_html=True)
     with n2:
         sent = nlp.get("sentiment_score", 0)
-        sent_color = "#4ade80" if sent > 0.1 else "#f87171" if sent < -0.1 else "#fbbf24"
+        sent_color = classify(sent, _SENT_BINS, _SENT_COLORS)
         st.markdown(f'<div class="metric-box"><div class="dim">Sentiment Score</div>'
                     f'<div style="font-size:24px;font-weight:700;color:{sent_color}">{sent:+.4f}</div>'
                     f'<div class="dim">Half-life: {nlp.get("decay_halflife_hours", 3.0)}h</div></div>',
                     unsafe_allow_html=True)
     with n3:
         conf_idx = nlp.get("confusion_index", 0)
-        conf_color = "#4ade80" if conf_idx < 0.3 else "#fbbf24" if conf_idx < 0.6 else "#f87171"
-        conf_label = "LOW" if conf_idx < 0.3 else "MEDIUM" if conf_idx < 0.6 else "HIGH"
+        conf_color = classify(conf_idx, _CONFUSION_BINS, _CONFUSION_COLORS)
+        conf_label = classify(conf_idx, _CONFUSION_BINS, _CONFUSION_LABELS)
         st.markdown(f'<div class="metric-box"><div class="dim">Confusion Index</div>'
                     f'<div style="font-size:24px;font-weight:700;color:{conf_color}">{conf_idx:.4f}</div>'
                     f'<div class="dim">σ of sentiments · {conf_label}</div></div>',
@@ -252,9 +273,9 @@ if nlp and nlp.get("source_count", 0) > 0:
     headlines = nlp.get("top_headlines", [])[:5]
     if headlines:
         h_rows = []
-        for h in headlines:
+        score_icons = classify([h.get("final_score", 0) for h in headlines], _HEADLINE_BINS, _HEADLINE_ICONS)
+        for h, score_icon in zip(headlines, score_icons):
             score = h.get("final_score", 0)
-            score_icon = "🟢" if score > 0.05 else "🔴" if score < -0.05 else "⚪"
             cats = ", ".join(h.get("catalysts", [])).upper()
             h_rows.append({
                 "": score_icon,
@@ -81,10 +81,17 @@ import struct
 import base64
 import math
 import io
+import asyncio
+import inspect
 import traceback
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta, UTC
 from pathlib import Path
 
+# Streamlit renamed use_container_width to width='stretch'; pick the spelling once
+_PLOT_STRETCH = ({'width': 'stretch'} if 'width' in inspect.signature(st.plotly_chart).parameters
+                 else {'use_container_width': True})
+
 try:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -94,11 +101,25 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     requests = None
 
+# One keep-alive session shared by the dashboard and the Sentinel thread:
+# TLS is negotiated once per host instead of once per call
+_SESSION = None
+if requests:
+    _SESSION = requests.Session()
+    _SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+try:
+    from orjson import loads as _json_loads  # SIMD parser, parses straight from bytes
+except ImportError:
+    from json import loads as _json_loads
+
 try:
     import ccxt
+    import ccxt.async_support as ccxt_async
     CCXT_AVAILABLE = True
 except ImportError:
     CCXT_AVAILABLE = False
@@ -112,6 +133,8 @@ for _p in [BASE_DIR, _MODULES_DIR, _DASHBOARDS_DIR]:
     if _p not in sys.path:
         sys.path.insert(0, _p)
 
+from labels import CONF_BINS, CONF_LABELS, DIV_BINS, DIV_LABELS, classify, classify_fg
+
 _ADAPTER_AVAILABLE = False
 _adapter = None
 
@@ -220,9 +243,14 @@ except ImportError:
     except ImportError:
         BACKTEST_AVAILABLE = False
 
+# Streamlit re-executes this script on every interaction; only force-reload the
+# large modules while developing them (ELITE_DEV_RELOAD=1)
+_DEV_RELOAD = bool(os.getenv("ELITE_DEV_RELOAD"))
+
 try:
     import dudu_overlay
-    importlib.reload(dudu_overlay)
+    if _DEV_RELOAD:
+        importlib.reload(dudu_overlay)
     from dudu_overlay import (render_projection_tab, compute_divergence_eigenvalue,
                               apply_spectral_boost, build_divergence_series,
                               build_vol_cone)
@@ -254,10 +282,11 @@ except ImportError:
 
 try:
     import gemini_chat_module_ELITE_v20
-    importlib.reload(gemini_chat_module_ELITE_v20)
+    if _DEV_RELOAD:
+        importlib.reload(gemini_chat_module_ELITE_v20)
     from gemini_chat_module_ELITE_v20 import render_gemini_sidebar_elite, prepare_elite_dashboard_data
     GEMINI_AVAILABLE = True
-    print("[OK] Gemini AI loaded (Google Ultra) - FORCE RELOADED")
+    print(f"[OK] Gemini AI loaded (Google Ultra){' - FORCE RELOADED' if _DEV_RELOAD else ''}")
 except ImportError:
     GEMINI_AVAILABLE = False
     print("[WARN] Gemini AI not available")
@@ -366,6 +395,7 @@ BAYESIAN_NEUTRAL_PRIOR = 55.0   # [FIX-5] The one true prior
 KELLY_MAX_PCT = 5.0             # [FIX-3] Protocol max Kelly
 WYCKOFF_MIN_CONDITIONS = 4      # [FIX-9] Minimum Wyckoff conditions for gate
 CURRENT_PHASE = "Whipsaw Defense (Gene Silencing Active)"
+MAX_CHART_BARS = 500             # Bars sent to the browser per price chart
 
 
 # ============================================================================
@@ -507,9 +537,8 @@ def generate_market_condition_text(chaos, fear_greed, regime, diffusion_score, v
 # DESIGN SYSTEM -- Bloomberg Terminal Grade
 # ============================================================================
 
-def load_css():
-    """ELITE v20 INSTITUTIONAL DESIGN - Bloomberg Terminal Grade CSS."""
-    institutional_css = """
+# ELITE v20 INSTITUTIONAL DESIGN - Bloomberg Terminal Grade CSS.
+INSTITUTIONAL_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&family=JetBrains+Mono:wght@300;400;500;600;700&family=Space+Mono:wght@400;700&display=swap');
     :root {
@@ -637,7 +666,19 @@ def load_css():
     .status-caution { color: var(--warning); }
     </style>
     """
-    st.markdown(institutional_css, unsafe_allow_html=True)
+# Built once at import with indentation/newlines stripped, so each rerun's delta
+# message carries a compact string
+_INSTITUTIONAL_CSS_MIN = ' '.join(line.strip() for line in INSTITUTIONAL_CSS.splitlines() if line.strip())
+
+
+def load_css():
+    """Inject the institutional CSS.
+
+    Emitted on every run: Streamlit drops any element a rerun does not
+    re-render, so a once-per-session guard would strip the styles after the
+    first interaction.
+    """
+    st.markdown(_INSTITUTIONAL_CSS_MIN, unsafe_allow_html=True)
 
 load_css()
 
@@ -654,12 +695,61 @@ def init_elite_system():
     return EliteDashboardAdapter(cryptoquant_api_key=cryptoquant_key, glassnode_api_key=glassnode_key)
 
 
+@st.cache_resource
+def _sentinel_handle():
+    """Process-wide Sentinel slot (plain module globals are reset on every rerun)."""
+    return {'lock': threading.Lock(), 'started': False, 'thread': None}
+
+
+def _sentinel_alive():
+    t = _sentinel_handle()['thread']
+    return t is not None and t.is_alive()
+
+
+# Bars per OHLCV fetch for both the page and the Sentinel: with the same window
+# their (symbol, interval, bar) keys match and they share _analysis_cache entries
+_OHLCV_LIMIT = 200
+_ANALYSIS_CACHE_SIZE = 32
+
+
+@st.cache_resource
+def _analysis_cache():
+    """Process-wide LRU of analyze_elite results, shared by the page and the Sentinel."""
+    return {'lock': threading.Lock(), 'entries': OrderedDict()}
+
+
+def _analyze_cached(cache, adapter, df, key):
+    """analyze_elite(df), reused while `key` repeats.
+
+    key = (symbol, interval, last_ts_ms, n_bars, last_close); the close tells a
+    Heikin-Ashi frame apart from the raw candles it was built from. Entries
+    expire once a newer bar of the same symbol/interval is stored.
+    """
+    with cache['lock']:
+        if key in cache['entries']:
+            cache['entries'].move_to_end(key)
+            return cache['entries'][key]
+    results = adapter.analyze_elite(df=df, exposure_pct=15.0)
+    with cache['lock']:
+        entries = cache['entries']
+        for old in [k for k in entries if k[:2] == key[:2] and k[2] < key[2]]:
+            del entries[old]
+        entries[key] = results
+        if len(entries) > _ANALYSIS_CACHE_SIZE:
+            entries.popitem(last=False)
+    return results
+
+
 @st.cache_resource
 def start_sentinel_daemon():
-    for t in threading.enumerate():
-        if t.name == "SentinelWorker":
+    handle = _sentinel_handle()
+    with handle['lock']:
+        if handle['started']:
             print("[OK] Sentinel already active")
             return
+        handle['started'] = True
+    analysis_cache = _analysis_cache()  # resolved here, on the script thread
+    fg_cache = _fg_cache()
 
     def sentinel_loop():
         print("[OK] Sentinel Active: Monitoring market every 15m...")
@@ -674,38 +764,46 @@ def start_sentinel_daemon():
             glassnode_key = os.getenv('GLASSNODE_API_KEY')
             adapter = EliteDashboardAdapter(cryptoquant_api_key=cryptoquant_key, glassnode_api_key=glassnode_key)
 
+            # Clients are built once; their HTTP sessions (and loaded markets) persist across ticks
+            exchanges = {}
+            if CCXT_AVAILABLE:
+                for ex_name in ['bybit', 'kraken', 'okx', 'binance']:
+                    exchanges[ex_name] = getattr(ccxt, ex_name)()
+
             while True:
                 try:
-                    exchange = None
-                    if CCXT_AVAILABLE:
-                        for ex_name in ['bybit', 'kraken', 'okx', 'binance']:
-                            try:
-                                exchange = getattr(ccxt, ex_name)()
-                                ohlcv = exchange.fetch_ohlcv('BTC/USDT', '1h', limit=100)
-                                break
-                            except Exception:
-                                continue
-
-                    if exchange is None:
+                    ohlcv = None
+                    for ex_name, exchange in exchanges.items():
+                        try:
+                            ohlcv = exchange.fetch_ohlcv('BTC/USDT', '1h', limit=_OHLCV_LIMIT)
+                            break
+                        except Exception:
+                            continue
+
+                    if ohlcv is None:
                         print("[WARN] Sentinel: All exchanges failed or ccxt not available")
                         time.sleep(900)
                         continue
 
-                    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                    df.set_index('timestamp', inplace=True)
-                    current_price = df['close'].iloc[-1]
-                    results = adapter.analyze_elite(df, exposure_pct=15.0)
+                    # analyze_elite only reads the price columns, so skip the DatetimeIndex
+                    arr = np.asarray(ohlcv, dtype=np.float64)
+                    current_price = float(arr[-1, 4])
+                    df = pd.DataFrame(arr[:, 1:], columns=['open', 'high', 'low', 'close', 'volume'])
+                    key = ('BTCUSDT', '1h', int(arr[-1, 0]), len(arr), current_price)
+                    results = _analyze_cached(analysis_cache, adapter, df, key)
                     current_action = results.get('final_action', 'HOLD')
                     confidence = results.get('confidence', 0)
                     manifold_score = results.get('elite_score', 0)
+                    fear_greed = get_fg_cached(fg_cache)
 
                     if current_action != last_action:
                         notifier.send_smart_alert({
                             'action': current_action, 'confidence': confidence,
                             'price': current_price, 'dna': manifold_score,
                             'div_label': "NEUTRAL", 'div_score': 50,
-                            'sentiment': 50, 'strategy_hint': "Sentinel Auto"
+                            'sentiment': fear_greed,
+                            'sent_label': classify_fg(fear_greed),
+                            'strategy_hint': "Sentinel Auto"
                         })
                         last_action = current_action
                 except Exception as e:
@@ -715,6 +813,7 @@ def start_sentinel_daemon():
             print(f"[ERR] Sentinel init failed: {e}")
 
     t = threading.Thread(target=sentinel_loop, name="SentinelWorker", daemon=True)
+    handle['thread'] = t
     t.start()
 
 
@@ -722,39 +821,88 @@ def start_sentinel_daemon():
 # DATA FETCHING
 # ============================================================================
 
+async def _race_ohlcv(pair, interval, limit=_OHLCV_LIMIT):
+    """Ask every exchange at once; the first good answer wins, the rest are cancelled."""
+    exchanges = [getattr(ccxt_async, ex_name)() for ex_name in ['bybit', 'kraken', 'okx', 'binance']]
+    tasks = {asyncio.ensure_future(ex.fetch_ohlcv(pair, interval, limit=limit)): ex.id for ex in exchanges}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return tasks[task], task.result()
+                print(f"[WARN] {tasks[task]} failed: {task.exception()}")
+        return None, None
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await asyncio.gather(*(ex.close() for ex in exchanges), return_exceptions=True)
+
+
 @st.cache_data(ttl=120)
 def fetch_crypto_data(symbol="BTCUSDT", interval="1h"):
     if not CCXT_AVAILABLE:
         st.error("ccxt not installed!")
         return pd.DataFrame()
     pair = symbol.replace("USDT", "/USDT")
-    for ex_name in ['bybit', 'kraken', 'okx', 'binance']:
-        try:
-            exchange = getattr(ccxt, ex_name)()
-            ohlcv = exchange.fetch_ohlcv(pair, interval, limit=200)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            print(f"[OK] Data from {ex_name}")
-            return df
-        except Exception as e:
-            print(f"[WARN] {ex_name} failed: {e}")
-            continue
-    st.error("All exchanges failed! Check your internet connection.")
-    return pd.DataFrame()
+    ex_name, ohlcv = asyncio.run(_race_ohlcv(pair, interval))
+    if ohlcv is None:
+        st.error("All exchanges failed! Check your internet connection.")
+        return pd.DataFrame()
+    # One float64 block (no per-column dtype inference); the index is a datetime64 view of its ms column
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    index = pd.DatetimeIndex(arr[:, 0].astype(np.int64).view('datetime64[ms]'), name='timestamp')
+    df = pd.DataFrame(arr[:, 1:], columns=['open', 'high', 'low', 'close', 'volume'], index=index)
+    print(f"[OK] Data from {ex_name}")
+    return df
 
 
-@st.cache_data(ttl=600)
-def fetch_fear_greed():
+# alternative.me publishes one Fear & Greed reading per day, at a time of its
+# choosing; it is re-read once an hour so a new day's reading shows up soon
+# after it is published
+_FG_TTL = 3600
+
+
+@st.cache_resource
+def _fg_cache():
+    """Process-wide Fear & Greed slot, shared by every session and the Sentinel."""
+    return {'lock': threading.Lock(), 'expires': 0.0, 'value': 50}
+
+
+def get_fg_cached(cache=None):
+    """Latest Fear & Greed value; the Sentinel passes the slot it resolved on the script thread."""
+    if cache is None:
+        cache = _fg_cache()
+    now = time.monotonic()
+    with cache['lock']:
+        if now < cache['expires']:
+            return cache['value']
     if not requests:
         return 50
     try:
         url = "https://api.alternative.me/fng/"
-        r = requests.get(url, timeout=10)
-        data = r.json()
-        return int(data['data'][0]['value'])
+        r = _SESSION.get(url, timeout=10)
+        data = _json_loads(r.content)
+        value = int(data['data'][0]['value'])
     except Exception:
         return 50
+    with cache['lock']:
+        cache['value'] = value
+        cache['expires'] = now + _FG_TTL
+    return value
+
+
+@st.cache_data(ttl=600)
+def fetch_fear_greed():
+    return get_fg_cached()
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def fetch_macro_pulse(_chat):
+    """Gemini macro snapshot (ETF flows, VIX, S&P), shared by every session for 2 minutes."""
+    return _chat.fetch_macro_pulse()
 
 
 @st.cache_data(ttl=60)
@@ -777,9 +925,9 @@ def fetch_btc_spot_price():
     # Failover to CoinGecko
     if requests:
         try:
-            r = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true", timeout=5)
+            r = _SESSION.get("https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true", timeout=5)
             r.raise_for_status()
-            d = r.json()["bitcoin"]
+            d = _json_loads(r.content)["bitcoin"]
             return {
                 "price": round(d.get("usd", 0), 2),
                 "change_24h": round(d.get("usd_24h_change", 0), 2),
@@ -994,6 +1142,17 @@ def load_system_data(symbol, interval, use_heikin_ashi, momentum_placeholder):
     return df, fear_greed, current_price, data_timestamp
 
 
+def _ohlcv_arrays(df):
+    """Column arrays (and bar timestamps) for the chart tabs, taken once per run.
+
+    The projection and divergence renderers only read these columns, so they
+    get views instead of the frame (which picks up indicator columns in Tab 1).
+    """
+    arrays = {col: df[col].to_numpy(dtype=np.float64) for col in ('close', 'high', 'low', 'volume')}
+    arrays['ts'] = df.index.values.astype('datetime64[ns]')
+    return arrays
+
+
 
 def run_elite_analysis(df, symbol, interval, enable_elite, current_price, memory_logger):
     """Execute multi-layer Elite analysis suite."""
@@ -1001,13 +1160,15 @@ def run_elite_analysis(df, symbol, interval, enable_elite, current_price, memory
     if enable_elite:
         with st.spinner("Running Elite Analysis (Standalone)..."):
             try:
+                key = (symbol, interval, int(df.index[-1].value // 1_000_000), len(df),
+                       float(df['close'].iloc[-1]))
                 if _adapter is not None:
-                    elite_results = _adapter.analyze_elite(df=df, exposure_pct=15.0)
+                    elite_results = _analyze_cached(_analysis_cache(), _adapter, df, key)
                 elif ELITE_AVAILABLE:
                     # Fallback to local init if global adapter failed
                     temp_adapter = init_elite_system()
                     if temp_adapter:
-                        elite_results = temp_adapter.analyze_elite(df=df, exposure_pct=15.0)
+                        elite_results = _analyze_cached(_analysis_cache(), temp_adapter, df, key)
             except Exception as _ea_e:
                 st.warning(f"Elite analysis error: {_ea_e}")
                 elite_results = {}
@@ -1277,10 +1438,7 @@ def render_interference_dark_signals(elite_results):
             fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0),
                               paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
                               font=dict(color="rgba(255,255,255,0.7)"))
-            try:
-                st.plotly_chart(fig, width="stretch", config={'displayModeBar': False})
-            except TypeError:
-                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+            st.plotly_chart(fig, config={'displayModeBar': False}, **_PLOT_STRETCH)
         else:
             st.info("Awaiting Monolithic Initialization...")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -1351,7 +1509,12 @@ def render_advanced_diagnostics(elite_results, df, unified_kelly, unified_gate):
 
 
 def render_macro_pulse(diffusion_score):
-    """Render real-time macro pulse from Google Finance."""
+    """Render real-time macro pulse from Google Finance.
+
+    Wrapped as a fragment where Streamlit supports it: it then refreshes on its
+    own every 2 minutes (the macro cache TTL) without rerunning the OHLCV fetch
+    and Elite pipeline.
+    """
     if not GEMINI_AVAILABLE:
         return
 
@@ -1362,7 +1525,7 @@ def render_macro_pulse(diffusion_score):
         if 'gemini_chat' not in st.session_state:
             from gemini_chat_module_ELITE_v20 import EliteGeminiChat
             st.session_state.gemini_chat = EliteGeminiChat()
-        macro_data = st.session_state.gemini_chat.fetch_macro_pulse()
+        macro_data = fetch_macro_pulse(st.session_state.gemini_chat)
         if macro_data.get('status') == 'live':
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -1394,6 +1557,10 @@ def render_macro_pulse(diffusion_score):
         return {}
 
 
+if hasattr(st, 'fragment'):
+    render_macro_pulse = st.fragment(run_every=120)(render_macro_pulse)
+
+
 def extract_geopol_shield(elite_results, violence_score):
     """Detect geopolitical shocks from NLP headlines and nature events."""
     active = False
@@ -1593,14 +1760,14 @@ def render_execution_gates_tab(enable_elite, elite_system, elite_results, df):
         st.warning("Elite Engine is disabled or unavailable")
 
 
-def render_quantum_diagnostics_tab(df, regime, confidence, violence_score):
+def render_quantum_diagnostics_tab(arrays, regime, confidence, violence_score):
     """Render Quantum Diagnostics (DUDU Projection) tab content."""
     st.subheader("Manifold Projection (DUDU Overlay)")
     st.caption("Past: Regime Filter | Present: Dynamic Vol Cone | Future: Bootstrap Paths")
     if DUDU_AVAILABLE:
         qc_payload = {'regime': regime, 'confidence': confidence, 'qc_codes': [regime]}
         try:
-            render_projection_tab(st, df, qc_payload=qc_payload, horizon=48,
+            render_projection_tab(st, arrays, qc_payload=qc_payload, horizon=48,
                                  current_regime=regime, current_violence=violence_score,
                                  key="dudu_projection_tab3")
             st.info("**Defense Check**: If 'Windows used' < 20, reduce position size by 0.5x")
@@ -1610,13 +1777,13 @@ def render_quantum_diagnostics_tab(df, regime, confidence, violence_score):
         st.warning("DUDU Overlay module not available")
 
 
-def render_liquidity_xray_tab(df, elite_results):
+def render_liquidity_xray_tab(arrays, elite_results):
     """Render Liquidity X-Ray tab content."""
     st.subheader("Liquidity X-Ray (Price vs OnChain)")
     st.caption("Green = Bullish Divergence (Whales buying) | Red = Bearish Divergence")
     if DIVERGENCE_AVAILABLE:
         try:
-            render_divergence_chart(st, df, elite_results if elite_results else {})
+            render_divergence_chart(st, arrays, elite_results if elite_results else {})
         except Exception as e:
             st.error(f"Divergence Error: {e}")
     else:
@@ -1667,10 +1834,7 @@ def render_simulation_lab_tab():
                         fig_sim.update_layout(template='plotly_dark', title="Victory Protocol Performance (Relative Growth)",
                                              margin=dict(l=0, r=0, t=40, b=0), paper_bgcolor='rgba(0,0,0,0)',
                                              plot_bgcolor='rgba(0,0,0,0)', height=400)
-                        try:
-                            st.plotly_chart(fig_sim, width="stretch")
-                        except TypeError:
-                            st.plotly_chart(fig_sim, use_container_width=True)
+                        st.plotly_chart(fig_sim, **_PLOT_STRETCH)
                         if sim_results['trades']:
                             with st.expander("View Trade Execution Logs"):
                                 for t in sim_results['trades']:
@@ -1684,7 +1848,7 @@ def render_simulation_lab_tab():
         st.warning("Simulation Engine (MonolithBacktest) not available.")
 
 
-def render_spectral_dudu_tab(df, _spectral, _p10_boosted, regime, confidence, violence_score, final_action):
+def render_spectral_dudu_tab(arrays, _spectral, _p10_boosted, regime, confidence, violence_score, final_action):
     """Render Spectral Divergence & DUDU tab content."""
     st.markdown("""
     <div style="font-size:0.65rem;letter-spacing:3px;color:var(--text-muted);font-family:var(--font-mono);margin-bottom:12px;">
@@ -1747,7 +1911,7 @@ def render_spectral_dudu_tab(df, _spectral, _p10_boosted, regime, confidence, vi
                               xaxis=dict(gridcolor="rgba(255,255,255,0.05)"),
                               yaxis=dict(gridcolor="rgba(255,255,255,0.05)"),
                               font=dict(color="#9ca3af"))
-        st.plotly_chart(_fig_fft, use_container_width=True)
+        st.plotly_chart(_fig_fft, **_PLOT_STRETCH)
         st.caption(f"Dominant frequency f={_freq} (eigenvalue {_ev:.4f}) | Input: whale-gap divergence = z-score(close) x diffusion/100")
     else:
         st.info("Insufficient divergence history for FFT -- need >=8 bars. Refresh after data loads.")
@@ -1755,9 +1919,9 @@ def render_spectral_dudu_tab(df, _spectral, _p10_boosted, regime, confidence, vi
     st.markdown("---")
 
     st.subheader("DUDU Manifold Projection (Spectral-Boosted Cone)")
-    if DUDU_AVAILABLE and not df.empty:
+    if DUDU_AVAILABLE and len(arrays['close']):
         qc_payload = {"regime": regime, "confidence": confidence}
-        render_projection_tab(st, df, qc_payload=qc_payload, horizon=48,
+        render_projection_tab(st, arrays, qc_payload=qc_payload, horizon=48,
                              current_regime=regime, current_violence=violence_score,
                              key="dudu_spectral_tab7")
         if _p10_boosted:
@@ -1796,7 +1960,7 @@ def render_bayesian_waterfall_tab(elite_results, unified_posterior, diffusion_sc
                 "prior": BAYESIAN_NEUTRAL_PRIOR,
                 "diffusion_score": float(diffusion_score),
                 "fear_greed": int(fear_greed),
-                "fg_label": "Extreme Fear" if fear_greed < 20 else "Fear" if fear_greed < 40 else "Neutral" if fear_greed < 60 else "Greed" if fear_greed < 80 else "Extreme Greed",
+                "fg_label": classify_fg(fear_greed),
                 "book_imbalance": float(_onchain_wf.get('book_imbalance', 0) or 0),
                 "chaos_penalty": float(violence_score / 5.0),
                 "nlp_sentiment": _nlp_wf_val,
@@ -1871,41 +2035,53 @@ def render_ai_sidebar_components(symbol, current_price, manifold_score, unified_
         )
         render_gemini_sidebar_elite(dashboard_data)
 
+    # Called inside the sidebar: a fragment cannot open st.sidebar itself
     with st.sidebar:
-        st.markdown("---")
-        st.markdown("""
-        <div style="font-family:var(--font-mono); font-size:0.65rem; letter-spacing:1.5px;
-                    color:var(--text-secondary); margin-bottom:6px;">
-            MOBILE FORTRESS
-        </div>
-        """, unsafe_allow_html=True)
-        if MOBILE_AVAILABLE:
-            st.success("Telegram Connected")
-            col_a, col_b = st.columns(2)
-            with col_a:
-                if st.button("Test Alert", key="test_telegram"):
-                    mobile_notifier.test_connection()
-                    st.success("Sent!")
-            with col_b:
-                if st.button("Daily Brief", key="daily_brief"):
-                    brief_data = {
-                        'action': final_action, 'confidence': unified_posterior / 100.0,
-                        'price': current_price, 'dna': manifold_score,
-                        'div_label': "BULLISH" if diffusion_score > 60 else "BEARISH" if diffusion_score < 40 else "NEUTRAL",
-                        'div_score': diffusion_score, 'sentiment': fear_greed,
-                        'strategy_hint': f"Regime: {regime}"
-                    }
-                    mobile_notifier.send_smart_alert(brief_data)
-                    st.success("Sent!")
-            if final_action in ["SNIPER_BUY", "BUY"] and unified_posterior > 80:
-                if 'last_alert_action' not in st.session_state or st.session_state.last_alert_action != final_action:
-                    mobile_notifier.alert_victory_vector(score=manifold_score, kelly_fraction=unified_kelly / 100.0, action="BUY")
-                    st.session_state.last_alert_action = final_action
-                    st.toast("Alert sent to phone!")
-        else:
-            st.warning("Not configured")
-            st.caption("Add to secrets.toml:")
-            st.code('TELEGRAM_BOT_TOKEN = "..."\nTELEGRAM_CHAT_ID = "..."', language="toml")
+        render_mobile_fortress(current_price, manifold_score, unified_posterior, diffusion_score,
+                               fear_greed, unified_kelly, final_action, regime)
+
+
+def render_mobile_fortress(current_price, manifold_score, unified_posterior, diffusion_score,
+                           fear_greed, unified_kelly, final_action, regime):
+    """Render the Telegram panel; as a fragment its buttons rerun only this panel."""
+    st.markdown("---")
+    st.markdown("""
+    <div style="font-family:var(--font-mono); font-size:0.65rem; letter-spacing:1.5px;
+                color:var(--text-secondary); margin-bottom:6px;">
+        MOBILE FORTRESS
+    </div>
+    """, unsafe_allow_html=True)
+    if MOBILE_AVAILABLE:
+        st.success("Telegram Connected")
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button("Test Alert", key="test_telegram"):
+                mobile_notifier.test_connection()
+                st.success("Sent!")
+        with col_b:
+            if st.button("Daily Brief", key="daily_brief"):
+                brief_data = {
+                    'action': final_action, 'confidence': unified_posterior / 100.0,
+                    'price': current_price, 'dna': manifold_score,
+                    'div_label': classify(diffusion_score, DIV_BINS, DIV_LABELS),
+                    'div_score': diffusion_score, 'sentiment': fear_greed,
+                    'strategy_hint': f"Regime: {regime}"
+                }
+                mobile_notifier.send_smart_alert(brief_data)
+                st.success("Sent!")
+        if final_action in ["SNIPER_BUY", "BUY"] and unified_posterior > 80:
+            if 'last_alert_action' not in st.session_state or st.session_state.last_alert_action != final_action:
+                mobile_notifier.alert_victory_vector(score=manifold_score, kelly_fraction=unified_kelly / 100.0, action="BUY")
+                st.session_state.last_alert_action = final_action
+                st.toast("Alert sent to phone!")
+    else:
+        st.warning("Not configured")
+        st.caption("Add to secrets.toml:")
+        st.code('TELEGRAM_BOT_TOKEN = "..."\nTELEGRAM_CHAT_ID = "..."', language="toml")
+
+
+if hasattr(st, 'fragment'):
+    render_mobile_fortress = st.fragment(render_mobile_fortress)
 
 
 def render_footer(data_timestamp, macro_data):
@@ -1935,7 +2111,7 @@ def render_quality_control_tab(df, elite_results, interval, current_price, confi
     """Render Quality Control tab content."""
     if QC_AVAILABLE:
         try:
-            _sentinel_alive = any(t.name == "SentinelWorker" for t in threading.enumerate())
+            _sentinel_running = _sentinel_alive()
             _qc_module_status = {
                 "Elite": ELITE_AVAILABLE, "DUDU": DUDU_AVAILABLE,
                 "Divergence": DIVERGENCE_AVAILABLE, "Gemini": GEMINI_AVAILABLE,
@@ -1954,7 +2130,7 @@ def render_quality_control_tab(df, elite_results, interval, current_price, confi
                 bayesian_posterior=unified_posterior,
                 manifold_score=manifold_score, fear_greed=fear_greed,
                 violence_score=violence_score, diffusion_score=diffusion_score,
-                module_status=_qc_module_status, sentinel_running=_sentinel_alive,
+                module_status=_qc_module_status, sentinel_running=_sentinel_running,
                 exchange_source="multi-fallback",
             )
         except Exception as _qc_err:
@@ -1964,11 +2140,23 @@ def render_quality_control_tab(df, elite_results, interval, current_price, confi
         st.warning("qc_dashboard.py not found in dashboards/ folder")
 
 
-def render_strategic_overview_tab(df, final_action, fear_greed, unified_posterior, regime, violence_score):
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def _sma(_close, symbol, interval, last_ts, last_close, window):
+    """Simple moving average via one cumulative sum, aligned with close[window-1:].
+
+    Keyed on the last bar (timestamp and close, so a Heikin-Ashi toggle misses)
+    rather than on the array itself.
+    """
+    c = np.cumsum(_close, dtype=np.float64)
+    return (c[window - 1:] - np.concatenate(([0.0], c[:-window]))) / window
+
+
+def render_strategic_overview_tab(df, final_action, fear_greed, unified_posterior, regime, violence_score,
+                                  symbol, interval):
     """Render the Strategic Overview tab content."""
     _badge_class = "action-badge-buy" if final_action in ['BUY', 'ADD', 'SNIPER_BUY'] else ("action-badge-sell" if final_action in ['SELL', 'REDUCE'] else "action-badge-hold")
     _badge_label = final_action
-    _fg_label = "Extreme Fear" if fear_greed < 20 else "Fear" if fear_greed < 40 else "Neutral" if fear_greed < 60 else "Greed" if fear_greed < 80 else "Extreme Greed"
+    _fg_label = classify_fg(fear_greed)
     _fg_color = "var(--danger)" if fear_greed < 30 else "var(--success)" if fear_greed > 70 else "var(--warning)"
     _signal_html = _render_signal_strength_html(unified_posterior / 100.0)
     _violence_fmt = f"{violence_score:.2f}"
@@ -2009,31 +2197,38 @@ def render_strategic_overview_tab(df, final_action, fear_greed, unified_posterio
     df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
     df['macd_hist'] = df['macd'] - df['macd_signal']
 
-    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.05,
-                       row_heights=[0.6, 0.2, 0.2],
-                       subplot_titles=("STRATEGIC PRICE ACTION", "MACD (12,26,9)", "RSI (14)"))
-    fig.add_trace(go.Candlestick(x=df.index, open=df['open'], high=df['high'], low=df['low'], close=df['close'], name='Price'))
     std = df['close'].rolling(20).std()
     df['BB_mid'] = df['close'].rolling(20).mean()
     df['BB_upper'] = df['BB_mid'] + (std * 2)
     df['BB_lower'] = df['BB_mid'] - (std * 2)
-    fig.add_trace(go.Scatter(x=df.index, y=df['BB_upper'], line=dict(color='rgba(176,196,222,0.2)', width=1), name='BB Upper', showlegend=False))
-    fig.add_trace(go.Scatter(x=df.index, y=df['BB_lower'], line=dict(color='rgba(176,196,222,0.2)', width=1), fill='tonexty', fillcolor='rgba(176,196,222,0.05)', name='BB Lower', showlegend=False))
     df['vwap'] = (df['close'] * df['volume']).cumsum() / df['volume'].cumsum()
-    fig.add_trace(go.Scatter(x=df.index, y=df['vwap'], line=dict(color='#06e8f9', width=2, dash='dot'), name='VWAP'))
     df['ema_fast'] = df['close'].ewm(span=20).mean()
     df['ema_slow'] = df['close'].ewm(span=50).mean()
-    fig.add_trace(go.Scatter(x=df.index, y=df['ema_fast'], line=dict(color='#10B981', width=1.5), name='EMA 20'))
-    fig.add_trace(go.Scatter(x=df.index, y=df['ema_slow'], line=dict(color='#EF4444', width=1.5), name='EMA 50'))
-    fig.add_trace(go.Scatter(x=[df.index[0]], y=[None], mode='lines', line=dict(color='rgba(176,196,222,0.4)'), name='Bollinger (20,2)'))
     if len(df) >= 200:
-        sma200 = df['close'].rolling(200).mean()
-        fig.add_trace(go.Scatter(x=df.index, y=sma200, mode='lines', name='SMA200', line=dict(color='orange', width=2, dash='longdash')))
-    fig.add_trace(go.Scatter(x=df.index, y=df['macd'], line=dict(color='#06e8f9', width=1.5), name='MACD'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=df.index, y=df['macd_signal'], line=dict(color='#EF4444', width=1), name='Signal'), row=2, col=1)
-    fig.add_trace(go.Bar(x=df.index, y=df['macd_hist'], name='Hist',
-                         marker_color=['#10B981' if v >= 0 else '#EF4444' for v in df['macd_hist']]), row=2, col=1)
-    fig.add_trace(go.Scatter(x=df.index, y=df['rsi'], line=dict(color='#B0C4DE', width=1.5), name='RSI'), row=3, col=1)
+        close = df['close'].to_numpy(dtype=np.float64)
+        sma200 = _sma(close, symbol, interval, int(df.index[-1].value), float(close[-1]), 200)
+        df['sma200'] = np.concatenate((np.full(199, np.nan), sma200))
+
+    # Indicators are computed on the full history; only the last MAX_CHART_BARS
+    # are shipped to the browser, and line traces go through WebGL (Scattergl)
+    plot_df = df.tail(MAX_CHART_BARS)
+    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.05,
+                       row_heights=[0.6, 0.2, 0.2],
+                       subplot_titles=("STRATEGIC PRICE ACTION", "MACD (12,26,9)", "RSI (14)"))
+    fig.add_trace(go.Candlestick(x=plot_df.index, open=plot_df['open'], high=plot_df['high'], low=plot_df['low'], close=plot_df['close'], name='Price'))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['BB_upper'], line=dict(color='rgba(176,196,222,0.2)', width=1), name='BB Upper', showlegend=False))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['BB_lower'], line=dict(color='rgba(176,196,222,0.2)', width=1), fill='tonexty', fillcolor='rgba(176,196,222,0.05)', name='BB Lower', showlegend=False))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['vwap'], line=dict(color='#06e8f9', width=2, dash='dot'), name='VWAP'))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['ema_fast'], line=dict(color='#10B981', width=1.5), name='EMA 20'))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['ema_slow'], line=dict(color='#EF4444', width=1.5), name='EMA 50'))
+    fig.add_trace(go.Scatter(x=[plot_df.index[0]], y=[None], mode='lines', line=dict(color='rgba(176,196,222,0.4)'), name='Bollinger (20,2)'))
+    if 'sma200' in plot_df:
+        fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['sma200'], mode='lines', name='SMA200', line=dict(color='orange', width=2, dash='longdash')))
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['macd'], line=dict(color='#06e8f9', width=1.5), name='MACD'), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['macd_signal'], line=dict(color='#EF4444', width=1), name='Signal'), row=2, col=1)
+    fig.add_trace(go.Bar(x=plot_df.index, y=plot_df['macd_hist'], name='Hist',
+                         marker_color=np.where(plot_df['macd_hist'] >= 0, '#10B981', '#EF4444')), row=2, col=1)
+    fig.add_trace(go.Scattergl(x=plot_df.index, y=plot_df['rsi'], line=dict(color='#B0C4DE', width=1.5), name='RSI'), row=3, col=1)
     fig.add_hline(y=70, line_dash="dash", line_color="rgba(239,68,68,0.5)", row=3, col=1)
     fig.add_hline(y=30, line_dash="dash", line_color="rgba(16,185,129,0.5)", row=3, col=1)
     fig.update_layout(template='plotly_dark', height=900, xaxis_rangeslider_visible=False, showlegend=True,
@@ -2041,22 +2236,16 @@ def render_strategic_overview_tab(df, final_action, fear_greed, unified_posterio
     fig.update_yaxes(title_text="Price", row=1, col=1)
     fig.update_yaxes(title_text="MACD", row=2, col=1)
     fig.update_yaxes(title_text="RSI", row=3, col=1)
-    try:
-        st.plotly_chart(fig, width="stretch", config={'displayModeBar': False})
-    except TypeError:
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    st.plotly_chart(fig, config={'displayModeBar': False}, **_PLOT_STRETCH)
 
-    colors = ['#10B981' if df['close'].iloc[i] >= df['open'].iloc[i] else '#EF4444' for i in range(len(df))]
+    colors = np.where(plot_df['close'] >= plot_df['open'], '#10B981', '#EF4444')
     fig_vol = go.Figure()
-    fig_vol.add_trace(go.Bar(x=df.index, y=df['volume'], name='Volume', marker_color=colors, opacity=0.8))
+    fig_vol.add_trace(go.Bar(x=plot_df.index, y=plot_df['volume'], name='Volume', marker_color=colors, opacity=0.8))
     fig_vol.update_layout(template='plotly_dark', height=150, margin=dict(l=0, r=0, t=0, b=0), showlegend=False,
                          paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
                          yaxis=dict(showgrid=False, showticklabels=True, side='right', tickfont=dict(size=8), nticks=3),
                          xaxis=dict(showgrid=False, showticklabels=False))
-    try:
-        st.plotly_chart(fig_vol, width="stretch", config={'displayModeBar': False})
-    except TypeError:
-        st.plotly_chart(fig_vol, use_container_width=True, config={'displayModeBar': False})
+    st.plotly_chart(fig_vol, config={'displayModeBar': False}, **_PLOT_STRETCH)
 
 
 def render_nlp_kelly_radar(elite_results, unified_kelly, unified_posterior, unified_gate):
@@ -2093,8 +2282,8 @@ def render_nlp_kelly_radar(elite_results, unified_kelly, unified_posterior, unif
         """, unsafe_allow_html=True)
 
     confusion = nlp_data.get('confusion_index', 0)
-    conf_label = 'LOW' if confusion < 0.15 else ('HIGH' if confusion > 0.35 else 'MEDIUM')
-    conf_color = 'var(--success)' if conf_label == 'LOW' else ('var(--danger)' if conf_label == 'HIGH' else 'var(--warning)')
+    conf_label = classify(confusion, CONF_BINS, CONF_LABELS)
+    conf_color = classify(confusion, CONF_BINS, ('var(--success)', 'var(--warning)', 'var(--danger)'))
     with n3:
         st.markdown(f"""
             <div class="metric-label">Confusion Index</div>
@@ -2174,6 +2363,7 @@ def main():
     # ========================================================================
     symbol, interval, enable_elite, use_heikin_ashi, momentum_placeholder = render_sidebar()
     df, fear_greed, current_price, data_timestamp = load_system_data(symbol, interval, use_heikin_ashi, momentum_placeholder)
+    arrays = _ohlcv_arrays(df)
 
     # ========================================================================
     # ELITE ANALYSIS
@@ -2296,7 +2486,8 @@ def main():
     # TAB 1: Strategic Overview
     # ========================================================================
     with tab1:
-        render_strategic_overview_tab(df, final_action, fear_greed, unified_posterior, regime, violence_score)
+        render_strategic_overview_tab(df, final_action, fear_greed, unified_posterior, regime, violence_score,
+                                      symbol, interval)
 
 
     # ========================================================================
@@ -2315,13 +2506,13 @@ def main():
     # TAB 3: Quantum Diagnostics
     # ========================================================================
     with tab3:
-        render_quantum_diagnostics_tab(df, regime, confidence, violence_score)
+        render_quantum_diagnostics_tab(arrays, regime, confidence, violence_score)
 
     # ========================================================================
     # TAB 4: Liquidity X-Ray
     # ========================================================================
     with tab4:
-        render_liquidity_xray_tab(df, elite_results)
+        render_liquidity_xray_tab(arrays, elite_results)
 
     # ========================================================================
     # TAB 6: Simulation Lab
@@ -2367,7 +2558,7 @@ def main():
     # TAB 7: SPECTRAL DIVERGENCE ENGINE
     # ========================================================================
     with tab7:
-        render_spectral_dudu_tab(df, _spectral, _p10_boosted, regime, confidence, violence_score, final_action)
+        render_spectral_dudu_tab(arrays, _spectral, _p10_boosted, regime, confidence, violence_score, final_action)
 
     # ========================================================================
     # TAB 10: QUALITY CONTROL
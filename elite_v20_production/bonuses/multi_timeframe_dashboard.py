@@ -13,7 +13,135 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+
+# =============================================================================
+# HEATMAP COLORS
+# =============================================================================
+
+# Red -> yellow -> green over the 0-100 score range
+_SCORE_RGB_STOPS = np.array([[255, 0, 0], [255, 255, 0], [0, 128, 0]], dtype=float)
+
+
+def _score_to_rgb(z: np.ndarray) -> np.ndarray:
+    """Map 0-100 scores onto the red/yellow/green scale as an RGB uint8 image"""
+    t = np.clip(np.asarray(z, dtype=float) / 100, 0, 1) * (len(_SCORE_RGB_STOPS) - 1)
+    lo = np.minimum(t.astype(int), len(_SCORE_RGB_STOPS) - 2)
+    frac = (t - lo)[..., None]
+    rgb = _SCORE_RGB_STOPS[lo] * (1 - frac) + _SCORE_RGB_STOPS[lo + 1] * frac
+    return rgb.astype(np.uint8)
+
+
+# Static parts of the heatmap figure, built once per process
+HEATMAP_TIMEFRAMES = ['1H', '4H', '1D']
+HEATMAP_METRICS = ['Manifold', 'Confidence', 'Diffusion', 'Overall']
+
+_HEATMAP_LAYOUT = dict(
+    title="📊 Multi-Timeframe Confluence Heatmap",
+    xaxis=dict(title="Timeframe", tickvals=list(range(len(HEATMAP_TIMEFRAMES))),
+               ticktext=HEATMAP_TIMEFRAMES),
+    yaxis=dict(title="Metric", tickvals=list(range(len(HEATMAP_METRICS))),
+               ticktext=HEATMAP_METRICS),
+    height=400
+)
+
+# One annotation per cell, row-major to match z_data.ravel()
+_HEATMAP_CELLS = [
+    dict(x=j, y=i, showarrow=False, font={"size": 16, "color": "white"})
+    for i in range(len(HEATMAP_METRICS))
+    for j in range(len(HEATMAP_TIMEFRAMES))
+]
+
+
+# =============================================================================
+# SIGNAL MATRIX
+# =============================================================================
+# signals_data arrives as {tf: {'manifold', 'confidence', 'diffusion', ...}}.
+# It is converted once into S[tf_idx, metric_idx] (rows 1h/4h/1d, columns
+# manifold/confidence/diffusion) which every method below shares.
+
+TIMEFRAMES = ['1h', '4h', '1d']
+SIGNAL_FIELDS = [('manifold', 50), ('confidence', 0.5), ('diffusion', 50)]
+MANIFOLD, CONFIDENCE, DIFFUSION = 0, 1, 2
+
+
+# (bullish_count, bearish_count) -> (confluence, strength, priority)
+CONFLUENCE_TABLE = {
+    (3, 0): ("STRONG_BULLISH", 95, "🔥 HIGHEST"),
+    (2, 0): ("MODERATE_BULLISH", 70, "⚡ HIGH"),
+    (2, 1): ("MODERATE_BULLISH", 70, "⚡ HIGH"),
+    (0, 3): ("STRONG_BEARISH", 95, "🔥 HIGHEST (SHORT)"),
+    (0, 2): ("MODERATE_BEARISH", 70, "⚡ HIGH (SHORT)"),
+    (1, 2): ("MODERATE_BEARISH", 70, "⚡ HIGH (SHORT)"),
+}
+CONFLUENCE_DEFAULT = ("MIXED", 40, "⏸️ WAIT")
+
+# Same table flattened for batch lookup, indexed by bullish_count * 4 + bearish_count
+_CONFLUENCE_ROWS = [
+    CONFLUENCE_TABLE.get((bull, bear), CONFLUENCE_DEFAULT)
+    for bull in range(4) for bear in range(4)
+]
+CONFLUENCE_LABELS = np.array([row[0] for row in _CONFLUENCE_ROWS], dtype=object)
+CONFLUENCE_STRENGTHS = np.array([row[1] for row in _CONFLUENCE_ROWS])
+CONFLUENCE_PRIORITIES = np.array([row[2] for row in _CONFLUENCE_ROWS], dtype=object)
+
+TIMEFRAME_WEIGHTS = np.array([0.2, 0.3, 0.5])  # higher TF = more weight
+
+# composite = manifold * 0.4 + confidence * 100 * 0.3 + diffusion * 0.3
+COMPOSITE_WEIGHTS = np.array([0.4, 30.0, 0.3])
+
+# Alert buckets over the composite score. Lower edges are inclusive
+# (x < 15, x < 25, x < 30), upper ones strict (x > 70, x > 85), hence the
+# nextafter. The 60-70 MEDIUM band is unreachable (neutral below 70) and
+# folds into the neutral bucket.
+PRIORITY_BINS = np.array([15, 25, 30, np.nextafter(70, np.inf), np.nextafter(85, np.inf)])
+# bucket -> (priority, priority_label, signal_type, emoji); None = no alert
+PRIORITY_TABLE = [
+    (2, "⚡ HIGH", "BEARISH", "🔴"),      # < 15
+    (3, "📊 MEDIUM", "BEARISH", "🔴"),    # 15 - 25
+    None,                                 # 25 - 30  (low priority)
+    None,                                 # 30 - 70  (neutral)
+    (2, "⚡ HIGH", "BULLISH", "🟢"),      # 70 - 85
+    (1, "🔥 URGENT", "BULLISH", "🟢"),    # > 85
+]
+
+
+def _to_soa(signals_data: Dict) -> np.ndarray:
+    """signals_data dict-of-dicts -> (3, 3) float matrix, missing values defaulted"""
+    return np.array([
+        [signals_data.get(tf, {}).get(k, d) for k, d in SIGNAL_FIELDS]
+        for tf in TIMEFRAMES
+    ], dtype=float)
+
+
+# =============================================================================
+# RERUN CACHE
+# =============================================================================
+# Streamlit reruns the whole script on every widget change; the confluence,
+# heatmap and alert list only depend on the 9 signal floats, so they are
+# cached on a rounded, hashable snapshot of the signal matrix.
+
+def _signals_key(S: np.ndarray) -> Tuple:
+    """Hashable snapshot of S, rounded for key stability"""
+    return tuple(
+        (round(m, 2), round(c, 3), round(d, 2)) for m, c, d in S.tolist()
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_confluence(key: Tuple) -> Dict:
+    return MultiTimeframeDashboard().analyze_confluence(np.array(key))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_heatmap(key: Tuple) -> go.Figure:
+    return MultiTimeframeDashboard().create_confluence_heatmap(np.array(key))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_alerts(key: Tuple) -> List[Dict]:
+    return MultiTimeframeDashboard().calculate_alert_priority(np.array(key))
 
 
 class MultiTimeframeDashboard:
@@ -28,65 +156,37 @@ class MultiTimeframeDashboard:
     """
     
     def __init__(self):
-        self.timeframes = ['1h', '4h', '1d']
+        self.timeframes = list(TIMEFRAMES)
         self.signals_cache = {}
     
     # =========================================================================
     # CONFLUENCE ANALYSIS
     # =========================================================================
     
-    def analyze_confluence(self, 
-                          manifold_1h: float,
-                          manifold_4h: float,
-                          manifold_1d: float,
-                          confidence_1h: float,
-                          confidence_4h: float,
-                          confidence_1d: float) -> Dict:
+    def analyze_confluence(self, S: np.ndarray) -> Dict:
         """
         Detect signal agreement across timeframes
         
         Strong confluence = multiple TFs showing same direction
+        
+        Args:
+            S: (3, 3) signal matrix from _to_soa()
         """
         
-        # Scoring system
-        scores = {
-            '1h': manifold_1h * confidence_1h,
-            '4h': manifold_4h * confidence_4h,
-            '1d': manifold_1d * confidence_1d
-        }
+        # Scoring system (one score per timeframe)
+        scores = S[:, MANIFOLD] * S[:, CONFIDENCE]
         
         # Check agreement (all bullish or all bearish)
-        bullish_count = sum(1 for s in scores.values() if s > 55)
-        bearish_count = sum(1 for s in scores.values() if s < 45)
-        
-        if bullish_count == 3:
-            confluence = "STRONG_BULLISH"
-            strength = 95
-            priority = "🔥 HIGHEST"
-        elif bullish_count == 2:
-            confluence = "MODERATE_BULLISH"
-            strength = 70
-            priority = "⚡ HIGH"
-        elif bearish_count == 3:
-            confluence = "STRONG_BEARISH"
-            strength = 95
-            priority = "🔥 HIGHEST (SHORT)"
-        elif bearish_count == 2:
-            confluence = "MODERATE_BEARISH"
-            strength = 70
-            priority = "⚡ HIGH (SHORT)"
-        else:
-            confluence = "MIXED"
-            strength = 40
-            priority = "⏸️ WAIT"
+        bullish_count = int((scores > 55).sum())
+        bearish_count = int((scores < 45).sum())
         
-        # Weighted average (higher TF = more weight)
-        weighted_score = (
-            scores['1h'] * 0.2 +
-            scores['4h'] * 0.3 +
-            scores['1d'] * 0.5
+        confluence, strength, priority = CONFLUENCE_TABLE.get(
+            (bullish_count, bearish_count), CONFLUENCE_DEFAULT
         )
         
+        # Weighted average (higher TF = more weight)
+        weighted_score = float(scores @ TIMEFRAME_WEIGHTS)
+        
         return {
             'confluence': confluence,
             'strength': strength,
@@ -98,6 +198,31 @@ class MultiTimeframeDashboard:
             )
         }
     
+    def analyze_confluence_batch(self, M: np.ndarray, C: np.ndarray) -> Dict:
+        """
+        Vectorized analyze_confluence over N symbols
+        
+        Args:
+            M: (N, 3) manifold scores, columns 1h/4h/1d
+            C: (N, 3) confidences, same layout
+        
+        Returns dict of length-N arrays:
+            confluence, strength, priority, weighted_score, agreement (0-3)
+        """
+        
+        scores = np.asarray(M, dtype=float) * np.asarray(C, dtype=float)
+        bullish_count = (scores > 55).sum(axis=1)
+        bearish_count = (scores < 45).sum(axis=1)
+        key = bullish_count * 4 + bearish_count
+        
+        return {
+            'confluence': np.take(CONFLUENCE_LABELS, key),
+            'strength': np.take(CONFLUENCE_STRENGTHS, key),
+            'priority': np.take(CONFLUENCE_PRIORITIES, key),
+            'weighted_score': scores @ TIMEFRAME_WEIGHTS,
+            'agreement': np.maximum(bullish_count, bearish_count)
+        }
+    
     def _generate_confluence_recommendation(self,
                                            confluence: str,
                                            strength: float) -> str:
@@ -142,62 +267,32 @@ class MultiTimeframeDashboard:
     # VISUAL HEATMAP
     # =========================================================================
     
-    def create_confluence_heatmap(self, 
-                                 signals_data: Dict) -> go.Figure:
+    def create_confluence_heatmap(self, S: np.ndarray) -> go.Figure:
         """
         Create visual heatmap showing confluence across timeframes
         
         Args:
-            signals_data: Dict with keys ['1h', '4h', '1d']
-                         each containing manifold, confidence, regime
+            S: (3, 3) signal matrix from _to_soa()
         """
         
-        # Prepare data for heatmap
-        timeframes = ['1H', '4H', '1D']
-        metrics = ['Manifold', 'Confidence', 'Diffusion', 'Overall']
-        
-        # Build matrix
-        z_data = []
-        for metric in metrics:
-            row = []
-            for tf in ['1h', '4h', '1d']:
-                if metric == 'Manifold':
-                    val = signals_data[tf].get('manifold', 50)
-                elif metric == 'Confidence':
-                    val = signals_data[tf].get('confidence', 0.5) * 100
-                elif metric == 'Diffusion':
-                    val = signals_data[tf].get('diffusion', 50)
-                else:  # Overall
-                    val = (
-                        signals_data[tf].get('manifold', 50) * 0.4 +
-                        signals_data[tf].get('confidence', 0.5) * 100 * 0.3 +
-                        signals_data[tf].get('diffusion', 50) * 0.3
-                    )
-                row.append(val)
-            z_data.append(row)
-        
-        # Create heatmap
-        fig = go.Figure(data=go.Heatmap(
-            z=z_data,
-            x=timeframes,
-            y=metrics,
-            colorscale=[
-                [0, 'red'],
-                [0.5, 'yellow'],
-                [1, 'green']
-            ],
-            text=[[f"{val:.1f}" for val in row] for row in z_data],
-            texttemplate="%{text}",
-            textfont={"size": 16, "color": "white"},
-            colorbar=dict(title="Score"),
-            hoverongaps=False
-        ))
-        
-        fig.update_layout(
-            title="📊 Multi-Timeframe Confluence Heatmap",
-            xaxis_title="Timeframe",
-            yaxis_title="Metric",
-            height=400
+        # Build matrix: one row per metric, stacked in HEATMAP_METRICS order
+        m, d = S[:, MANIFOLD], S[:, DIFFUSION]
+        c = S[:, CONFIDENCE] * 100
+        z_data = np.vstack([m, c, d, m * 0.4 + c * 0.3 + d * 0.3])
+        
+        # Create heatmap as a pre-rasterized image (12 cells don't need a
+        # full Heatmap trace) with the values overlaid as annotations.
+        # Everything but z / text comes from the module-level templates.
+        text = np.char.mod('%.1f', z_data).ravel()
+        annotations = [dict(cell, text=t) for cell, t in zip(_HEATMAP_CELLS, text)]
+        
+        fig = go.Figure(
+            data=go.Image(
+                z=_score_to_rgb(z_data),
+                customdata=z_data,
+                hovertemplate="%{customdata:.1f}<extra></extra>"
+            ),
+            layout=dict(_HEATMAP_LAYOUT, annotations=annotations)
         )
         
         return fig
@@ -206,53 +301,30 @@ class MultiTimeframeDashboard:
     # ALERT PRIORITY SYSTEM
     # =========================================================================
     
-    def calculate_alert_priority(self,
-                                signals_data: Dict) -> List[Dict]:
+    def calculate_alert_priority(self, S: np.ndarray) -> List[Dict]:
         """
         Rank signals by priority based on confluence and strength
         
+        Args:
+            S: (3, 3) signal matrix from _to_soa()
+        
         Returns list of alerts ordered by priority
         """
         
         alerts = []
         
+        # Composite score per timeframe, bucketed in one digitize call
+        composites = S @ COMPOSITE_WEIGHTS
+        buckets = np.digitize(composites, PRIORITY_BINS)
+        
         # Check each timeframe
-        for tf in self.timeframes:
-            data = signals_data.get(tf, {})
+        for tf, (manifold, confidence, diffusion), composite, bucket in zip(
+                self.timeframes, S.tolist(), composites.tolist(), buckets.tolist()):
             
-            manifold = data.get('manifold', 50)
-            confidence = data.get('confidence', 0.5)
-            diffusion = data.get('diffusion', 50)
-            
-            # Calculate composite score
-            composite = manifold * 0.4 + confidence * 100 * 0.3 + diffusion * 0.3
-            
-            # Determine signal type
-            if composite > 70:
-                signal_type = "BULLISH"
-                emoji = "🟢"
-            elif composite < 30:
-                signal_type = "BEARISH"
-                emoji = "🔴"
-            else:
-                signal_type = "NEUTRAL"
-                emoji = "⚪"
-                continue  # Skip neutral signals
-            
-            # Priority calculation
-            if composite > 85:
-                priority = 1  # Highest
-                priority_label = "🔥 URGENT"
-            elif composite > 70 or composite < 15:
-                priority = 2  # High
-                priority_label = "⚡ HIGH"
-            elif composite > 60 or composite < 25:
-                priority = 3  # Medium
-                priority_label = "📊 MEDIUM"
-            else:
-                priority = 4  # Low
-                priority_label = "💤 LOW"
-                continue  # Skip low priority
+            entry = PRIORITY_TABLE[bucket]
+            if entry is None:
+                continue  # Skip neutral / low priority signals
+            priority, priority_label, signal_type, emoji = entry
             
             alerts.append({
                 'timeframe': tf.upper(),
@@ -301,15 +373,10 @@ class MultiTimeframeDashboard:
         # Top metrics row
         col1, col2, col3, col4 = st.columns(4)
         
-        # Calculate confluence
-        confluence = self.analyze_confluence(
-            manifold_1h=signals_data.get('1h', {}).get('manifold', 50),
-            manifold_4h=signals_data.get('4h', {}).get('manifold', 50),
-            manifold_1d=signals_data.get('1d', {}).get('manifold', 50),
-            confidence_1h=signals_data.get('1h', {}).get('confidence', 0.5),
-            confidence_4h=signals_data.get('4h', {}).get('confidence', 0.5),
-            confidence_1d=signals_data.get('1d', {}).get('confidence', 0.5)
-        )
+        # Calculate confluence (cached across reruns)
+        S = _to_soa(signals_data)
+        key = _signals_key(S)
+        confluence = _cached_confluence(key)
         
         with col1:
             st.metric("Confluence", confluence['confluence'].replace('_', ' '))
@@ -328,14 +395,14 @@ class MultiTimeframeDashboard:
         
         # Heatmap
         st.plotly_chart(
-            self.create_confluence_heatmap(signals_data),
+            _cached_heatmap(key),
             use_container_width=True
         )
         
         # Alert priority list
         st.subheader("🔔 Active Alerts (by Priority)")
         
-        alerts = self.calculate_alert_priority(signals_data)
+        alerts = _cached_alerts(key)
         
         if alerts:
             for alert in alerts:
@@ -356,28 +423,24 @@ class MultiTimeframeDashboard:
         
         tabs = st.tabs(["1 Hour", "4 Hour", "1 Day"])
         
-        for idx, tf in enumerate(['1h', '4h', '1d']):
+        for idx, (tf, (m, c, d)) in enumerate(zip(TIMEFRAMES, S.tolist())):
             with tabs[idx]:
-                data = signals_data.get(tf, {})
+                manifold_ok, confidence_ok, diffusion_ok = m > 70, c > 0.7, d > 70
                 
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric("Manifold DNA", f"{data.get('manifold', 50):.1f}/100")
+                    st.metric("Manifold DNA", f"{m:.1f}/100")
                 
                 with col2:
-                    st.metric("Confidence", f"{data.get('confidence', 0.5)*100:.1f}%")
+                    st.metric("Confidence", f"{c*100:.1f}%")
                 
                 with col3:
-                    st.metric("Diffusion", f"{data.get('diffusion', 50):.1f}/100")
+                    st.metric("Diffusion", f"{d:.1f}/100")
                 
                 # Conditions checklist
                 st.write("**Signal Conditions:**")
                 
-                manifold_ok = data.get('manifold', 50) > 70
-                confidence_ok = data.get('confidence', 0.5) > 0.7
-                diffusion_ok = data.get('diffusion', 50) > 70
-                
                 st.write(f"{'✅' if manifold_ok else '❌'} Manifold > 70")
                 st.write(f"{'✅' if confidence_ok else '❌'} Confidence > 70%")
                 st.write(f"{'✅' if diffusion_ok else '❌'} Diffusion > 70")
@@ -23,28 +23,51 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
+import time
+import traceback
+
+import ccxt
+from dotenv import load_dotenv
 
 # Force UTF-8 encoding for Windows console
 if sys.platform.startswith('win'):
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-# Add paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, BASE_DIR)
-sys.path.append(os.path.join(BASE_DIR, 'modules'))
-sys.path.append(os.path.join(BASE_DIR, 'core'))
-sys.path.append(os.path.join(BASE_DIR, 'strategies'))
-
-# Auto-create __init__.py files if missing (self-healing for deployment)
-for subdir in ['core', 'modules', 'strategies']:
-    init_path = os.path.join(BASE_DIR, subdir, '__init__.py')
-    if os.path.isdir(os.path.join(BASE_DIR, subdir)) and not os.path.exists(init_path):
-        with open(init_path, 'w') as f:
-            f.write(f'# {subdir} package\n')
-        print(f"[AUTO-FIX] Created {init_path}")
+
+
+@st.cache_resource(show_spinner=False)
+def _ensure_packages() -> None:
+    """Path setup and package self-healing, once per server process rather than per rerun."""
+    # Add paths (skipping any already present, so reruns never accumulate duplicates)
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    for subdir in ['modules', 'core', 'strategies']:
+        path = os.path.join(BASE_DIR, subdir)
+        if path not in sys.path:
+            sys.path.append(path)
+
+    # Auto-create __init__.py files if missing (self-healing for deployment)
+    for subdir in ['core', 'modules', 'strategies']:
+        init_path = os.path.join(BASE_DIR, subdir, '__init__.py')
+        if os.path.isdir(os.path.join(BASE_DIR, subdir)) and not os.path.exists(init_path):
+            with open(init_path, 'w') as f:
+                f.write(f'# {subdir} package\n')
+            print(f"[AUTO-FIX] Created {init_path}")
+
+
+_ensure_packages()
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+    _HAS_AUTOREFRESH = True
+except ImportError:
+    _HAS_AUTOREFRESH = False
 
 # Import core modules
 from core.capital_manager import CapitalManager
@@ -54,6 +77,7 @@ from core.telegram_alerts import TelegramAlertSystem
 # Import strategies
 from strategies.dca_strategy import DCAStrategy
 from strategies.tactical_strategy import TacticalStrategy
+from strategies.regimes import Regime
 
 # Import modules
 from modules.dashboard_adapter import EliteDashboardAdapter
@@ -102,6 +126,13 @@ st.markdown("""
         font-weight: bold;
         text-align: center;
     }
+    .condition-met, .condition-unmet {
+        padding: 4px 10px;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    .condition-met { background: rgba(0, 200, 0, 0.12); }
+    .condition-unmet { background: rgba(255, 0, 0, 0.10); }
     @keyframes pulse {
         0%, 100% { opacity: 1; }
         50% { opacity: 0.5; }
@@ -110,13 +141,35 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Fear & Greed buckets: value v gets _FG_LABELS[searchsorted(_FG_EDGES, v, 'right')]
+_FG_EDGES = np.array([25, 50, 75])
+_FG_LABELS = ('Extreme Fear', 'Fear', 'Greed', 'Extreme Greed')
+
+# Header metric row: (label, value, delta) renderers over the market state namespace
+_HEADER_METRICS = (
+    ("BTC Price",
+     lambda m: f"${m.current_price:,.0f}",
+     lambda m: f"{((m.current_price/m.sma200-1)*100):.1f}% vs SMA200"),
+    ("Manifold DNA",
+     lambda m: f"{m.manifold_score:.1f}/100",
+     lambda m: "Top 2%" if m.manifold_score >= 80 else "Normal"),
+    ("Confidence",
+     lambda m: f"{m.confidence:.1%}",
+     lambda m: "HIGH" if m.confidence >= 0.8 else "MEDIUM"),
+    ("Fear & Greed",
+     lambda m: f"{m.fear_greed}/100",
+     lambda m: _FG_LABELS[int(np.searchsorted(_FG_EDGES, m.fear_greed, side='right'))]),
+)
+
+# US-friendly exchanges first; Binance last since it geo-blocks some regions
+OHLCV_EXCHANGES = ['kraken', 'coinbase', 'bybit', 'binance']
+
+
 @st.cache_resource
 def init_system():
     """Initialize Elite v20 system components."""
     
     # Load environment variables
-    import os
-    from dotenv import load_dotenv
     load_dotenv()
     
     # Get API keys
@@ -140,95 +193,569 @@ def init_system():
         'dca_strategy': DCAStrategy(),
         'tactical_strategy': TacticalStrategy(),
         'elite_adapter': elite_adapter,
-        'fear_greed': FearGreedProvider()
+        'fear_greed': FearGreedProvider(),
+        # Shared read-only market data clients: session, markets and rate limiter persist across reruns
+        'exchanges': {
+            exchange_id: getattr(ccxt, exchange_id)({'enableRateLimit': True})
+            for exchange_id in OHLCV_EXCHANGES
+        }
     }
 
 
-def main():
-    """Main dashboard function."""
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """Shared worker pool for the independent market-data fetches."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='elite-io')
+
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _fetch_ohlcv(_exchanges: dict, symbol: str, timeframe: str, limit: int = 200) -> np.ndarray:
+    """
+    OHLCV from the first reachable exchange, cached across reruns.
     
-    # Initialize system
-    system = init_system()
+    Returns a float64 array with columns [timestamp_ms, open, high, low, close, volume];
+    build a DataFrame with _ohlcv_frame() only where one is required.
+    """
+    # Convert Binance symbol format (BTCUSDT) to unified format (BTC/USDT)
+    unified_symbol = symbol.replace('USDT', '/USDT') if '/' not in symbol else symbol
     
-    # Header
-    st.markdown('<div class="main-header">🧬 ELITE v20 - PRODUCTION</div>', unsafe_allow_html=True)
-    st.markdown("### Biological/Quant Hybrid System | Top 0.001%")
+    for exchange_id in OHLCV_EXCHANGES:
+        try:
+            ohlcv = _exchanges[exchange_id].fetch_ohlcv(unified_symbol, timeframe, limit=limit)
+            print(f"[OK] Using exchange: {exchange_id}")
+            break
+        except Exception as ex_err:
+            print(f"[SKIP] {exchange_id}: {ex_err}")
+            continue
+    else:
+        raise Exception("All exchanges unavailable from this location")
     
-    # Sidebar
-    with st.sidebar:
-        st.image("https://via.placeholder.com/200x100/1e1e1e/00ff00?text=ELITE+v20", width=200)
-        
-        st.markdown("### ⚙️ System Control")
-        
-        # Symbol selection
-        symbol = st.selectbox("Symbol", ["BTCUSDT"], index=0)
+    return np.asarray(ohlcv, dtype=np.float64)
+
+
+def _ohlcv_frame(ohlcv: np.ndarray) -> pd.DataFrame:
+    """Timestamp-indexed OHLCV DataFrame for the adapter / risk engine APIs."""
+    # Millisecond epochs viewed as datetime64 build the index without to_datetime dispatch
+    index = pd.DatetimeIndex(ohlcv[:, 0].astype(np.int64).view('datetime64[ms]'), name='timestamp')
+    return pd.DataFrame(ohlcv[:, 1:], columns=['open', 'high', 'low', 'close', 'volume'], index=index)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _get_fear_greed(_provider) -> dict:
+    """Current Fear & Greed reading; the index updates daily, so 15 min is plenty fresh."""
+    # The provider memoizes forever (lru_cache); drop that so each TTL expiry refetches
+    _provider.get_current_fear_greed.cache_clear()
+    return _provider.get_current_fear_greed()
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _analyze_elite(symbol: str, timeframe: str, last_ts: int, exposure_pct: float,
+                   _adapter, _ohlcv: np.ndarray) -> dict:
+    """
+    Full 6-layer Elite analysis, recomputed only when a new bar arrives.
+    
+    The key is (symbol, timeframe, last bar timestamp, exposure); the adapter
+    and the candles themselves are left unhashed, and the DataFrame the
+    adapter needs is only built on a cache miss.
+    """
+    return _adapter.analyze_elite(df=_ohlcv_frame(_ohlcv), exposure_pct=exposure_pct)
+
+
+# Repeat an unchanged alert at most this often (seconds)
+ALERT_REPEAT_SECONDS = 3600
+
+
+def _alert_due(name: str, fingerprint: tuple) -> bool:
+    """
+    Debounce an auto-alert across reruns.
+    
+    True when the signal fingerprint changed or the last send is older than
+    ALERT_REPEAT_SECONDS; the caller then sends, and the send is recorded.
+    """
+    now = time.time()
+    if (st.session_state.get(f'last_{name}_alert_key') == fingerprint
+            and now - st.session_state.get(f'last_{name}_alert_ts', 0) <= ALERT_REPEAT_SECONDS):
+        return False
+    st.session_state[f'last_{name}_alert_key'] = fingerprint
+    st.session_state[f'last_{name}_alert_ts'] = now
+    return True
+
+
+# Each section renders as a fragment: its own widgets rerun only that section
+fragment = getattr(st, 'fragment', lambda func: func)
+
+
+def _header_slots() -> list:
+    """One st.empty() per header metric, so each refresh swaps values in place."""
+    return [col.empty() for col in st.columns(len(_HEADER_METRICS))]
+
+
+def _render_header_metrics(slots: list, market: SimpleNamespace):
+    """Price / Manifold / Confidence / Fear & Greed metric row."""
+    for slot, (label, value, delta) in zip(slots, _HEADER_METRICS):
+        slot.metric(label, value(market), delta(market))
+
+
+@fragment
+def _render_status_cards(portfolio: dict):
+    """Portfolio overview and strategy allocation cards."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 💰 Portfolio Overview")
+        st.markdown(f"""
+        <div class="metric-card">
+        <h4>Total Value: ${portfolio['capital']['total_value']:,.2f}</h4>
+        <p>Base Capital: ${portfolio['capital']['base']:,.0f}</p>
+        <p>P&L (Realized): ${portfolio['capital']['pnl_realized']:,.2f}</p>
+        <p>P&L (Unrealized): ${portfolio['capital']['pnl_unrealized']:,.2f}</p>
+        <h3 style="color: {'#00ff00' if portfolio['capital']['return_pct'] >= 0 else '#ff0000'}">
+        Total Return: {portfolio['capital']['return_pct']:.2f}%
+        </h3>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### 🎯 Strategy Allocation")
+        st.markdown(f"""
+        <div class="metric-card">
+        <h4>📈 DCA Strategy (60%)</h4>
+        <p>BTC Held: {portfolio['dca']['btc_held']:.4f}</p>
+        <p>Avg Entry: ${portfolio['dca']['avg_entry']:,.0f}</p>
+        <p>Unrealized: ${portfolio['dca']['unrealized_pnl']:,.2f} ({portfolio['dca']['unrealized_pct']:.1f}%)</p>
+        <br>
+        <h4>⚡ Tactical Strategy (40%)</h4>
+        <p>BTC Held: {portfolio['tactical']['btc_held']:.4f}</p>
+        <p>Avg Entry: ${portfolio['tactical']['avg_entry']:,.0f}</p>
+        <p>Unrealized: ${portfolio['tactical']['unrealized_pnl']:,.2f} ({portfolio['tactical']['unrealized_pct']:.1f}%)</p>
+        <p>Realized: ${portfolio['tactical']['realized_pnl']:,.2f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@fragment
+def _render_live_signals(system: dict, market: SimpleNamespace, portfolio: dict,
+                         ohlcv: np.ndarray, telegram_enabled: bool):
+    """Live Signals tab: DCA and Tactical entry checks."""
+    current_price, sma200, fear_greed = market.current_price, market.sma200, market.fear_greed
+    manifold_score, confidence = market.manifold_score, market.confidence
+    regime, diffusion_score = market.regime.name, market.diffusion_score
+    
+    st.markdown("### 🔴 Live Signal Analysis")
+    
+    # DCA Signal Check
+    dca_signal = system['dca_strategy'].check_entry_signal(
+        manifold_score=manifold_score,
+        regime=regime,
+        diffusion_score=diffusion_score,
+        fear_greed=fear_greed,
+        current_price=current_price,
+        sma200=sma200
+    )
+    
+    if dca_signal['signal']:
+        st.markdown('<div class="dca-signal">🩸 DCA SIGNAL ACTIVE - Blood in Streets!</div>', 
+                   unsafe_allow_html=True)
+        
+        dca_amount = system['dca_strategy'].calculate_dca_amount(
+            portfolio['dca']['capital_available'],
+            manifold_score,
+            diffusion_score
+        )
         
-        # Timeframe
-        timeframe = st.selectbox("Timeframe", ["1h", "4h", "1d"], index=0)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"""
+            **Entry Price:** ${current_price:,.0f}
+            **Recommended Amount:** ${dca_amount:,.0f}
+            **BTC Amount:** {dca_amount/current_price:.4f}
+            """)
         
-        # Data refresh
-        auto_refresh = st.checkbox("Auto Refresh", value=True)
-        if auto_refresh:
-            refresh_seconds = st.slider("Refresh (seconds)", 10, 300, 60)
+        with col2:
+            st.info(f"""
+            **Signal Strength:** {dca_signal['signal_strength']:.1%}
+            **Manifold Score:** {manifold_score:.1f}
+            **Diffusion Score:** {diffusion_score:.1f}
+            **Fear & Greed:** {fear_greed}
+            """)
         
-        st.markdown("---")
+        if st.button("🩸 Execute DCA Entry", key="dca_btn"):
+            # Record entry
+            btc_amount = dca_amount / current_price
+            system['capital_manager'].record_dca_entry(
+                btc_amount, current_price, dca_amount
+            )
+            system['dca_strategy'].record_entry(
+                current_price, dca_amount, btc_amount,
+                manifold_score, diffusion_score, fear_greed, regime
+            )
+            st.success("✅ DCA Entry Recorded!")
+            st.rerun()
+            
+        # Auto-Alert (DCA), once per signal state
+        if telegram_enabled and _alert_due('dca', (round(manifold_score, 1), market.regime)):
+            system['telegram'].send_dca_signal(
+                current_price, manifold_score, regime,
+                diffusion_score, fear_greed, dca_amount
+            )
+    else:
+        st.info("No DCA signal. Waiting for Blood in Streets...")
+        
+        # Show what's needed
+        st.markdown("### Conditions Status:")
+        # One markdown element for the whole checklist instead of one st.write per condition
+        st.markdown(''.join(
+            f'<div class="condition-met">✅ {condition}: MET</div>' if met else
+            f'<div class="condition-unmet">❌ {condition}: NOT MET</div>'
+            for condition, met in dca_signal['conditions'].items()
+        ), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Tactical Signal Check
+    active_positions = system['tactical_strategy'].get_active_positions()
+    tactical_signal = system['tactical_strategy'].check_entry_signal(
+        manifold_score=manifold_score,
+        confidence=confidence,
+        regime=regime
+    )
+    
+    if tactical_signal['signal'] and not active_positions:
+        st.markdown('<div class="tactical-signal">⚡ TACTICAL ENTRY SIGNAL!</div>', 
+                   unsafe_allow_html=True)
         
-        # Telegram status
-        st.markdown("### 📱 Telegram Status")
-        telegram_enabled = st.checkbox("Alerts Enabled", value=True)
-        if telegram_enabled:
-            system['telegram'].enable()
-            st.success("✅ LIVE")
-        else:
-            system['telegram'].disable()
-            st.warning("❌ Disabled")
+        # Generate risk plan
+        risk_plan = system['risk_engine'].generate_trade_plan(
+            capital_available=portfolio['tactical']['capital_available'],
+            current_price=current_price,
+            df=_ohlcv_frame(ohlcv),
+            confidence=confidence,
+            strategy='TACTICAL'
+        )
         
-        if st.button("Test Alert"):
-            system['telegram'].send_test_alert()
-            st.success("Alert sent!")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"""
+            **Entry:** ${current_price:,.0f}
+            **Position:** ${risk_plan['position']['position_size_usd']:,.0f}
+            **BTC:** {risk_plan['position']['position_size_btc']:.4f}
+            **Stop Loss:** ${risk_plan['stop_loss']['price']:,.0f} (-{risk_plan['stop_loss']['pct']:.1f}%)
+            """)
         
-        st.markdown("---")
+        with col2:
+            st.info(f"""
+            **T1 (+5%):** ${risk_plan['targets']['t1_target']:,.0f}
+            **T2 (+12%):** ${risk_plan['targets']['t2_target']:,.0f}
+            **Risk:** ${risk_plan['position']['actual_risk_usd']:,.0f} ({risk_plan['position']['actual_risk_pct']:.2f}%)
+            **R:R (T2):** {risk_plan['validation']['rr_t2']:.1f}:1
+            """)
         
-        # System info
-        st.markdown("### 📊 System Info")
+        if st.button("⚡ Execute Tactical Entry", key="tac_btn"):
+            # Open position
+            position_id = system['tactical_strategy'].open_position(
+                entry_price=current_price,
+                position_size_usd=risk_plan['position']['position_size_usd'],
+                position_size_btc=risk_plan['position']['position_size_btc'],
+                stop_loss_price=risk_plan['stop_loss']['price'],
+                t1_target=risk_plan['targets']['t1_target'],
+                t2_target=risk_plan['targets']['t2_target'],
+                manifold_score=manifold_score,
+                confidence=confidence,
+                regime=regime
+            )
+            # Record in capital manager
+            system['capital_manager'].record_tactical_entry(
+                risk_plan['position']['position_size_btc'],
+                current_price,
+                risk_plan['position']['position_size_usd']
+            )
+            st.success(f"✅ Tactical Position Opened: {position_id}")
+            st.rerun()
+        
+        # Auto-Alert (Tactical), once per signal state
+        if telegram_enabled and _alert_due('tactical', (round(manifold_score, 1), market.regime)):
+            system['telegram'].send_tactical_entry(
+                current_price, manifold_score, confidence,
+                risk_plan['targets']['t1_target'],
+                risk_plan['targets']['t2_target'],
+                risk_plan['stop_loss']['price'],
+                risk_plan['position']['position_size_usd'],
+                risk_plan['position']['position_size_btc'],
+                risk_plan['position']['actual_risk_usd'],
+                risk_plan['position']['actual_risk_pct'],
+                confidence,
+                risk_plan['validation']['rr_t2']
+            )
+    else:
+        if active_positions:
+            st.warning("Position already active. Monitor for exits.")
+        else:
+            st.info("No tactical signal. Waiting for high-confidence entry...")
+
+
+@fragment
+def _render_dca_tab(system: dict, current_price: float, portfolio: dict):
+    """DCA Strategy tab."""
+    st.markdown("### 📈 DCA Strategy (Long-term 2030)")
+    
+    dca_status = system['dca_strategy'].get_position_status(
+        current_price,
+        portfolio['dca']['btc_held'],
+        portfolio['dca']['avg_entry'],
+        portfolio['dca']['capital_used']
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Current Position")
         st.info(f"""
-        **Architecture:** 6-Layer Biological/Quant
-        **Capital:** ${system['capital_manager'].current_capital:,.0f}
-        **Max Risk:** 5% per trade
-        **Strategies:** DCA (60%) + Tactical (40%)
+        **BTC Held:** {dca_status['current']['btc_held']:.4f}
+        **Avg Entry:** ${dca_status['current']['avg_entry']:,.0f}
+        **Current Price:** ${dca_status['current']['current_price']:,.0f}
+        **Unrealized P&L:** ${dca_status['current']['unrealized_pnl']:,.2f} ({dca_status['current']['unrealized_pct']:.1f}%)
         """)
     
-    # Get live data
-    try:
-        # Fetch market data (US-friendly exchanges first)
-        import ccxt
-        # Convert Binance symbol format (BTCUSDT) to unified format (BTC/USDT)
-        unified_symbol = symbol.replace('USDT', '/USDT') if '/' not in symbol else symbol
+    with col2:
+        st.markdown("#### 2030 Projection")
+        st.success(f"""
+        **Target Year:** {dca_status['target_2030']['target_year']}
+        **Target Price:** ${dca_status['target_2030']['target_price_min']:,.0f} - ${dca_status['target_2030']['target_price_max']:,.0f}
+        **Projected Value:** ${dca_status['target_2030']['value_at_target_min']:,.0f} - ${dca_status['target_2030']['value_at_target_max']:,.0f}
+        **Projected Profit:** ${dca_status['target_2030']['profit_at_target_min']:,.0f} - ${dca_status['target_2030']['profit_at_target_max']:,.0f}
+        **Projected Return:** {dca_status['target_2030']['return_at_target_min']:.0f}% - {dca_status['target_2030']['return_at_target_max']:.0f}%
+        """)
+    
+    # Entry history
+    entry_history = system['dca_strategy'].get_entry_history()
+    if not entry_history.empty:
+        st.markdown("#### Entry History")
+        st.dataframe(entry_history[['timestamp', 'price', 'btc_amount', 'usd_amount', 'manifold_score', 'regime']])
+
+
+@fragment
+def _render_tactical_tab(system: dict, current_price: float):
+    """Tactical Strategy tab: open positions and exits."""
+    st.markdown("### ⚡ Tactical Strategy (Active Trading)")
+    
+    active_positions = system['tactical_strategy'].get_active_positions()
+    
+    if active_positions:
+        for position in active_positions:
+            # Update position
+            update = system['tactical_strategy'].update_position(
+                position['id'],
+                current_price
+            )
+            
+            st.markdown(f"#### Position: {position['id']}")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.info(f"""
+                **Entry:** ${position['entry_price']:,.0f}
+                **Current:** ${current_price:,.0f}
+                **Size:** {position['position_size_btc']:.4f} BTC
+                **Unrealized P&L:** ${update['unrealized_pnl']:,.2f} ({update['unrealized_pct']:.1f}%)
+                """)
+            
+            with col2:
+                stop_status = "🟢 Trail Active" if update['trail_active'] else "🟡 Fixed Stop"
+                st.warning(f"""
+                **Stop Loss:** ${update['stop_loss']:,.0f} {stop_status}
+                **T1 ({position['t1_pct']}%):** {'✅ HIT' if position['t1_hit'] else f"${position['t1_target']:,.0f}"}
+                **T2 ({position['t2_pct']}%):** {'✅ HIT' if position['t2_hit'] else f"${position['t2_target']:,.0f}"}
+                """)
+            
+            # Check for actions
+            if update['actions']:
+                for action in update['actions']:
+                    st.error(f"⚠️ ACTION NEEDED: {action['type']} at ${action['price']:,.0f}")
+                    
+                    if action['type'] == 'T1_HIT':
+                        if st.button(f"Execute T1 Exit (50%)", key=f"t1_{position['id']}"):
+                            exit_result = system['tactical_strategy'].execute_exit(
+                                position['id'], 'T1', action['price'], 50.0
+                            )
+                            system['capital_manager'].record_tactical_exit(
+                                exit_result['btc_exited'],
+                                action['price'],
+                                'T1'
+                            )
+                            system['telegram'].send_t1_hit(
+                                action['price'],
+                                position['entry_price'],
+                                exit_result['realized_pnl'],
+                                exit_result['realized_pct']
+                            )
+                            st.success("✅ T1 Exit Executed!")
+                            st.rerun()
+                    
+                    elif action['type'] == 'T2_HIT':
+                        st.success("Trail stop activated automatically")
+                        system['telegram'].send_t2_hit(
+                            action['price'],
+                            position['entry_price'],
+                            update['unrealized_pnl'],
+                            update['unrealized_pct'],
+                            update['stop_loss']
+                        )
+                    
+                    elif action['type'] == 'STOP_HIT':
+                        if st.button(f"Execute Stop Exit (100%)", key=f"stop_{position['id']}"):
+                            exit_result = system['tactical_strategy'].execute_exit(
+                                position['id'], 'STOP', action['price'], 100.0
+                            )
+                            system['capital_manager'].record_tactical_exit(
+                                exit_result['btc_exited'],
+                                action['price'],
+                                'STOP'
+                            )
+                            system['telegram'].send_stop_hit(
+                                action['price'],
+                                position['entry_price'],
+                                exit_result['realized_pnl'],
+                                exit_result['realized_pct']
+                            )
+                            st.error("⛔ Stop Loss Hit")
+                            st.rerun()
+    else:
+        st.info("No active positions. Waiting for entry signal...")
+    
+    # Performance stats
+    perf = system['tactical_strategy'].get_performance_stats()
+    st.markdown("#### Performance Statistics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Trades", perf['total_trades'])
+        st.metric("Win Rate", f"{perf['win_rate_pct']:.1f}%")
+    with col2:
+        st.metric("Wins", perf['wins'])
+        st.metric("Losses", perf['losses'])
+    with col3:
+        st.metric("Total P&L", f"${perf['total_pnl']:,.2f}")
+        st.metric("R:R Ratio", f"{perf['rr_ratio']:.2f}:1")
+
+
+@fragment
+def _render_risk_tab(system: dict, portfolio: dict):
+    """Risk Management tab."""
+    st.markdown("### 🎯 Risk Management")
+    
+    st.markdown("#### Iron Rules (Top 0.001%)")
+    st.info("""
+    1. **Never Risk >5%** - Maximum risk per trade (IRON RULE)
+    2. **Ignore the Noise** - High signal-to-noise ratio
+    3. **Long Term Vision** - 2030 target ($600k-$1M BTC)
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Kelly Criterion")
+        risk = system['risk_engine']
+        kelly = risk.calculate_kelly_fraction()
+        # The risk engine's stats change far less often than the page reruns
+        key = (risk.win_rate, risk.avg_win_loss_ratio, kelly, risk.kelly_cap)
+        if st.session_state.get('_kelly_block_key') != key:
+            st.session_state['_kelly_block_str'] = f"""
+        **Win Rate:** {risk.win_rate*100:.1f}%
+        **R:R Ratio:** {risk.avg_win_loss_ratio:.1f}:1
+        **Kelly Fraction:** {kelly:.3f}
+        **Capped at:** {risk.kelly_cap}x (conservative)
+        """
+            st.session_state['_kelly_block_key'] = key
+        st.success(st.session_state['_kelly_block_str'])
+    
+    with col2:
+        st.markdown("#### Current Risk Exposure")
+        st.warning(f"""
+        **Max Risk per Trade:** ${portfolio['risk']['max_risk_per_trade_usd']:,.0f} ({portfolio['risk']['max_risk_per_trade_pct']:.1f}%)
+        **Total Capital:** ${portfolio['capital']['total_value']:,.2f}
+        **Available for Risk:** ${portfolio['capital']['total_value'] * 0.05:,.2f}
+        """)
+
+
+# Fixed-width string formats for the transaction preview (no Styler)
+_TX_PREVIEW_FORMATS = {
+    'btc_amount': '{:.6f}'.format,
+    'price': '${:,.2f}'.format,
+    'usd_amount': '${:,.2f}'.format,
+    'realized_pnl': '{:+,.2f}'.format,
+    'position_btc': '{:.6f}'.format,
+    'avg_entry': '${:,.2f}'.format,
+}
+
+
+def _format_tx_preview(tx: pd.DataFrame) -> pd.DataFrame:
+    """Pre-formatted copy of a few transaction rows for a static st.table."""
+    out = tx.astype({'strategy': str, 'action': str})
+    out['timestamp'] = tx['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    for col, fmt in _TX_PREVIEW_FORMATS.items():
+        # realized_pnl is NaN for buys
+        out[col] = tx[col].map(fmt, na_action='ignore').fillna('')
+    return out
+
+
+@fragment
+def _render_alerts_tab(system: dict, telegram_enabled: bool):
+    """Alerts & History tab."""
+    st.markdown("### 📱 Alerts & History")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Telegram Alerts")
+        st.info(f"""
+        **Status:** {'✅ ENABLED' if telegram_enabled else '❌ DISABLED'}
+        **Bot Token:** {system['telegram'].bot_token[:20]}...
+        **Chat ID:** {system['telegram'].chat_id}
+        """)
         
-        exchange = None
-        ohlcv = None
-        for ExchangeClass in [ccxt.kraken, ccxt.coinbase, ccxt.bybit, ccxt.binance]:
-            try:
-                ex = ExchangeClass({'enableRateLimit': True})
-                ohlcv = ex.fetch_ohlcv(unified_symbol, timeframe, limit=200)
-                exchange = ex
-                print(f"[OK] Using exchange: {ex.id}")
-                break
-            except Exception as ex_err:
-                print(f"[SKIP] {ExchangeClass.__name__}: {ex_err}")
-                continue
-        if exchange is None or ohlcv is None:
-            raise Exception("All exchanges unavailable from this location")
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df.set_index('timestamp', inplace=True)
+        st.markdown(
+            "**Alert Types:**\n"
+            "- 🩸 DCA Signals (Blood in Streets)\n"
+            "- ⚡ Tactical Entries\n"
+            "- 💰 T1/T2 Exits\n"
+            "- ⛔ Stop Loss Warnings\n"
+            "- 🔄 Regime Changes"
+        )
+    
+    with col2:
+        st.markdown("#### Transaction History")
+        tx_history = system['capital_manager'].get_transaction_history()
+        if not tx_history.empty:
+            st.table(_format_tx_preview(tx_history.tail(10)))
+        else:
+            st.info("No transactions yet")
+
+
+def _render_live_market(system: dict, symbol: str, timeframe: str, telegram_enabled: bool):
+    """Fetch + analysis + everything that depends on live market data."""
+    # Reserve the status line and header row up front; while the fetch runs they
+    # keep showing the previous tick's values, then get replaced in place
+    status_slot = st.empty()
+    header_slots = _header_slots()
+    if 'last_market' in st.session_state:
+        status_slot.info("⏳ Refreshing market data...")
+        _render_header_metrics(header_slots, st.session_state.last_market)
+    
+    # Get live data: OHLCV and Fear & Greed are independent, so fetch them concurrently
+    pool = _executor()
+    f_ohlcv = pool.submit(_fetch_ohlcv, system['exchanges'], symbol, timeframe)
+    f_fear_greed = pool.submit(_get_fear_greed, system['fear_greed'])
+    try:
+        # Fetch market data (cached; see _fetch_ohlcv)
+        ohlcv = f_ohlcv.result()
         
-        current_price = float(df['close'].iloc[-1])
-        sma200 = df['close'].rolling(200).mean().iloc[-1] if len(df) >= 200 else current_price
+        closes = ohlcv[:, 4]
+        current_price = float(closes[-1])
+        sma200 = float(closes[-200:].mean()) if closes.size >= 200 else current_price
         
         # Get Fear & Greed
         try:
-            fear_greed_data = system['fear_greed'].get_current_fear_greed()
+            fear_greed_data = f_fear_greed.result()
             fear_greed = fear_greed_data.get('value', 50) if fear_greed_data else 50
             fear_greed_text = fear_greed_data.get('classification', 'Neutral') if fear_greed_data else 'Neutral'
         except Exception as fg_error:
@@ -238,20 +765,20 @@ def main():
         
         # Run Elite analysis
         try:
-            elite_results = system['elite_adapter'].analyze_elite(
-                df=df,
-                exposure_pct=15.0
+            elite_results = _analyze_elite(
+                symbol, timeframe, int(ohlcv[-1, 0]), 15.0,
+                system['elite_adapter'], ohlcv
             )
             
             manifold_score = elite_results.get('elite_score', 50)
             confidence = elite_results.get('confidence', 0.5)
-            regime = elite_results.get('chaos', {}).get('regime', 'NORMAL')
+            regime = Regime.parse(elite_results.get('chaos', {}).get('regime'))
             diffusion_score = elite_results.get('onchain', {}).get('diffusion_score', 50)
         except Exception as elite_error:
             print(f"Elite analysis error: {elite_error}")
             manifold_score = 50
             confidence = 0.5
-            regime = 'NORMAL'
+            regime = Regime.NORMAL
             diffusion_score = 50
         
         # Auto-Alert (Regime Change)
@@ -261,8 +788,8 @@ def main():
         if st.session_state.last_regime != regime:
             if telegram_enabled:
                 system['telegram'].send_regime_change(
-                    st.session_state.last_regime,
-                    regime,
+                    st.session_state.last_regime.name,
+                    regime.name,
                     current_price,
                     manifold_score
                 )
@@ -273,17 +800,17 @@ def main():
     except Exception as e:
         st.error(f"Data fetch error: {e}")
         print(f"Full error: {e}")
-        import traceback
         traceback.print_exc()
         
         # Fallback values
+        ohlcv = None
         current_price = 98000
         sma200 = 70434
         fear_greed = 50
         fear_greed_text = 'Neutral'
         manifold_score = 50
         confidence = 0.5
-        regime = 'NORMAL'
+        regime = Regime.NORMAL
         diffusion_score = 50
         data_fetch_success = False
         
@@ -292,65 +819,25 @@ def main():
     # Main layout
     # Data status indicator
     if data_fetch_success:
-        st.success("🟢 LIVE DATA - Connected to Binance & Fear/Greed API")
+        status_slot.success("🟢 LIVE DATA - Connected to Binance & Fear/Greed API")
     else:
-        st.warning("🟡 FALLBACK DATA - Check connection (system still operational)")
+        status_slot.warning("🟡 FALLBACK DATA - Check connection (system still operational)")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("BTC Price", f"${current_price:,.0f}", 
-                 f"{((current_price/sma200-1)*100):.1f}% vs SMA200")
-    
-    with col2:
-        st.metric("Manifold DNA", f"{manifold_score:.1f}/100",
-                 "Top 2%" if manifold_score >= 80 else "Normal")
-    
-    with col3:
-        st.metric("Confidence", f"{confidence:.1%}",
-                 "HIGH" if confidence >= 0.8 else "MEDIUM")
+    market = SimpleNamespace(
+        current_price=current_price, sma200=sma200, manifold_score=manifold_score,
+        confidence=confidence, fear_greed=fear_greed, regime=regime,
+        diffusion_score=diffusion_score
+    )
     
-    with col4:
-        fg_label = "Extreme Fear" if fear_greed < 25 else "Fear" if fear_greed < 50 else "Greed" if fear_greed < 75 else "Extreme Greed"
-        st.metric("Fear & Greed", f"{fear_greed}/100", fg_label)
+    _render_header_metrics(header_slots, market)
+    st.session_state.last_market = market
     
     st.markdown("---")
     
-    # Portfolio Status
-    portfolio = system['capital_manager'].get_portfolio_status(current_price)
+    # Portfolio Status (memoized per price; $1 rounding lets sub-dollar ticks reuse it)
+    portfolio = system['capital_manager'].get_portfolio_status(round(current_price))
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 💰 Portfolio Overview")
-        st.markdown(f"""
-        <div class="metric-card">
-        <h4>Total Value: ${portfolio['capital']['total_value']:,.2f}</h4>
-        <p>Base Capital: ${portfolio['capital']['base']:,.0f}</p>
-        <p>P&L (Realized): ${portfolio['capital']['pnl_realized']:,.2f}</p>
-        <p>P&L (Unrealized): ${portfolio['capital']['pnl_unrealized']:,.2f}</p>
-        <h3 style="color: {'#00ff00' if portfolio['capital']['return_pct'] >= 0 else '#ff0000'}">
-        Total Return: {portfolio['capital']['return_pct']:.2f}%
-        </h3>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("### 🎯 Strategy Allocation")
-        st.markdown(f"""
-        <div class="metric-card">
-        <h4>📈 DCA Strategy (60%)</h4>
-        <p>BTC Held: {portfolio['dca']['btc_held']:.4f}</p>
-        <p>Avg Entry: ${portfolio['dca']['avg_entry']:,.0f}</p>
-        <p>Unrealized: ${portfolio['dca']['unrealized_pnl']:,.2f} ({portfolio['dca']['unrealized_pct']:.1f}%)</p>
-        <br>
-        <h4>⚡ Tactical Strategy (40%)</h4>
-        <p>BTC Held: {portfolio['tactical']['btc_held']:.4f}</p>
-        <p>Avg Entry: ${portfolio['tactical']['avg_entry']:,.0f}</p>
-        <p>Unrealized: ${portfolio['tactical']['unrealized_pnl']:,.2f} ({portfolio['tactical']['unrealized_pct']:.1f}%)</p>
-        <p>Realized: ${portfolio['tactical']['realized_pnl']:,.2f}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    _render_status_cards(portfolio)
     
     st.markdown("---")
     
@@ -364,355 +851,89 @@ def main():
     ])
     
     with tab1:
-        st.markdown("### 🔴 Live Signal Analysis")
-        
-        # DCA Signal Check
-        dca_signal = system['dca_strategy'].check_entry_signal(
-            manifold_score=manifold_score,
-            regime=regime,
-            diffusion_score=diffusion_score,
-            fear_greed=fear_greed,
-            current_price=current_price,
-            sma200=sma200
-        )
-        
-        if dca_signal['signal']:
-            st.markdown('<div class="dca-signal">🩸 DCA SIGNAL ACTIVE - Blood in Streets!</div>', 
-                       unsafe_allow_html=True)
-            
-            dca_amount = system['dca_strategy'].calculate_dca_amount(
-                portfolio['dca']['capital_available'],
-                manifold_score,
-                diffusion_score
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.success(f"""
-                **Entry Price:** ${current_price:,.0f}
-                **Recommended Amount:** ${dca_amount:,.0f}
-                **BTC Amount:** {dca_amount/current_price:.4f}
-                """)
-            
-            with col2:
-                st.info(f"""
-                **Signal Strength:** {dca_signal['signal_strength']:.1%}
-                **Manifold Score:** {manifold_score:.1f}
-                **Diffusion Score:** {diffusion_score:.1f}
-                **Fear & Greed:** {fear_greed}
-                """)
-            
-            if st.button("🩸 Execute DCA Entry", key="dca_btn"):
-                # Record entry
-                btc_amount = dca_amount / current_price
-                system['capital_manager'].record_dca_entry(
-                    btc_amount, current_price, dca_amount
-                )
-                system['dca_strategy'].record_entry(
-                    current_price, dca_amount, btc_amount,
-                    manifold_score, diffusion_score, fear_greed, regime
-                )
-                st.success("✅ DCA Entry Recorded!")
-                st.rerun()
-                
-            # Auto-Alert (DCA)
-            if telegram_enabled:
-                system['telegram'].send_dca_signal(
-                    current_price, manifold_score, regime,
-                    diffusion_score, fear_greed, dca_amount
-                )
-        else:
-            st.info("No DCA signal. Waiting for Blood in Streets...")
-            
-            # Show what's needed
-            st.markdown("### Conditions Status:")
-            for condition, met in dca_signal['conditions'].items():
-                emoji = "✅" if met else "❌"
-                st.write(f"{emoji} {condition}: {'MET' if met else 'NOT MET'}")
-        
-        st.markdown("---")
-        
-        # Tactical Signal Check
-        tactical_signal = system['tactical_strategy'].check_entry_signal(
-            manifold_score=manifold_score,
-            confidence=confidence,
-            regime=regime
-        )
-        
-        if tactical_signal['signal'] and len(system['tactical_strategy'].get_active_positions()) == 0:
-            st.markdown('<div class="tactical-signal">⚡ TACTICAL ENTRY SIGNAL!</div>', 
-                       unsafe_allow_html=True)
-            
-            # Generate risk plan
-            risk_plan = system['risk_engine'].generate_trade_plan(
-                capital_available=portfolio['tactical']['capital_available'],
-                current_price=current_price,
-                df=df,
-                confidence=confidence,
-                strategy='TACTICAL'
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.success(f"""
-                **Entry:** ${current_price:,.0f}
-                **Position:** ${risk_plan['position']['position_size_usd']:,.0f}
-                **BTC:** {risk_plan['position']['position_size_btc']:.4f}
-                **Stop Loss:** ${risk_plan['stop_loss']['price']:,.0f} (-{risk_plan['stop_loss']['pct']:.1f}%)
-                """)
-            
-            with col2:
-                st.info(f"""
-                **T1 (+5%):** ${risk_plan['targets']['t1_target']:,.0f}
-                **T2 (+12%):** ${risk_plan['targets']['t2_target']:,.0f}
-                **Risk:** ${risk_plan['position']['actual_risk_usd']:,.0f} ({risk_plan['position']['actual_risk_pct']:.2f}%)
-                **R:R (T2):** {risk_plan['validation']['rr_t2']:.1f}:1
-                """)
-            
-            if st.button("⚡ Execute Tactical Entry", key="tac_btn"):
-                # Open position
-                position_id = system['tactical_strategy'].open_position(
-                    entry_price=current_price,
-                    position_size_usd=risk_plan['position']['position_size_usd'],
-                    position_size_btc=risk_plan['position']['position_size_btc'],
-                    stop_loss_price=risk_plan['stop_loss']['price'],
-                    t1_target=risk_plan['targets']['t1_target'],
-                    t2_target=risk_plan['targets']['t2_target'],
-                    manifold_score=manifold_score,
-                    confidence=confidence,
-                    regime=regime
-                )
-                # Record in capital manager
-                system['capital_manager'].record_tactical_entry(
-                    risk_plan['position']['position_size_btc'],
-                    current_price,
-                    risk_plan['position']['position_size_usd']
-                )
-                st.success(f"✅ Tactical Position Opened: {position_id}")
-                st.rerun()
-            
-            # Auto-Alert (Tactical)
-            if telegram_enabled:
-                system['telegram'].send_tactical_entry(
-                    current_price, manifold_score, confidence,
-                    risk_plan['targets']['t1_target'],
-                    risk_plan['targets']['t2_target'],
-                    risk_plan['stop_loss']['price'],
-                    risk_plan['position']['position_size_usd'],
-                    risk_plan['position']['position_size_btc'],
-                    risk_plan['position']['actual_risk_usd'],
-                    risk_plan['position']['actual_risk_pct'],
-                    confidence,
-                    risk_plan['validation']['rr_t2']
-                )
-        else:
-            if len(system['tactical_strategy'].get_active_positions()) > 0:
-                st.warning("Position already active. Monitor for exits.")
-            else:
-                st.info("No tactical signal. Waiting for high-confidence entry...")
+        _render_live_signals(system, market, portfolio, ohlcv, telegram_enabled)
     
     with tab2:
-        st.markdown("### 📈 DCA Strategy (Long-term 2030)")
-        
-        dca_status = system['dca_strategy'].get_position_status(
-            current_price,
-            portfolio['dca']['btc_held'],
-            portfolio['dca']['avg_entry'],
-            portfolio['dca']['capital_used']
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Current Position")
-            st.info(f"""
-            **BTC Held:** {dca_status['current']['btc_held']:.4f}
-            **Avg Entry:** ${dca_status['current']['avg_entry']:,.0f}
-            **Current Price:** ${dca_status['current']['current_price']:,.0f}
-            **Unrealized P&L:** ${dca_status['current']['unrealized_pnl']:,.2f} ({dca_status['current']['unrealized_pct']:.1f}%)
-            """)
-        
-        with col2:
-            st.markdown("#### 2030 Projection")
-            st.success(f"""
-            **Target Year:** {dca_status['target_2030']['target_year']}
-            **Target Price:** ${dca_status['target_2030']['target_price_min']:,.0f} - ${dca_status['target_2030']['target_price_max']:,.0f}
-            **Projected Value:** ${dca_status['target_2030']['value_at_target_min']:,.0f} - ${dca_status['target_2030']['value_at_target_max']:,.0f}
-            **Projected Profit:** ${dca_status['target_2030']['profit_at_target_min']:,.0f} - ${dca_status['target_2030']['profit_at_target_max']:,.0f}
-            **Projected Return:** {dca_status['target_2030']['return_at_target_min']:.0f}% - {dca_status['target_2030']['return_at_target_max']:.0f}%
-            """)
-        
-        # Entry history
-        entry_history = system['dca_strategy'].get_entry_history()
-        if not entry_history.empty:
-            st.markdown("#### Entry History")
-            st.dataframe(entry_history[['timestamp', 'price', 'btc_amount', 'usd_amount', 'manifold_score', 'regime']])
+        _render_dca_tab(system, current_price, portfolio)
     
     with tab3:
-        st.markdown("### ⚡ Tactical Strategy (Active Trading)")
-        
-        active_positions = system['tactical_strategy'].get_active_positions()
-        
-        if active_positions:
-            for position in active_positions:
-                # Update position
-                update = system['tactical_strategy'].update_position(
-                    position['id'],
-                    current_price
-                )
-                
-                st.markdown(f"#### Position: {position['id']}")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.info(f"""
-                    **Entry:** ${position['entry_price']:,.0f}
-                    **Current:** ${current_price:,.0f}
-                    **Size:** {position['position_size_btc']:.4f} BTC
-                    **Unrealized P&L:** ${update['unrealized_pnl']:,.2f} ({update['unrealized_pct']:.1f}%)
-                    """)
-                
-                with col2:
-                    stop_status = "🟢 Trail Active" if update['trail_active'] else "🟡 Fixed Stop"
-                    st.warning(f"""
-                    **Stop Loss:** ${update['stop_loss']:,.0f} {stop_status}
-                    **T1 ({position['t1_pct']}%):** {'✅ HIT' if position['t1_hit'] else f"${position['t1_target']:,.0f}"}
-                    **T2 ({position['t2_pct']}%):** {'✅ HIT' if position['t2_hit'] else f"${position['t2_target']:,.0f}"}
-                    """)
-                
-                # Check for actions
-                if update['actions']:
-                    for action in update['actions']:
-                        st.error(f"⚠️ ACTION NEEDED: {action['type']} at ${action['price']:,.0f}")
-                        
-                        if action['type'] == 'T1_HIT':
-                            if st.button(f"Execute T1 Exit (50%)", key=f"t1_{position['id']}"):
-                                exit_result = system['tactical_strategy'].execute_exit(
-                                    position['id'], 'T1', action['price'], 50.0
-                                )
-                                system['capital_manager'].record_tactical_exit(
-                                    exit_result['btc_exited'],
-                                    action['price'],
-                                    'T1'
-                                )
-                                system['telegram'].send_t1_hit(
-                                    action['price'],
-                                    position['entry_price'],
-                                    exit_result['realized_pnl'],
-                                    exit_result['realized_pct']
-                                )
-                                st.success("✅ T1 Exit Executed!")
-                                st.rerun()
-                        
-                        elif action['type'] == 'T2_HIT':
-                            st.success("Trail stop activated automatically")
-                            system['telegram'].send_t2_hit(
-                                action['price'],
-                                position['entry_price'],
-                                update['unrealized_pnl'],
-                                update['unrealized_pct'],
-                                update['stop_loss']
-                            )
-                        
-                        elif action['type'] == 'STOP_HIT':
-                            if st.button(f"Execute Stop Exit (100%)", key=f"stop_{position['id']}"):
-                                exit_result = system['tactical_strategy'].execute_exit(
-                                    position['id'], 'STOP', action['price'], 100.0
-                                )
-                                system['capital_manager'].record_tactical_exit(
-                                    exit_result['btc_exited'],
-                                    action['price'],
-                                    'STOP'
-                                )
-                                system['telegram'].send_stop_hit(
-                                    action['price'],
-                                    position['entry_price'],
-                                    exit_result['realized_pnl'],
-                                    exit_result['realized_pct']
-                                )
-                                st.error("⛔ Stop Loss Hit")
-                                st.rerun()
-        else:
-            st.info("No active positions. Waiting for entry signal...")
-        
-        # Performance stats
-        perf = system['tactical_strategy'].get_performance_stats()
-        st.markdown("#### Performance Statistics")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Trades", perf['total_trades'])
-            st.metric("Win Rate", f"{perf['win_rate_pct']:.1f}%")
-        with col2:
-            st.metric("Wins", perf['wins'])
-            st.metric("Losses", perf['losses'])
-        with col3:
-            st.metric("Total P&L", f"${perf['total_pnl']:,.2f}")
-            st.metric("R:R Ratio", f"{perf['rr_ratio']:.2f}:1")
+        _render_tactical_tab(system, current_price)
     
     with tab4:
-        st.markdown("### 🎯 Risk Management")
+        _render_risk_tab(system, portfolio)
+    
+    with tab5:
+        _render_alerts_tab(system, telegram_enabled)
+
+
+
+def main():
+    """Main dashboard function."""
+    
+    # Initialize system
+    system = init_system()
+    
+    # Header
+    st.markdown('<div class="main-header">🧬 ELITE v20 - PRODUCTION</div>', unsafe_allow_html=True)
+    st.markdown("### Biological/Quant Hybrid System | Top 0.001%")
+    
+    # Sidebar
+    with st.sidebar:
+        st.image("https://via.placeholder.com/200x100/1e1e1e/00ff00?text=ELITE+v20", width=200)
         
-        st.markdown("#### Iron Rules (Top 0.001%)")
-        st.info("""
-        1. **Never Risk >5%** - Maximum risk per trade (IRON RULE)
-        2. **Ignore the Noise** - High signal-to-noise ratio
-        3. **Long Term Vision** - 2030 target ($600k-$1M BTC)
-        """)
+        st.markdown("### ⚙️ System Control")
         
-        col1, col2 = st.columns(2)
+        # Symbol selection
+        symbol = st.selectbox("Symbol", ["BTCUSDT"], index=0)
         
-        with col1:
-            st.markdown("#### Kelly Criterion")
-            kelly = system['risk_engine'].calculate_kelly_fraction()
-            st.success(f"""
-            **Win Rate:** {system['risk_engine'].win_rate*100:.1f}%
-            **R:R Ratio:** {system['risk_engine'].avg_win_loss_ratio:.1f}:1
-            **Kelly Fraction:** {kelly:.3f}
-            **Capped at:** {system['risk_engine'].kelly_cap}x (conservative)
-            """)
+        # Timeframe
+        timeframe = st.selectbox("Timeframe", ["1h", "4h", "1d"], index=0)
         
-        with col2:
-            st.markdown("#### Current Risk Exposure")
-            st.warning(f"""
-            **Max Risk per Trade:** ${portfolio['risk']['max_risk_per_trade_usd']:,.0f} ({portfolio['risk']['max_risk_per_trade_pct']:.1f}%)
-            **Total Capital:** ${portfolio['capital']['total_value']:,.2f}
-            **Available for Risk:** ${portfolio['capital']['total_value'] * 0.05:,.2f}
-            """)
-    
-    with tab5:
-        st.markdown("### 📱 Alerts & History")
+        # Data refresh
+        auto_refresh = st.checkbox("Auto Refresh", value=True)
+        if auto_refresh:
+            refresh_seconds = st.slider("Refresh (seconds)", 10, 300, 60)
         
-        col1, col2 = st.columns(2)
+        st.markdown("---")
         
-        with col1:
-            st.markdown("#### Telegram Alerts")
-            st.info(f"""
-            **Status:** {'✅ ENABLED' if telegram_enabled else '❌ DISABLED'}
-            **Bot Token:** {system['telegram'].bot_token[:20]}...
-            **Chat ID:** {system['telegram'].chat_id}
-            """)
-            
-            st.markdown("**Alert Types:**")
-            st.write("- 🩸 DCA Signals (Blood in Streets)")
-            st.write("- ⚡ Tactical Entries")
-            st.write("- 💰 T1/T2 Exits")
-            st.write("- ⛔ Stop Loss Warnings")
-            st.write("- 🔄 Regime Changes")
+        # Telegram status
+        st.markdown("### 📱 Telegram Status")
+        telegram_enabled = st.checkbox("Alerts Enabled", value=True)
+        if telegram_enabled:
+            system['telegram'].enable()
+            st.success("✅ LIVE")
+        else:
+            system['telegram'].disable()
+            st.warning("❌ Disabled")
         
-        with col2:
-            st.markdown("#### Transaction History")
-            tx_history = system['capital_manager'].get_transaction_history()
-            if not tx_history.empty:
-                st.dataframe(tx_history.tail(10))
-            else:
-                st.info("No transactions yet")
-    
-    # Auto-refresh
-    if auto_refresh:
-        import time
-        time.sleep(refresh_seconds)
-        st.rerun()
+        if st.button("Test Alert"):
+            system['telegram'].send_test_alert()
+            st.success("Alert sent!")
+        
+        st.markdown("---")
+        
+        # System info
+        st.markdown("### 📊 System Info")
+        st.info(f"""
+        **Architecture:** 6-Layer Biological/Quant
+        **Capital:** ${system['capital_manager'].current_capital:,.0f}
+        **Max Risk:** 5% per trade
+        **Strategies:** DCA (60%) + Tactical (40%)
+        """)
+    
+    # Live market region: on auto-refresh only this reruns, on a timer, so the
+    # sidebar stays mounted and the script thread is never parked in a sleep
+    run_every = refresh_seconds if auto_refresh else None
+    if hasattr(st, 'fragment'):
+        st.fragment(run_every=run_every)(_render_live_market)(system, symbol, timeframe, telegram_enabled)
+    else:
+        if auto_refresh and _HAS_AUTOREFRESH:
+            st_autorefresh(interval=refresh_seconds * 1000, key="market_refresh")
+        _render_live_market(system, symbol, timeframe, telegram_enabled)
+        if auto_refresh and not _HAS_AUTOREFRESH:
+            # Neither timer is available: fall back to the blocking full rerun
+            time.sleep(refresh_seconds)
+            st.rerun()
 
 
 if __name__ == "__main__":
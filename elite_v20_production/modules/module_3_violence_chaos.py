@@ -16,6 +16,52 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numba
+    _njit = numba.jit(nopython=True, fastmath=True, cache=True)
+except ImportError:
+    def _njit(fn):
+        """numba not installed: the kernel runs as plain Python"""
+        return fn
+
+@_njit
+def _numba_calculate_true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    n = len(close)
+    tr = np.zeros(n)
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i-1])
+        lc = abs(low[i] - close[i-1])
+        tr[i] = max(hl, hc, lc)
+    return tr
+
+@_njit
+def _numba_calculate_violence_components(tr: np.ndarray, close: np.ndarray, lookback: int) -> tuple:
+    """(ATR/price %, std of the last 20 returns %, clustering flag) in one pass.
+
+    Matches the pandas formulation: sample std (ddof=1) over the last 20
+    pct-changes, and clustering only once 2 x lookback bars are available.
+    """
+    n = len(close)
+
+    atr = np.mean(tr[-14:])
+    price = close[-1]
+    atr_ratio = (atr / price) * 100 if price > 0 else 0.0
+
+    m = min(20, n - 1)
+    volatility = 0.0
+    if m > 1:
+        returns = np.empty(m)
+        for i in range(m):
+            idx = n - m + i
+            returns[i] = close[idx] / close[idx - 1] - 1.0
+        volatility = np.std(returns) * np.sqrt(m / (m - 1)) * 100
+
+    vol_clustering = n >= lookback * 2 and np.mean(tr[-5:]) > np.mean(tr[-lookback:]) * 1.5
+
+    return atr_ratio, volatility, vol_clustering
+
 
 class Regime(Enum):
     """Market regimes"""
@@ -48,6 +94,18 @@ class ViolenceChaosDetector:
     def __init__(self, lookback: int = 20):
         self.lookback = lookback
         print("✅ Violence & Chaos detector initialized")
+
+    @staticmethod
+    def _hlc(df: pd.DataFrame) -> tuple:
+        """Contiguous float64 high/low/close columns for the numba kernels (no copy if already so)"""
+        return tuple(np.ascontiguousarray(df[c].to_numpy(), dtype=np.float64)
+                     for c in ('high', 'low', 'close'))
+
+    def _components(self, df: pd.DataFrame) -> tuple:
+        """(atr_ratio, volatility, is_clustered) from a single true-range pass"""
+        high, low, close = self._hlc(df)
+        tr = _numba_calculate_true_range(high, low, close)
+        return _numba_calculate_violence_components(tr, close, self.lookback)
     
     def calculate_true_range(self, df: pd.DataFrame) -> pd.Series:
         """
@@ -55,15 +113,12 @@ class ViolenceChaosDetector:
         
         TR = max(high - low, |high - prev_close|, |low - prev_close|)
         """
-        if df.empty or 'high' not in df.columns:
+        if df.empty or 'high' not in df.columns or 'low' not in df.columns or 'close' not in df.columns:
             return pd.Series(dtype=float)
         
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        return tr
+        # Use numba for fast execution
+        tr_array = _numba_calculate_true_range(*self._hlc(df))
+        return pd.Series(tr_array, index=df.index)
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> float:
         """Average True Range"""
@@ -99,20 +154,15 @@ class ViolenceChaosDetector:
         - Volatility clustering
         - Recent price swings
         """
-        if df.empty or len(df) < 20:
+        if df.empty or len(df) < 20 or 'high' not in df.columns or 'low' not in df.columns or 'close' not in df.columns:
             return 50.0
-        
-        # ATR ratio
-        atr = self.calculate_atr(df)
-        price = df['close'].iloc[-1]
-        atr_ratio = (atr / price) * 100 if price > 0 else 0
-        
-        # Recent swings (std of returns)
-        returns = df['close'].pct_change().tail(20)
-        volatility = returns.std() * 100
-        
+
+        atr_ratio, volatility, is_clustered = self._components(df)
+        return self._violence_score(atr_ratio, volatility, is_clustered)
+
+    @staticmethod
+    def _violence_score(atr_ratio: float, volatility: float, is_clustered: bool) -> float:
         # Clustering bonus
-        is_clustered = self.detect_volatility_clustering(df)
         clustering_bonus = 20 if is_clustered else 0
         
         # Combine (normalize to 0-100)
@@ -161,14 +211,18 @@ class ViolenceChaosDetector:
                 confidence=0.5
             )
         
-        # Calculate metrics
-        violence_score = self.calculate_violence_score(df)
+        # Calculate metrics (one kernel pass feeds score, clustering and volatility)
+        if len(df) < 20 or not {'high', 'low', 'close'} <= set(df.columns):
+            violence_score = self.calculate_violence_score(df)
+            is_clustered = False
+            returns = df['close'].pct_change().tail(20)
+            volatility = returns.std() * np.sqrt(365) * 100 if len(returns) > 1 else 0.0
+        else:
+            atr_ratio, return_std, is_clustered = self._components(df)
+            violence_score = self._violence_score(atr_ratio, return_std, is_clustered)
+            # Volatility (annualized)
+            volatility = return_std * np.sqrt(365)
         regime = self.classify_regime(violence_score, fear_greed)
-        is_clustered = self.detect_volatility_clustering(df)
-        
-        # Volatility (annualized)
-        returns = df['close'].pct_change().tail(20)
-        volatility = returns.std() * np.sqrt(365) * 100 if len(returns) > 1 else 0.0
         
         # Confidence (based on data quality)
         confidence = min(1.0, len(df) / 100)
@@ -11,6 +11,51 @@ from datetime import datetime
 from typing import Dict, Optional
 import pandas as pd
 
+try:
+    from strategies.regimes import REGIME_IDS, REGIME_BLOOD_IN_STREETS
+except ImportError:
+    from regimes import REGIME_IDS, REGIME_BLOOD_IN_STREETS
+
+try:
+    import numba
+    _njit = numba.jit(nopython=True, cache=True)
+except ImportError:
+    def _njit(fn):
+        """numba not installed: the kernel runs as plain Python"""
+        return fn
+
+
+# Entry conditions, in bit order of the _numba_dca_signal flags
+DCA_CONDITIONS = ('manifold_high', 'blood_in_streets', 'whales_accumulating',
+                  'extreme_fear', 'below_sma200', 'cooldown_passed')
+
+
+@_njit
+def _numba_dca_signal(manifold_score, regime_id, diffusion_score, fear_greed,
+                      current_price, sma200, cooldown_passed,
+                      min_manifold_score, min_diffusion_score, max_fear_greed):
+    """Returns (strong signal, signal strength, condition bit flags)"""
+    flags = 0
+    if manifold_score >= min_manifold_score:
+        flags |= 1
+    if regime_id == REGIME_BLOOD_IN_STREETS:
+        flags |= 2
+    if diffusion_score >= min_diffusion_score:
+        flags |= 4
+    if fear_greed <= max_fear_greed:
+        flags |= 8
+    if current_price < sma200:
+        flags |= 16
+    if cooldown_passed:
+        flags |= 32
+    
+    met = 0
+    for i in range(6):
+        met += (flags >> i) & 1
+    
+    # Strong signal if 5/6 conditions met
+    return met >= 5, met / 6.0, flags
+
 
 class DCAStrategy:
     """
@@ -81,25 +126,15 @@ class DCAStrategy:
         Returns:
             Dict with signal status and details
         """
-        conditions = {
-            'manifold_high': manifold_score >= self.min_manifold_score,
-            'blood_in_streets': regime == 'BLOOD_IN_STREETS',
-            'whales_accumulating': diffusion_score >= self.min_diffusion_score,
-            'extreme_fear': fear_greed <= self.max_fear_greed,
-            'below_sma200': current_price < sma200,
-            'cooldown_passed': self._check_cooldown()
-        }
-        
-        # Count met conditions
+        strong_signal, signal_strength, flags = _numba_dca_signal(
+            float(manifold_score), REGIME_IDS.get(regime, 0), float(diffusion_score),
+            float(fear_greed), float(current_price), float(sma200), self._check_cooldown(),
+            self.min_manifold_score, self.min_diffusion_score, float(self.max_fear_greed)
+        )
+        conditions = {name: bool(flags >> i & 1) for i, name in enumerate(DCA_CONDITIONS)}
         met_conditions = sum(conditions.values())
         total_conditions = len(conditions)
         
-        # Signal strength
-        signal_strength = met_conditions / total_conditions
-        
-        # Strong signal if 5/6 conditions met
-        strong_signal = met_conditions >= 5
-        
         return {
             'signal': strong_signal,
             'signal_strength': signal_strength,
@@ -0,0 +1,29 @@
+"""
+Elite v20 - Market Regimes
+One id per chaos-layer regime label, shared by the strategy JIT kernels
+and the dashboard.
+"""
+
+from enum import IntEnum
+
+
+class Regime(IntEnum):
+    """Market regime, parsed once from the chaos layer's label.
+
+    .name is the label handed to strategies, history and alerts.
+    """
+    NORMAL = 0
+    BLOOD_IN_STREETS = 1
+    CHAOS = 2
+    CALM = 3
+    VOLATILE = 4
+
+    @classmethod
+    def parse(cls, label) -> 'Regime':
+        return cls.__members__.get(label, cls.NORMAL)
+
+
+# Regime strings are mapped to ints before entering the JIT kernels
+REGIME_IDS = {regime.name: int(regime) for regime in Regime}
+REGIME_BLOOD_IN_STREETS = int(Regime.BLOOD_IN_STREETS)
+REGIME_CHAOS = int(Regime.CHAOS)
@@ -11,6 +11,45 @@ from datetime import datetime
 from typing import Dict, Optional, Tuple
 import pandas as pd
 
+try:
+    from strategies.regimes import REGIME_IDS, REGIME_BLOOD_IN_STREETS, REGIME_CHAOS
+except ImportError:
+    from regimes import REGIME_IDS, REGIME_BLOOD_IN_STREETS, REGIME_CHAOS
+
+try:
+    import numba
+    _njit = numba.jit(nopython=True, cache=True)
+except ImportError:
+    def _njit(fn):
+        """numba not installed: the kernel runs as plain Python"""
+        return fn
+
+
+# Entry conditions, in bit order of the _numba_tactical_signal flags
+TACTICAL_CONDITIONS = ('manifold_high', 'confidence_high', 'regime_suitable', 'no_conflict')
+
+
+@_njit
+def _numba_tactical_signal(manifold_score, confidence, regime_id, phase_transition, open_positions,
+                           min_manifold_score, min_confidence):
+    """Returns (strong signal, signal strength, condition bit flags)"""
+    flags = 0
+    if manifold_score >= min_manifold_score:
+        flags |= 1
+    if confidence >= min_confidence:
+        flags |= 2
+    if regime_id == REGIME_BLOOD_IN_STREETS or regime_id == REGIME_CHAOS or phase_transition:
+        flags |= 4
+    if open_positions == 0:  # Only one position at a time
+        flags |= 8
+    
+    met = 0
+    for i in range(4):
+        met += (flags >> i) & 1
+    
+    # Strong signal if all conditions met
+    return met == 4, met / 4.0, flags
+
 
 class TacticalStrategy:
     """
@@ -82,19 +121,12 @@ class TacticalStrategy:
             Dict with signal status and details
         """
         # Check conditions
-        conditions = {
-            'manifold_high': manifold_score >= self.min_manifold_score,
-            'confidence_high': confidence >= self.min_confidence,
-            'regime_suitable': regime in ['BLOOD_IN_STREETS', 'CHAOS'] or phase_transition,
-            'no_conflict': len(self.positions) == 0  # Only one position at a time
-        }
-        
-        # Signal strength
-        met_conditions = sum(conditions.values())
-        signal_strength = met_conditions / len(conditions)
-        
-        # Strong signal if all conditions met
-        strong_signal = all(conditions.values())
+        strong_signal, signal_strength, flags = _numba_tactical_signal(
+            float(manifold_score), float(confidence), REGIME_IDS.get(regime, 0),
+            bool(phase_transition), len(self.positions),
+            self.min_manifold_score, self.min_confidence
+        )
+        conditions = {name: bool(flags >> i & 1) for i, name in enumerate(TACTICAL_CONDITIONS)}
         
         return {
             'signal': strong_signal,
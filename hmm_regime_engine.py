@@ -7,10 +7,48 @@ Replaces binary IF/ELSE logic with stochastic state transitions.
 Inspired by Leonard Baum's work at Renaissance Technologies.
 """
 
+import numba
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _numba_forward(pi: np.ndarray, A: np.ndarray, B: np.ndarray, obs: np.ndarray) -> np.ndarray:
+    T, n = obs.shape[0], pi.shape[0]
+    alpha = np.zeros((T, n))
+    for j in range(n):
+        alpha[0, j] = pi[j] * B[j, obs[0]]
+    for t in range(1, T):
+        total = 0.0
+        for j in range(n):
+            acc = 0.0
+            for i in range(n):
+                acc += alpha[t-1, i] * A[i, j]
+            alpha[t, j] = acc * B[j, obs[t]]
+            total += alpha[t, j]
+        for j in range(n):
+            alpha[t, j] /= total
+    return alpha
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _numba_backward(A: np.ndarray, B: np.ndarray, obs: np.ndarray) -> np.ndarray:
+    T, n = obs.shape[0], A.shape[0]
+    beta = np.zeros((T, n))
+    beta[T-1, :] = 1.0
+    for t in range(T-2, -1, -1):
+        total = 0.0
+        for i in range(n):
+            acc = 0.0
+            for j in range(n):
+                acc += A[i, j] * B[j, obs[t+1]] * beta[t+1, j]
+            beta[t, i] = acc
+            total += acc
+        for i in range(n):
+            beta[t, i] /= total
+    return beta
+
 class HMMEngine:
     """
     Implements a discrete Hidden Markov Model with Baum-Welch estimation.
@@ -34,29 +72,17 @@ class HMMEngine:
     def _normalize(self, x):
         return x / np.sum(x)
 
+    def _obs(self, observations: np.ndarray) -> np.ndarray:
+        """Contiguous int64 bin indices; negatives wrap like Python indexing into B"""
+        return np.ascontiguousarray(observations, dtype=np.int64) % self.B.shape[1]
+
     def forward(self, observations: np.ndarray) -> np.ndarray:
         """Forward algorithm to calculate alpha"""
-        T = len(observations)
-        alpha = np.zeros((T, self.n_states))
-        alpha[0] = self.pi * self.B[:, observations[0]]
-        
-        for t in range(1, T):
-            for j in range(self.n_states):
-                alpha[t, j] = np.dot(alpha[t-1], self.A[:, j]) * self.B[j, observations[t]]
-            alpha[t] = self._normalize(alpha[t])
-        return alpha
+        return _numba_forward(self.pi, self.A, self.B, self._obs(observations))
 
     def backward(self, observations: np.ndarray) -> np.ndarray:
         """Backward algorithm to calculate beta"""
-        T = len(observations)
-        beta = np.zeros((T, self.n_states))
-        beta[T-1] = 1.0
-        
-        for t in range(T-2, -1, -1):
-            for i in range(self.n_states):
-                beta[t, i] = np.sum(self.A[i, :] * self.B[:, observations[t+1]] * beta[t+1])
-            beta[t] = self._normalize(beta[t])
-        return beta
+        return _numba_backward(self.A, self.B, self._obs(observations))
 
     def estimate_states(self, observations: np.ndarray) -> List[int]:
         """Viterbi or Posterior decoding to find the most likely regime path"""
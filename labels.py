@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏷️ SIGNAL LABELS
+Shared bin tables for the text labels shown on dashboards and in alerts
+
+A value v gets LABELS[searchsorted(BINS, v, side='right')]. Upper edges that
+are inclusive (<= 0.35, <= 60) are nudged up one ulp with np.nextafter.
+"""
+
+import numpy as np
+
+FG_BINS = np.array([20, 40, 60, 80])
+FG_LABELS = ("Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed")
+
+CONF_BINS = np.array([0.15, np.nextafter(0.35, np.inf)])
+CONF_LABELS = ('LOW', 'MEDIUM', 'HIGH')
+
+DIV_BINS = np.array([40, np.nextafter(60, np.inf)])
+DIV_LABELS = ("BEARISH", "NEUTRAL", "BULLISH")
+
+
+def classify(values, bins, labels):
+    """Label for a scalar, or an array of labels for a batch (e.g. one per symbol)."""
+    idx = np.searchsorted(bins, values, side='right')
+    if np.ndim(idx) == 0:
+        return labels[int(idx)]
+    return np.asarray(labels)[idx]
+
+
+def classify_fg(value) -> str:
+    """Fear & Greed (0-100) -> "Extreme Fear" ... "Extreme Greed"."""
+    return FG_LABELS[int(np.searchsorted(FG_BINS, value, side='right'))]
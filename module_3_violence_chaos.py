@@ -15,9 +15,16 @@ import pandas as pd
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 from enum import Enum
-import numba
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+try:
+    import numba
+    _njit = numba.jit(nopython=True, fastmath=True, cache=True)
+except ImportError:
+    def _njit(fn):
+        """numba not installed: the kernel runs as plain Python"""
+        return fn
+
+@_njit
 def _numba_calculate_true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
     n = len(close)
     tr = np.zeros(n)
@@ -29,28 +36,30 @@ def _numba_calculate_true_range(high: np.ndarray, low: np.ndarray, close: np.nda
         tr[i] = max(hl, hc, lc)
     return tr
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@_njit
 def _numba_calculate_violence_components(tr: np.ndarray, close: np.ndarray, lookback: int) -> tuple:
-    n = len(close)
-    if n < 20:
-        return 0.0, 0.0, False
-
-    recent_tr_mean = np.mean(tr[-5:])
-    long_term_tr_mean = np.mean(tr[-lookback:])
-    vol_clustering = recent_tr_mean > long_term_tr_mean * 1.5
+    """(ATR/price %, std of the last 20 returns %, clustering flag) in one pass.
 
-    returns = np.zeros(20)
-    for i in range(20):
-        idx = n - 20 + i
-        # Prevent wrapping around to the end of the array if idx == 0
-        if idx > 0 and close[idx-1] > 0:
-            returns[i] = (close[idx] - close[idx-1]) / close[idx-1]
+    Matches the pandas formulation: sample std (ddof=1) over the last 20
+    pct-changes, and clustering only once 2 x lookback bars are available.
+    """
+    n = len(close)
 
-    volatility = np.std(returns) * 100
     atr = np.mean(tr[-14:])
     price = close[-1]
     atr_ratio = (atr / price) * 100 if price > 0 else 0.0
 
+    m = min(20, n - 1)
+    volatility = 0.0
+    if m > 1:
+        returns = np.empty(m)
+        for i in range(m):
+            idx = n - m + i
+            returns[i] = close[idx] / close[idx - 1] - 1.0
+        volatility = np.std(returns) * np.sqrt(m / (m - 1)) * 100
+
+    vol_clustering = n >= lookback * 2 and np.mean(tr[-5:]) > np.mean(tr[-lookback:]) * 1.5
+
     return atr_ratio, volatility, vol_clustering
 
 
@@ -85,6 +94,18 @@ class ViolenceChaosDetector:
     def __init__(self, lookback: int = 20):
         self.lookback = lookback
         print("✅ Violence & Chaos detector initialized")
+
+    @staticmethod
+    def _hlc(df: pd.DataFrame) -> tuple:
+        """Contiguous float64 high/low/close columns for the numba kernels (no copy if already so)"""
+        return tuple(np.ascontiguousarray(df[c].to_numpy(), dtype=np.float64)
+                     for c in ('high', 'low', 'close'))
+
+    def _components(self, df: pd.DataFrame) -> tuple:
+        """(atr_ratio, volatility, is_clustered) from a single true-range pass"""
+        high, low, close = self._hlc(df)
+        tr = _numba_calculate_true_range(high, low, close)
+        return _numba_calculate_violence_components(tr, close, self.lookback)
     
     def calculate_true_range(self, df: pd.DataFrame) -> pd.Series:
         """
@@ -96,11 +117,7 @@ class ViolenceChaosDetector:
             return pd.Series(dtype=float)
         
         # Use numba for fast execution
-        tr_array = _numba_calculate_true_range(
-            df['high'].values.astype(np.float64),
-            df['low'].values.astype(np.float64),
-            df['close'].values.astype(np.float64)
-        )
+        tr_array = _numba_calculate_true_range(*self._hlc(df))
         return pd.Series(tr_array, index=df.index)
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> float:
@@ -140,19 +157,11 @@ class ViolenceChaosDetector:
         if df.empty or len(df) < 20 or 'high' not in df.columns or 'low' not in df.columns or 'close' not in df.columns:
             return 50.0
 
-        # Use numba components to speed up
-        tr_array = _numba_calculate_true_range(
-            df['high'].values.astype(np.float64),
-            df['low'].values.astype(np.float64),
-            df['close'].values.astype(np.float64)
-        )
-        
-        atr_ratio, volatility, is_clustered = _numba_calculate_violence_components(
-            tr_array,
-            df['close'].values.astype(np.float64),
-            self.lookback
-        )
-        
+        atr_ratio, volatility, is_clustered = self._components(df)
+        return self._violence_score(atr_ratio, volatility, is_clustered)
+
+    @staticmethod
+    def _violence_score(atr_ratio: float, volatility: float, is_clustered: bool) -> float:
         # Clustering bonus
         clustering_bonus = 20 if is_clustered else 0
         
@@ -202,14 +211,18 @@ class ViolenceChaosDetector:
                 confidence=0.5
             )
         
-        # Calculate metrics
-        violence_score = self.calculate_violence_score(df)
+        # Calculate metrics (one kernel pass feeds score, clustering and volatility)
+        if len(df) < 20 or not {'high', 'low', 'close'} <= set(df.columns):
+            violence_score = self.calculate_violence_score(df)
+            is_clustered = False
+            returns = df['close'].pct_change().tail(20)
+            volatility = returns.std() * np.sqrt(365) * 100 if len(returns) > 1 else 0.0
+        else:
+            atr_ratio, return_std, is_clustered = self._components(df)
+            violence_score = self._violence_score(atr_ratio, return_std, is_clustered)
+            # Volatility (annualized)
+            volatility = return_std * np.sqrt(365)
         regime = self.classify_regime(violence_score, fear_greed)
-        is_clustered = self.detect_volatility_clustering(df)
-        
-        # Volatility (annualized)
-        returns = df['close'].pct_change().tail(20)
-        volatility = returns.std() * np.sqrt(365) * 100 if len(returns) > 1 else 0.0
         
         # Confidence (based on data quality)
         confidence = min(1.0, len(df) / 100)
@@ -39,6 +39,7 @@ import os
 import requests
 import json
 import sqlite3
+import threading
 import importlib.util
 from datetime import datetime, timezone
 
@@ -168,8 +169,27 @@ def load_engine():
 # SCOREBOARD (SQLite)
 # ============================================================
 
-def sb_init(db_path: str = DB_PATH):
-    conn = sqlite3.connect(db_path)
+@st.cache_resource
+def get_scoreboard_conn(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    One autocommit connection per DB for the server's lifetime (schema created once).
+    WAL + synchronous=NORMAL: a logged prediction is an append, not an fsync'd journal rewrite.
+    busy_timeout waits out another server process holding the write lock.
+    Shared across sessions, so every use goes through _scoreboard_lock().
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    sb_init(conn)
+    return conn
+
+@st.cache_resource
+def _scoreboard_lock() -> threading.Lock:
+    return threading.Lock()
+
+def sb_init(conn: sqlite3.Connection):
     cur = conn.cursor()
     cur.execute("""
     CREATE TABLE IF NOT EXISTS predictions (
@@ -194,47 +214,41 @@ def sb_init(db_path: str = DB_PATH):
     )
     """)
     cur.execute("CREATE INDEX IF NOT EXISTS idx_pred_lookup ON predictions(symbol, interval, ts_utc, horizon)")
-    conn.commit()
-    conn.close()
 
 def sb_log_prediction(payload: dict, db_path: str = DB_PATH):
     """
     payload keys: ts_utc, symbol, interval, horizon, close, p_up, ev, action, policy_state, qc_codes(list/str), drift_flag(bool/int), meta(dict)
     """
-    sb_init(db_path)
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
     qc_codes = payload.get("qc_codes", [])
     if isinstance(qc_codes, (list, tuple)):
         qc_codes = ",".join([str(x) for x in qc_codes])
     meta = payload.get("meta", {})
-    cur.execute("""
-        INSERT INTO predictions
-        (ts_utc, symbol, interval, horizon, close, p_up, ev, action, policy_state, qc_codes, drift_flag, meta, resolved)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-    """, (
-        payload.get("ts_utc"),
-        payload.get("symbol"),
-        payload.get("interval"),
-        int(payload.get("horizon", 0)),
-        safe_float(payload.get("close")),
-        safe_float(payload.get("p_up")),
-        safe_float(payload.get("ev")),
-        str(payload.get("action") or ""),
-        str(payload.get("policy_state") or ""),
-        str(qc_codes or ""),
-        int(bool(payload.get("drift_flag", 0))),
-        json.dumps(meta, ensure_ascii=False),
-    ))
-    conn.commit()
-    conn.close()
+    conn = get_scoreboard_conn(db_path)
+    with _scoreboard_lock():
+        conn.execute("""
+            INSERT INTO predictions
+            (ts_utc, symbol, interval, horizon, close, p_up, ev, action, policy_state, qc_codes, drift_flag, meta, resolved)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        """, (
+            payload.get("ts_utc"),
+            payload.get("symbol"),
+            payload.get("interval"),
+            int(payload.get("horizon", 0)),
+            safe_float(payload.get("close")),
+            safe_float(payload.get("p_up")),
+            safe_float(payload.get("ev")),
+            str(payload.get("action") or ""),
+            str(payload.get("policy_state") or ""),
+            str(qc_codes or ""),
+            int(bool(payload.get("drift_flag", 0))),
+            json.dumps(meta, ensure_ascii=False),
+        ))
 
 def sb_resolve_outcomes(df: pd.DataFrame, symbol: str, interval: str, horizon: int, db_path: str = DB_PATH):
     """
     Resolve any unresolved rows where we now have forward close for (ts + horizon bars).
     Assumes df indexed by UTC timestamps (or convertible).
     """
-    sb_init(db_path)
     if df is None or df.empty:
         return 0
     # Ensure datetime index
@@ -249,52 +263,57 @@ def sb_resolve_outcomes(df: pd.DataFrame, symbol: str, interval: str, horizon: i
     close_series = dfi["close"].astype(float)
     idx = close_series.index
 
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT id, ts_utc, close
-        FROM predictions
-        WHERE symbol=? AND interval=? AND horizon=? AND resolved=0
-        ORDER BY id ASC
-        LIMIT 5000
-    """, (symbol, interval, int(horizon)))
-    rows = cur.fetchall()
-    resolved = 0
-
-    # Build lookup: for each ts, find index position and forward position
-    for rid, ts_utc, close0 in rows:
-        try:
-            t0 = pd.to_datetime(ts_utc.replace(" UTC",""), utc=True)
-            # find nearest exact match (we log ts as candle close time)
-            if t0 not in idx:
-                # try nearest (tolerance)
-                pos = idx.get_indexer([t0], method="nearest")[0]
-            else:
-                pos = idx.get_loc(t0)
-            fpos = pos + int(horizon)
-            if fpos >= len(idx):
+    conn = get_scoreboard_conn(db_path)
+    with _scoreboard_lock():
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT id, ts_utc, close
+            FROM predictions
+            WHERE symbol=? AND interval=? AND horizon=? AND resolved=0
+            ORDER BY id ASC
+            LIMIT 5000
+        """, (symbol, interval, int(horizon)))
+        rows = cur.fetchall()
+        resolved = 0
+
+        # All updates in one transaction (the connection is in autocommit mode)
+        cur.execute("BEGIN")
+        # Build lookup: for each ts, find index position and forward position
+        for rid, ts_utc, close0 in rows:
+            try:
+                t0 = pd.to_datetime(ts_utc.replace(" UTC",""), utc=True)
+                # find nearest exact match (we log ts as candle close time)
+                if t0 not in idx:
+                    # try nearest (tolerance)
+                    pos = idx.get_indexer([t0], method="nearest")[0]
+                else:
+                    pos = idx.get_loc(t0)
+                fpos = pos + int(horizon)
+                if fpos >= len(idx):
+                    continue
+                t1 = idx[fpos]
+                close1 = float(close_series.iloc[fpos])
+                close0 = float(close0) if close0 is not None else float(close_series.iloc[pos])
+                ret = (close1 / close0) - 1.0
+                y = 1 if ret > 0 else 0
+                cur.execute("""
+                    UPDATE predictions
+                    SET outcome_ts_utc=?, close_fwd=?, ret_fwd=?, y_actual=?, resolved=1
+                    WHERE id=?
+                """, (t1.strftime("%Y-%m-%d %H:%M:%S UTC"), close1, ret, y, rid))
+                resolved += 1
+            except Exception:
                 continue
-            t1 = idx[fpos]
-            close1 = float(close_series.iloc[fpos])
-            close0 = float(close0) if close0 is not None else float(close_series.iloc[pos])
-            ret = (close1 / close0) - 1.0
-            y = 1 if ret > 0 else 0
-            cur.execute("""
-                UPDATE predictions
-                SET outcome_ts_utc=?, close_fwd=?, ret_fwd=?, y_actual=?, resolved=1
-                WHERE id=?
-            """, (t1.strftime("%Y-%m-%d %H:%M:%S UTC"), close1, ret, y, rid))
-            resolved += 1
-        except Exception:
-            continue
 
-    conn.commit()
-    conn.close()
+        try:
+            cur.execute("COMMIT")
+        except Exception:
+            # Never leave the shared connection inside an open transaction
+            conn.execute("ROLLBACK")
+            raise
     return resolved
 
 def sb_fetch_resolved(symbol: str, interval: str, horizon: int, limit: int = 2000, db_path: str = DB_PATH) -> pd.DataFrame:
-    sb_init(db_path)
-    conn = sqlite3.connect(db_path)
     q = """
         SELECT ts_utc, close, p_up, ev, action, policy_state, qc_codes, drift_flag,
                outcome_ts_utc, close_fwd, ret_fwd, y_actual
@@ -303,8 +322,9 @@ def sb_fetch_resolved(symbol: str, interval: str, horizon: int, limit: int = 200
         ORDER BY id DESC
         LIMIT ?
     """
-    df = pd.read_sql_query(q, conn, params=(symbol, interval, int(horizon), int(limit)))
-    conn.close()
+    conn = get_scoreboard_conn(db_path)
+    with _scoreboard_lock():
+        df = pd.read_sql_query(q, conn, params=(symbol, interval, int(horizon), int(limit)))
     if not df.empty:
         df["ts_utc"] = pd.to_datetime(df["ts_utc"].str.replace(" UTC",""), utc=True, errors="coerce")
         df = df.sort_values("ts_utc")
@@ -27,6 +27,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import requests
+import traceback
+import plotly.graph_objects as go
 from datetime import datetime, timezone
 
 # Audit logging imports
@@ -260,7 +262,6 @@ tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
 # Tab 1: Chart
 with tab1:
     st.subheader("Price Chart")
-    import plotly.graph_objects as go
     fig = go.Figure(data=[
         go.Candlestick(
             x=df.index,
@@ -392,7 +393,6 @@ with tab4:
                 
         except Exception as e:
             st.error(f"Projection failed: {e}")
-            import traceback
             st.code(traceback.format_exc())
 
 # Tab 5: Raw Data
@@ -469,7 +469,6 @@ with tab6:
             st.error("❌ Decision Interpreter not found. Make sure decision_interpreter.py is in the same directory.")
         except Exception as e:
             st.error(f"Decision Guide failed: {e}")
-            import traceback
             with st.expander("Debug"):
                 st.code(traceback.format_exc())
 